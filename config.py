@@ -117,6 +117,9 @@ WEEKLY_SHEET_NAMES = ["週間管理", "週間計画", "週刊計画", "週刊管
 MONTHLY_SHEET_NAME = "月間管理"
 MONTHPLAN_SHEET_NAME = "今月プラン"
 
+# Monthly sheet data rows (A..R, below the header row)
+MONTHLY_DATA_RANGE = "A2:R"
+
 # Monthplan week columns (1-indexed week -> column letter for hours)
 MONTHPLAN_WEEK_COLUMNS = {1: "D", 2: "E", 3: "F", 4: "G", 5: "H"}
 
@@ -3,13 +3,25 @@ Pytest configuration and fixtures for MCP server tests.
 
 Updated for direct Google Sheets API architecture (no GAS WebApp).
 """
+import json
 import os
+from contextlib import contextmanager
 import pytest
-from typing import Any
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, NamedTuple
 from unittest.mock import MagicMock, patch
 
-# Set test environment variables before importing anything
-os.environ.setdefault("GOOGLE_CREDENTIALS_JSON", '{"type": "service_account", "project_id": "test"}')
+
+@pytest.fixture(scope="session", autouse=True)
+def _default_google_credentials():
+    """Provide dummy credentials for the session and restore the env afterwards."""
+    key = "GOOGLE_CREDENTIALS_JSON"
+    prev = os.environ.get(key)
+    os.environ.setdefault(key, '{"type": "service_account", "project_id": "test"}')
+    yield
+    if prev is None:
+        os.environ.pop(key, None)
 
 
 # ========== Response Assertion Helpers ==========
@@ -59,6 +71,78 @@ def assertions():
     return ResponseAssertions()
 
 
+@pytest.fixture(autouse=True)
+def clear_preview_cache(monkeypatch):
+    """Give every test empty preview caches.
+
+    Handler classes hold their PreviewCache as a ClassVar; swapping it for None
+    (restored on teardown) resets it in O(1) instead of clearing entries.
+    """
+    from core.base_handler import BaseHandler
+    from handlers.books import BooksHandler
+    from handlers.students import StudentsHandler
+
+    for cls in (BaseHandler, BooksHandler, StudentsHandler):
+        monkeypatch.setattr(cls, "_preview_cache", None)
+
+
+
+@pytest.fixture(autouse=True)
+def clear_planner_caches(monkeypatch):
+    """Give every test empty PlannerHandler lookup caches (class-level)."""
+    from handlers.planner import PlannerHandler
+
+    monkeypatch.setattr(PlannerHandler, "_planner_ids", None)
+    monkeypatch.setattr(PlannerHandler, "_weekly_sheet_names", {})
+
+@pytest.fixture
+def env_vars(monkeypatch):
+    """Set several environment variables at once and refresh env_loader caches.
+
+    Usage:
+        def test_x(env_vars):
+            env_vars(MCP_HMAC_REQUIRED="true", MCP_HMAC_SECRET="s")
+    """
+    from env_loader import clear_env_cache
+
+    setenv = monkeypatch.setenv
+
+    def _set(**overrides: str) -> None:
+        for key, value in overrides.items():
+            setenv(key, value)
+        clear_env_cache()
+
+    yield _set
+    clear_env_cache()
+
+
+@pytest.fixture
+def mock_hmac_secret(env_vars):
+    """Enable HMAC with a known test secret."""
+    env_vars(MCP_HMAC_SECRET="test-secret-key", MCP_HMAC_REQUIRED="true")
+    return "test-secret-key"
+
+
+@pytest.fixture(scope="session")
+def shared_sheets_client():
+    """Single spec'd SheetsClient mock shared by the whole session."""
+    from sheets_client import SheetsClient
+    return MagicMock(spec=SheetsClient)
+
+
+@pytest.fixture(autouse=True)
+def _install_shared_sheets_client(shared_sheets_client, monkeypatch):
+    """Install the shared mock as the get_sheets_client() singleton.
+
+    Tests that do not patch get_sheets_client never build a real gspread
+    client (credential parsing + HTTP session); the mock is reset per test.
+    """
+    import sheets_client
+
+    shared_sheets_client.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(sheets_client, "_sheets_client", shared_sheets_client)
+
+
 @pytest.fixture
 def mock_sheets_client():
     """
@@ -115,190 +199,133 @@ def sample_planner_data():
     }
 
 
-@pytest.fixture
+# ========== Handler Response Templates ==========
+
+# Loaded once at import; exposed read-only via the session-scoped fixture below.
+_HANDLER_RESPONSES_PATH = Path(__file__).parent / "tests" / "fixtures" / "handler_responses.json"
+_HANDLER_RESPONSES_BYTES = _HANDLER_RESPONSES_PATH.read_bytes()
+
+
+class PlannerItem(NamedTuple):
+    """planner.ids_list item; stored positionally in the JSON fixture."""
+    row: int
+    raw_code: str
+    month_code: int
+    book_id: str
+    subject: str
+    title: str
+    guideline_note: str
+
+
+def _load_handler_responses(raw: bytes) -> dict[str, dict[str, Any]]:
+    """Decode the templates, expanding positional planner items to dicts."""
+    responses = json.loads(raw)
+    ids_data = responses["planner.ids_list"]["data"]
+    ids_data["items"] = [PlannerItem(*item)._asdict() for item in ids_data["items"]]
+    return responses
+
+
+_HANDLER_RESPONSES = _load_handler_responses(_HANDLER_RESPONSES_BYTES)
+
+
+# Fallback for unknown template keys in the mock_*_handler factories
+_MISSING_RESPONSE: dict[str, Any] = {
+    "ok": False,
+    "op": "mock",
+    "error": {"code": "NOT_FOUND", "message": "unknown mock response key"},
+}
+
+
+@pytest.fixture(scope="session")
 def mock_handler_responses():
-    """Predefined handler response templates"""
-    return {
-        "books.find": {
-            "ok": True,
-            "op": "books.find",
-            "data": {
-                "query": "青チャート",
-                "top": {"book_id": "gMB001", "title": "青チャート数学IA", "subject": "数学", "score": 1.0},
-                "candidates": [
-                    {"book_id": "gMB001", "title": "青チャート数学IA", "subject": "数学", "score": 1.0},
-                    {"book_id": "gMB002", "title": "青チャート数学IIB", "subject": "数学", "score": 0.9},
-                ],
-                "confidence": 1.0,
-            },
-        },
-        "books.get": {
-            "ok": True,
-            "op": "books.get",
-            "data": {
-                "book": {
-                    "id": "gMB001",
-                    "title": "青チャート数学IA",
-                    "subject": "数学",
-                    "unit_load": 2,
-                    "monthly_goal": "1時間/日",
-                    "structure": {
-                        "chapters": [{"idx": 1, "title": "第1章", "range": {"start": 1, "end": 50}}]
-                    },
-                }
-            },
-        },
-        "books.filter": {
-            "ok": True,
-            "op": "books.filter",
-            "data": {
-                "count": 2,
-                "books": [
-                    {"id": "gMB001", "title": "青チャート数学IA", "subject": "数学"},
-                    {"id": "gMB002", "title": "青チャート数学IIB", "subject": "数学"},
-                ],
-            },
-        },
-        "books.list": {
-            "ok": True,
-            "op": "books.list",
-            "data": {
-                "count": 3,
-                "books": [
-                    {"id": "gMB001", "subject": "数学", "title": "青チャート数学IA"},
-                    {"id": "gMB002", "subject": "数学", "title": "青チャート数学IIB"},
-                    {"id": "gEC001", "subject": "英語", "title": "英語長文問題集"},
-                ],
-            },
-        },
-        "books.create": {
-            "ok": True,
-            "op": "books.create",
-            "data": {"id": "gMB003", "created": True},
-        },
-        "books.update_preview": {
-            "ok": True,
-            "op": "books.update",
-            "data": {
-                "requires_confirmation": True,
-                "preview": {"diffs": {"参考書名": {"from": "Old Title", "to": "New Title"}}},
-                "confirm_token": "test-token-123",
-                "expires_in_seconds": 300,
-            },
-        },
-        "books.update_confirm": {
-            "ok": True,
-            "op": "books.update",
-            "data": {"updated": True},
-        },
-        "books.delete_preview": {
-            "ok": True,
-            "op": "books.delete",
-            "data": {
-                "requires_confirmation": True,
-                "preview": {"rows_to_delete": 2},
-                "confirm_token": "delete-token-456",
-                "expires_in_seconds": 300,
-            },
-        },
-        "books.delete_confirm": {
-            "ok": True,
-            "op": "books.delete",
-            "data": {"deleted": True},
-        },
-        "students.list": {
-            "ok": True,
-            "op": "students.list",
-            "data": {
-                "count": 2,
-                "students": [
-                    {"id": "S001", "name": "山田太郎", "grade": "高1", "status": "在塾"},
-                    {"id": "S002", "name": "鈴木花子", "grade": "高2", "status": "在塾"},
-                ],
-            },
-        },
-        "students.filter": {
-            "ok": True,
-            "op": "students.filter",
-            "data": {
-                "count": 2,
-                "students": [
-                    {"id": "S001", "name": "山田太郎", "grade": "高1", "status": "在塾"},
-                    {"id": "S002", "name": "鈴木花子", "grade": "高2", "status": "在塾"},
-                ],
-            },
-        },
-        "planner.ids_list": {
-            "ok": True,
-            "op": "planner.ids_list",
-            "data": {
-                "count": 2,
-                "items": [
-                    {"row": 4, "raw_code": "258gMB001", "month_code": 258, "book_id": "gMB001", "subject": "数学", "title": "青チャート"},
-                    {"row": 5, "raw_code": "258gEC001", "month_code": 258, "book_id": "gEC001", "subject": "英語", "title": "英語長文"},
-                ],
-            },
-        },
-        "planner.dates.get": {
-            "ok": True,
-            "op": "planner.dates.get",
-            "data": {"week_starts": ["2025-08-04", "2025-08-11", "2025-08-18", "2025-08-25", ""]},
-        },
-        "planner.metrics.get": {
-            "ok": True,
-            "op": "planner.metrics.get",
-            "data": {
-                "weeks": [
-                    {
-                        "week_index": 1,
-                        "items": [{"row": 4, "weekly_minutes": 120, "unit_load": 2, "guideline_amount": 240}],
-                    }
-                ]
-            },
-        },
-        "planner.plan.get": {
-            "ok": True,
-            "op": "planner.plan.get",
-            "data": {
-                "weeks": [
-                    {"week_index": 1, "items": [{"row": 4, "plan_text": "p1-10"}]},
-                ]
-            },
-        },
-        "planner.plan.set": {
-            "ok": True,
-            "op": "planner.plan.set",
-            "data": {"updated": True, "results": [{"ok": True, "cell": "H4"}]},
-        },
-    }
+    """Predefined handler response templates (read-only, shared per session)"""
+    return MappingProxyType(_HANDLER_RESPONSES)
 
 
 @pytest.fixture
-def mock_books_handler(mock_handler_responses):
+def mock_handler_responses_mut():
+    """Mutable deep copy of the handler response templates.
+
+    Use this instead of ``mock_handler_responses`` when the code under test
+    mutates the returned payload in place. Decoding the cached bytes gives a
+    fresh tree faster than copy.deepcopy().
+    """
+    return _load_handler_responses(_HANDLER_RESPONSES_BYTES)
+
+
+def _handler_patcher(class_name: str):
+    """Build a factory that patches ``server.<class_name>`` for tool tests.
+
+    The returned context manager also patches ``server.get_sheets_client`` and
+    yields the mock handler instance whose ``method`` returns ``response``.
+    ``response`` may be a response dict or a key into the response templates;
+    unknown keys resolve to a NOT_FOUND error response.
+    """
+    handler_target = f"server.{class_name}"
+    lookup = _HANDLER_RESPONSES.get
+    missing = _MISSING_RESPONSE
+
+    @contextmanager
+    def _mock(method: str, response: dict | str):
+        if isinstance(response, str):
+            response = lookup(response) or missing
+        handler = MagicMock()
+        getattr(handler, method).return_value = response
+        with patch("server.get_sheets_client", return_value=MagicMock()), \
+             patch(handler_target, return_value=handler):
+            yield handler
+
+    return _mock
+
+
+@pytest.fixture(scope="session")
+def mock_books_handler():
     """
-    Fixture to mock books handler for tool tests.
+    Fixture to mock BooksHandler for tool tests.
 
     Usage:
-        def test_books_find(mock_books_handler):
+        async def test_books_find(mock_books_handler, mock_handler_responses):
             with mock_books_handler("find", mock_handler_responses["books.find"]):
                 result = await books_find(query="青チャート")
     """
-    def _mock(func_name: str, response: dict):
-        return patch(f"handlers.books.books_{func_name}", return_value=response)
-    return _mock
+    return _handler_patcher("BooksHandler")
 
 
-@pytest.fixture
-def mock_students_handler(mock_handler_responses):
-    """Fixture to mock students handler for tool tests."""
-    def _mock(func_name: str, response: dict):
-        return patch(f"handlers.students.students_{func_name}", return_value=response)
-    return _mock
+@pytest.fixture(scope="session")
+def mock_students_handler():
+    """Fixture to mock StudentsHandler for tool tests."""
+    return _handler_patcher("StudentsHandler")
 
 
-@pytest.fixture
-def mock_planner_handler(mock_handler_responses):
-    """Fixture to mock planner handler for tool tests."""
-    def _mock(func_name: str, response: dict):
-        return patch(f"handlers.planner.planner_{func_name}", return_value=response)
-    return _mock
+@pytest.fixture(scope="session")
+def mock_planner_handler():
+    """Fixture to mock PlannerHandler for tool tests."""
+    return _handler_patcher("PlannerHandler")
+
+
+# ========== Lazy MCP Tool Fixtures ==========
+
+# Tool functions exposed as fixtures so tool test modules do not import
+# ``server`` (and the MCP SDK) at collection time; it is imported on first use.
+_SERVER_TOOLS = (
+    "books_find", "books_get", "books_filter", "books_create",
+    "books_update", "books_delete", "books_list",
+    "students_list", "students_find", "students_get", "students_filter",
+    "students_create", "students_create_many", "students_update", "students_delete",
+    "planner_ids_list", "planner_dates_get", "planner_dates_set",
+    "planner_metrics_get", "planner_plan_get", "planner_plan_set",
+    "planner_plan_create", "planner_monthly_filter", "planner_guidance",
+    "monthplan_get", "monthplan_set",
+)
+
+
+def _server_tool_fixture(tool_name: str):
+    @pytest.fixture(name=tool_name)
+    def _tool():
+        import server
+        return getattr(server, tool_name)
+    return _tool
+
+
+for _tool_name in _SERVER_TOOLS:
+    globals()[f"_tool_{_tool_name}"] = _server_tool_fixture(_tool_name)
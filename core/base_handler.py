@@ -9,13 +9,26 @@ Provides common functionality for all handlers:
 - Response helpers (ok/ng)
 """
 from abc import ABC
-from typing import Any, ClassVar
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Callable, ClassVar, TypeVar
 
 from sheets_client import SheetsClient
 from lib.common import ok, ng, normalize
-from lib.sheet_utils import pick_col, norm_header
+from lib.sheet_utils import pick_col, norm_header, index_to_col_letter
 from lib.preview_cache import PreviewCache
 
+T = TypeVar("T")
+
+
+@dataclass
+class _SheetState:
+    """Header-derived state memoized per loaded values list."""
+    values: list[list[Any]]
+    headers: list[str]
+    column_indices: dict[str, int]
+    derived: dict[str, Any] = field(default_factory=dict)
+
 
 class BaseHandler(ABC):
     """
@@ -44,6 +57,10 @@ class BaseHandler(ABC):
     # Shared preview cache (class-level)
     _preview_cache: ClassVar[PreviewCache | None] = None
 
+    # Header-derived state keyed by (handler class, file_id, sheet_name).
+    # Reused while SheetsClient keeps returning the same cached values list.
+    _sheet_states: ClassVar[dict[tuple[type, str | None, str | None], _SheetState]] = {}
+
     def __init__(
         self,
         sheets: SheetsClient,
@@ -66,6 +83,7 @@ class BaseHandler(ABC):
         self._values: list[list[Any]] | None = None
         self._headers: list[str] | None = None
         self._column_indices: dict[str, int] | None = None
+        self._sheet_state: _SheetState | None = None
 
     # === Properties ===
 
@@ -93,29 +111,108 @@ class BaseHandler(ABC):
 
     # === Sheet Loading ===
 
-    def load_sheet(self, op_name: str) -> dict | None:
+    def load_sheet(self, op_name: str, fresh: bool = False) -> dict | None:
         """
         Load sheet values with error handling.
 
         Args:
             op_name: Operation name for error messages
+            fresh: Bypass the client's values cache. Mutating operations
+                   (create/update/delete) pass True so IDs and row numbers
+                   come from the sheet as it is now, not a cached copy.
 
         Returns:
             Error dict if failed, None on success.
             On success, populates self._values, self._headers, self._column_indices.
         """
         try:
-            self._values = self.sheets.get_all_values(self.file_id, self.sheet_name)
+            if fresh:
+                self._values = self.sheets.get_all_values(self.file_id, self.sheet_name, fresh=True)
+            else:
+                self._values = self.sheets.get_all_values(self.file_id, self.sheet_name)
         except Exception as e:
             return self._error(op_name, "NOT_FOUND", f"sheet not found: {e}")
 
         if not self._values:
             return self._error(op_name, "EMPTY", "sheet is empty")
 
-        self._headers = [str(h) for h in self._values[0]]
-        self._build_column_indices()
+        key = (type(self), self.file_id, self.sheet_name)
+        state = self._sheet_states.get(key)
+        if state is None or state.values is not self._values:
+            self._headers = [str(h) for h in self._values[0]]
+            self._build_column_indices()
+            state = _SheetState(self._values, self._headers, self._column_indices)
+            self._sheet_states[key] = state
+        else:
+            self._headers = state.headers
+            self._column_indices = state.column_indices
+        self._sheet_state = state
         return None
 
+    def invalidate_sheet_state(self) -> None:
+        """
+        Drop the memoized state for this handler's sheet after a write.
+
+        The next load_sheet rebuilds headers, column indices and every
+        sheet_memo value, even if the client hands back the same list.
+        """
+        self._sheet_states.pop((type(self), self.file_id, self.sheet_name), None)
+        self._sheet_state = None
+
+    def sheet_memo(self, name: str, build: Callable[[], T]) -> T:
+        """
+        Return state derived from the loaded values, building it on first use.
+
+        The result is shared by every handler instance that loads the same
+        values list, so it must not be mutated by callers.
+
+        Args:
+            name: Memo key
+            build: Zero-argument factory run when the memo is missing
+
+        Returns:
+            The memoized value (built without memoizing if no sheet is loaded)
+        """
+        if self._sheet_state is None:
+            return build()
+        derived = self._sheet_state.derived
+        try:
+            return derived[name]
+        except KeyError:
+            value = derived[name] = build()
+            return value
+
+    def header_col(self, key: str) -> int:
+        """
+        Find a column by header name, compared after norm_header.
+
+        Args:
+            key: Header name as given by the caller
+
+        Returns:
+            0-based column index of the first matching header, or -1
+        """
+        header_index = self.sheet_memo("header_index", self._build_header_index)
+        return header_index.get(norm_header(key), -1)
+
+    def _build_header_index(self) -> dict[str, int]:
+        """Map normalized header -> first column index carrying it."""
+        header_index: dict[str, int] = {}
+        for i, h in enumerate(self.headers):
+            header_index.setdefault(norm_header(h), i)
+        return header_index
+
+    def col_letter(self, col_idx: int) -> str:
+        """
+        Column letter for a 0-based column index.
+
+        Letters for the loaded header width are computed once per values.
+        """
+        letters = self.sheet_memo(
+            "col_letters", lambda: [index_to_col_letter(i) for i in range(len(self.headers))]
+        )
+        return letters[col_idx] if 0 <= col_idx < len(letters) else index_to_col_letter(col_idx)
+
     def _build_column_indices(self) -> None:
         """Build column index map using COLUMN_SPEC."""
         self._column_indices = {}
@@ -156,6 +253,36 @@ class BaseHandler(ABC):
             return row[idx]
         return default
 
+    def column_values(self, col_key: str) -> tuple[str, ...]:
+        """
+        Stripped string cells of a COLUMN_SPEC column, one per data row.
+
+        Position k holds row k + 2 (1-based, after the header). Built once
+        per loaded values, so row scans read a flat tuple instead of
+        indexing, str()-ing and stripping every row on each call. Missing
+        columns yield "" for every row.
+        """
+        return self._column_values_at(self.column_indices.get(col_key, -1))
+
+    def _column_values_at(self, idx: int) -> tuple[str, ...]:
+        """column_values for a 0-based column index."""
+        def build() -> tuple[str, ...]:
+            get = self._get_cell_by_index
+            return tuple(str(get(row, idx)).strip() for row in islice(self.values, 1, None))
+
+        return self.sheet_memo(f"column:{idx}", build)
+
+    def normalized_column_values(self, col_key: str) -> tuple[str, ...]:
+        """column_values passed through normalize(), memoized the same way."""
+        return self._normalized_column_at(self.column_indices.get(col_key, -1))
+
+    def _normalized_column_at(self, idx: int) -> tuple[str, ...]:
+        """normalized_column_values for a 0-based column index."""
+        def build() -> tuple[str, ...]:
+            return tuple(normalize(v) for v in self._column_values_at(idx))
+
+        return self.sheet_memo(f"normalized_column:{idx}", build)
+
     # === Row Finding ===
 
     def find_row_by_id(self, id_col_key: str, target_id: str) -> int | None:
@@ -173,12 +300,8 @@ class BaseHandler(ABC):
         if idx < 0:
             return None
 
-        target = str(target_id).strip()
-        for i, row in enumerate(self.values[1:], 2):
-            cell_val = str(self._get_cell_by_index(row, idx)).strip()
-            if cell_val == target:
-                return i
-        return None
+        first_rows, _ = self._id_row_maps(idx)
+        return first_rows.get(str(target_id).strip())
 
     def find_rows_by_ids(
         self,
@@ -199,15 +322,27 @@ class BaseHandler(ABC):
         if idx < 0:
             return {}
 
-        targets = {str(x).strip() for x in target_ids}
-        result: dict[str, int] = {}
+        first_rows, last_rows = self._id_row_maps(idx)
+        found = [t for t in {str(x).strip() for x in target_ids} if t in last_rows]
+        found.sort(key=first_rows.__getitem__)  # keys in sheet order, as a scan yields
+        return {t: last_rows[t] for t in found}
 
-        for i, row in enumerate(self.values[1:], 2):
-            cell_val = str(self._get_cell_by_index(row, idx)).strip()
-            if cell_val in targets:
-                result[cell_val] = i
+    def _id_row_maps(self, idx: int) -> tuple[dict[str, int], dict[str, int]]:
+        """
+        Map stripped cell values of a column to their first and last 1-based rows.
 
-        return result
+        Built in one pass and memoized per loaded values, so repeated ID
+        lookups are dict hits instead of sheet scans.
+        """
+        def build() -> tuple[dict[str, int], dict[str, int]]:
+            first_rows: dict[str, int] = {}
+            last_rows: dict[str, int] = {}
+            for i, cell_val in enumerate(self._column_values_at(idx), 2):
+                first_rows.setdefault(cell_val, i)
+                last_rows[cell_val] = i
+            return first_rows, last_rows
+
+        return self.sheet_memo(f"id_rows:{idx}", build)
 
     # === Filtering ===
 
@@ -231,52 +366,31 @@ class BaseHandler(ABC):
         where = where or {}
         contains = contains or {}
 
-        # Build normalized header index
-        normalized_headers = [norm_header(h) for h in self.headers]
+        # Pre-compute column indices and normalized condition values
+        where_pairs = [(self.header_col(k), normalize(str(v))) for k, v in where.items()]
+        contains_pairs = [(self.header_col(k), normalize(str(v))) for k, v in contains.items()]
 
-        def col_index_for(key: str) -> int:
-            nk = norm_header(key)
-            try:
-                return normalized_headers.index(nk)
-            except ValueError:
-                return -1
+        # A condition on an unknown column can never match
+        if any(ci < 0 for ci, _ in where_pairs + contains_pairs):
+            return []
 
-        # Pre-compute column indices
-        where_pairs = [(col_index_for(k), str(v)) for k, v in where.items()]
-        contains_pairs = [(col_index_for(k), str(v)) for k, v in contains.items()]
+        # Normalized cells are memoized per column, so rows are not re-normalized per call
+        where_cols = [(self._normalized_column_at(ci), v) for ci, v in where_pairs]
+        contains_cols = [(self._normalized_column_at(ci), v) for ci, v in contains_pairs]
 
         results: list[tuple[int, list[Any]]] = []
         max_results = limit if limit and limit > 0 else float("inf")
 
-        for row_idx, row in enumerate(self.values[1:], 2):
-            # Check where conditions (exact match)
-            match = True
-            for ci, v in where_pairs:
-                if ci < 0:
-                    match = False
-                    break
-                raw = str(row[ci]) if ci < len(row) else ""
-                if normalize(raw) != normalize(v):
-                    match = False
-                    break
-
-            if not match:
+        for k, row in enumerate(islice(self.values, 1, None)):
+            # Check where conditions (exact match), then contains (partial match)
+            if any(col[k] != v for col, v in where_cols):
+                continue
+            if any(v not in col[k] for col, v in contains_cols):
                 continue
 
-            # Check contains conditions (partial match)
-            for ci, v in contains_pairs:
-                if ci < 0:
-                    match = False
-                    break
-                raw = str(row[ci]) if ci < len(row) else ""
-                if normalize(v) not in normalize(raw):
-                    match = False
-                    break
-
-            if match:
-                results.append((row_idx, row))
-                if len(results) >= max_results:
-                    break
+            results.append((k + 2, row))
+            if len(results) >= max_results:
+                break
 
         return results
 
@@ -1,29 +1,49 @@
 """
 Environment variable loader for the MCP server.
 Handles loading credentials from .env file or environment.
+
+Values are read once per process and memoized; call clear_env_cache()
+after changing environment variables at runtime (e.g. in tests).
 """
 import os
 import json
+from functools import lru_cache
 from pathlib import Path
 
 # Load .env file if it exists
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json handles the same input
+    _json_loads = json.loads
+
+# Accepted spellings for boolean env flags (compared case-insensitively)
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
 # Find .env file (look in current dir and parent dirs)
-def _find_env_file() -> Path | None:
-    current = Path(__file__).parent
+@lru_cache(maxsize=1)
+def _find_env_file() -> str | None:
+    current = os.path.dirname(os.path.abspath(__file__))
     for _ in range(3):  # Check up to 3 levels up
-        env_path = current / ".env"
-        if env_path.exists():
+        env_path = os.path.join(current, ".env")
+        if os.path.isfile(env_path):
             return env_path
-        current = current.parent
+        current = os.path.dirname(current)
     return None
 
-_env_file = _find_env_file()
-if _env_file:
-    load_dotenv(_env_file)
+
+@lru_cache(maxsize=1)
+def _ensure_env_loaded() -> None:
+    """Load the .env file once, on first access rather than at import time."""
+    env_file = _find_env_file()
+    if env_file:
+        load_dotenv(env_file)
 
 
+@lru_cache(maxsize=1)
 def get_google_credentials() -> dict:
     """
     Get Google Service Account credentials.
@@ -38,21 +58,22 @@ def get_google_credentials() -> dict:
     Raises:
         RuntimeError: If no credentials are configured
     """
+    _ensure_env_loaded()
+
     # Option 1: File path
     creds_file = os.environ.get("GOOGLE_CREDENTIALS_FILE")
     if creds_file:
         creds_path = Path(creds_file)
         if not creds_path.exists():
             raise RuntimeError(f"GOOGLE_CREDENTIALS_FILE not found: {creds_file}")
-        with open(creds_path, "r") as f:
-            return json.load(f)
+        return _json_loads(creds_path.read_bytes())
 
     # Option 2: JSON content
     creds_json = os.environ.get("GOOGLE_CREDENTIALS_JSON")
     if creds_json:
         try:
-            return json.loads(creds_json)
-        except json.JSONDecodeError as e:
+            return _json_loads(creds_json)
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
             raise RuntimeError(f"Invalid GOOGLE_CREDENTIALS_JSON: {e}")
 
     raise RuntimeError(
@@ -61,17 +82,48 @@ def get_google_credentials() -> dict:
     )
 
 
+@lru_cache(maxsize=1)
 def get_port() -> int:
     """Get server port from environment."""
+    _ensure_env_loaded()
     return int(os.environ.get("PORT", "8080"))
 
 
+@lru_cache(maxsize=1)
 def is_hmac_required() -> bool:
     """Check if HMAC authentication is required."""
-    return os.environ.get("MCP_HMAC_REQUIRED", "false").lower() in {"1", "true", "yes", "on"}
+    _ensure_env_loaded()
+    value = os.environ.get("MCP_HMAC_REQUIRED", "false")
+    return value in _TRUTHY or value.lower() in _TRUTHY
 
 
+@lru_cache(maxsize=1)
 def get_hmac_secret() -> str | None:
     """Get HMAC secret if configured."""
+    _ensure_env_loaded()
     secret = os.environ.get("MCP_HMAC_SECRET")
     return secret if secret else None
+
+
+@lru_cache(maxsize=1)
+def get_values_cache_ttl() -> float | None:
+    """
+    Get the TTL (seconds) for cached sheet values, or None if not set.
+
+    SHEETS_VALUES_CACHE_TTL makes the accepted staleness of get_all_values()
+    explicit; 0 disables the cache.
+    """
+    _ensure_env_loaded()
+    value = os.environ.get("SHEETS_VALUES_CACHE_TTL")
+    if not value:
+        return None
+    return max(0.0, float(value))
+
+
+def clear_env_cache() -> None:
+    """Reset memoized environment reads (for tests that change env vars)."""
+    get_google_credentials.cache_clear()
+    get_port.cache_clear()
+    is_hmac_required.cache_clear()
+    get_hmac_secret.cache_clear()
+    get_values_cache_ttl.cache_clear()
@@ -2,13 +2,41 @@
 Domain handlers for the MCP server.
 
 Each module provides OOP-based handler classes that operate on Google Sheets directly.
+
+Handler classes are resolved lazily (PEP 562) so importing ``handlers`` does not
+pull in every handler subpackage; each one is imported on first attribute access.
 """
-from handlers.books import BooksHandler
-from handlers.students import StudentsHandler
-from handlers.planner import PlannerHandler
+import importlib
+
+# Exported name -> subpackage that defines it
+_LAZY = {
+    "BooksHandler": "books",
+    "StudentsHandler": "students",
+    "PlannerHandler": "planner",
+    "BookMeta": "books",
+    "StudentInfo": "students",
+    "PlannerSheetResult": "planner",
+}
 
 __all__ = [
     "BooksHandler",
     "StudentsHandler",
     "PlannerHandler",
+    "BookMeta",
+    "StudentInfo",
+    "PlannerSheetResult",
 ]
+
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
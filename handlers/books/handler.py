@@ -6,17 +6,20 @@ Implements IDF-weighted search, chapter parsing, and CRUD operations.
 """
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Any, ClassVar
+from functools import lru_cache
+from typing import Any, ClassVar, NamedTuple
 
 from core.base_handler import BaseHandler
 from core.two_phase_mixin import TwoPhaseOperationMixin
 from sheets_client import SheetsClient
 from config import BOOKS_MASTER_ID, BOOKS_SHEET, BOOK_COLUMNS
-from lib.common import to_number_or_none
-from lib.sheet_utils import parse_monthly_goal, index_to_col_letter
+from lib.common import normalize, to_number_or_none
+from lib.sheet_utils import parse_monthly_goal, row_range_updates
 from lib.id_rules import decide_prefix, next_id_for_prefix, extract_ids_from_values
 
+from handlers.books.index import BookIndex
 from handlers.books.search import SearchMixin
 
 
@@ -25,6 +28,27 @@ ChapterInfo = dict[str, Any]
 BookDetails = dict[str, Any]
 
 
+def _cell(row: list[Any], i: int) -> Any:
+    """Cell value by 0-based index, or "" when out of range or None."""
+    if 0 <= i < len(row):
+        value = row[i]
+        if value is not None:
+            return value
+    return ""
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _cell_number(raw: str | int | float) -> int | float | None:
+    """
+    to_number_or_none memoized on the raw cell value.
+
+    Chapter numbers and unit loads repeat heavily across books ("1", "2",
+    ...), so each distinct cell string is parsed once. typed=True keeps
+    1 and 1.0 apart so the result type matches to_number_or_none.
+    """
+    return to_number_or_none(raw)
+
+
 @dataclass
 class BookMeta:
     """Book metadata (parent row data)."""
@@ -38,6 +62,28 @@ class BookMeta:
     quiz_id: str = ""
 
 
+class BookColumns(NamedTuple):
+    """Resolved 0-based column indices of the books sheet (-1 when absent)."""
+    id: int
+    title: int
+    subject: int
+    goal: int
+    unit: int
+    chap_idx: int
+    chap_name: int
+    chap_begin: int
+    chap_end: int
+    numbering: int
+    book_type: int
+    quiz_type: int
+    quiz_id: int
+
+    @classmethod
+    def from_indices(cls, column_indices: dict[str, int]) -> "BookColumns":
+        """Build from BaseHandler.column_indices (keys follow COLUMN_SPEC)."""
+        return cls(*(column_indices.get(name, -1) for name in cls._fields))
+
+
 class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
     """
     Handler for book-related operations.
@@ -72,6 +118,11 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
         "現代文", "古文", "漢文", "英語", "数学",
         "化学", "物理", "生物", "日本史", "世界史", "地理"
     ]
+    # Casefolded key -> position in SUBJECT_KEYS (earlier keys take priority),
+    # built once at class creation
+    SUBJECT_KEY_RANKS: ClassVar[dict[str, int]] = {
+        k.casefold(): i for i, k in reversed(list(enumerate(SUBJECT_KEYS)))
+    }
 
     def __init__(
         self,
@@ -83,6 +134,18 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
         super().__init__(sheets, file_id, sheet_name)
         self._preview_cache = self.get_preview_cache()
 
+    def _book_index(self) -> BookIndex:
+        """Search index for the loaded values (built once per values list)."""
+        return self.sheet_memo(
+            "book_index", lambda: BookIndex.build(self.values, self.column_indices)
+        )
+
+    def _cols(self) -> BookColumns:
+        """Column indices as attributes (resolved once per values list)."""
+        return self.sheet_memo(
+            "book_columns", lambda: BookColumns.from_indices(self.column_indices)
+        )
+
     # === Find (IDF Search) ===
 
     def find(
@@ -112,7 +175,7 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
                 "query": query, "candidates": [], "top": None, "confidence": 0
             })
 
-        if self.column_indices.get("id", -1) < 0:
+        if self._cols().id < 0:
             return self._error("books.find", "BAD_HEADER",
                              "必要な列（参考書ID/参考書名/教科）が見つかりません",
                              {"headers": self.headers})
@@ -153,12 +216,11 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
             return self._error("books.get", "EMPTY", "シートが空です")
 
         target_id = str(book_id).strip()
-        meta, chapters = self._collect_book_data(target_id)
+        book = self._book_details(target_id)
 
-        if not meta:
+        if book is None:
             return self._error("books.get", "NOT_FOUND", f"book '{target_id}' not found")
 
-        book = self._build_book_response(meta, chapters)
         return self._ok("books.get", {"book": book})
 
     def get_multiple(self, book_ids: list[str]) -> dict[str, Any]:
@@ -182,80 +244,88 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
             return self._error("books.get", "EMPTY", "シートが空です")
 
         target_ids = set(str(x).strip() for x in book_ids)
-        books_map: dict[str, dict] = {id_: {"meta": None, "chapters": []} for id_ in target_ids}
-
-        current_id = None
-        for row in self.values[1:]:
-            id_cell = str(self.get_cell(row, "id")).strip()
-            if id_cell:
-                current_id = id_cell
-            if not current_id or current_id not in target_ids:
-                continue
 
-            bucket = books_map[current_id]
+        # Each requested book is read from its indexed row blocks only
+        books = []
+        for id_ in target_ids:
+            book = self._book_details(id_)
+            if book is not None:
+                books.append(book)
 
-            # First row with ID is the parent
-            if bucket["meta"] is None and id_cell:
-                bucket["meta"] = self._parse_meta(row)
+        return self._ok("books.get", {"books": books})
 
-            # Parse chapter
-            chapter = self._parse_chapter(row, len(bucket["chapters"]))
-            if chapter:
-                bucket["chapters"].append(chapter)
+    def _book_details(self, target_id: str) -> BookDetails | None:
+        """
+        Response dict for a single book, or None if the ID is unknown.
 
-        books = [
-            self._build_book_response(b["meta"], b["chapters"])
-            for id_, b in books_map.items() if b["meta"]
-        ]
+        Responses for known IDs are memoized per values list, so repeated
+        get/filter calls on an unchanged sheet skip parsing and
+        parse_monthly_goal (callers must not mutate them). Unknown IDs are
+        not cached, so arbitrary lookups cannot grow the memo.
+        """
+        responses = self.sheet_memo("book_responses", dict)
+        try:
+            return responses[target_id]
+        except KeyError:
+            pass
 
-        return self._ok("books.get", {"books": books})
+        meta, chapters = self._collect_book_data(target_id)
+        if not meta:
+            return None
+        book = responses[target_id] = self._build_book_response(meta, chapters)
+        return book
 
     def _collect_book_data(self, target_id: str) -> tuple[BookMeta | None, list[ChapterInfo]]:
         """Collect meta and chapters for a single book."""
         meta = None
         chapters: list[ChapterInfo] = []
-        current_id = None
+        values = self.values
 
-        for row in self.values[1:]:
-            id_cell = str(self.get_cell(row, "id")).strip()
-            if id_cell:
-                current_id = id_cell
-            if current_id != target_id:
-                continue
-
-            if meta is None and id_cell:
-                meta = self._parse_meta(row)
+        for parent_row, end_row in self._book_index().blocks.get(target_id, ()):
+            for row in values[parent_row - 1:end_row - 1]:
+                if meta is None:
+                    meta = self._parse_meta(row)
 
-            chapter = self._parse_chapter(row, len(chapters))
-            if chapter:
-                chapters.append(chapter)
+                chapter = self._parse_chapter(row, len(chapters))
+                if chapter:
+                    chapters.append(chapter)
 
         return meta, chapters
 
     def _parse_meta(self, row: list[Any]) -> BookMeta:
         """Parse book metadata from a row."""
+        cols = self._cols()
         return BookMeta(
-            id=str(self.get_cell(row, "id")).strip(),
-            title=str(self.get_cell(row, "title")),
-            subject=str(self.get_cell(row, "subject")),
-            monthly_goal_text=str(self.get_cell(row, "goal")),
-            unit_load=to_number_or_none(self.get_cell(row, "unit")),
-            book_type=str(self.get_cell(row, "book_type")),
-            quiz_type=str(self.get_cell(row, "quiz_type")),
-            quiz_id=str(self.get_cell(row, "quiz_id")),
+            id=str(_cell(row, cols.id)).strip(),
+            title=str(_cell(row, cols.title)),
+            # Categorical fields repeat across books; intern to share one string each
+            subject=sys.intern(str(_cell(row, cols.subject))),
+            monthly_goal_text=str(_cell(row, cols.goal)),
+            unit_load=_cell_number(_cell(row, cols.unit)),
+            book_type=sys.intern(str(_cell(row, cols.book_type))),
+            quiz_type=sys.intern(str(_cell(row, cols.quiz_type))),
+            quiz_id=str(_cell(row, cols.quiz_id)),
         )
 
     def _parse_chapter(self, row: list[Any], chapter_count: int) -> ChapterInfo | None:
         """Parse chapter info from a row."""
-        chap_name = str(self.get_cell(row, "chap_name")).strip()
-        chap_begin = to_number_or_none(self.get_cell(row, "chap_begin"))
-        chap_end = to_number_or_none(self.get_cell(row, "chap_end"))
-        chap_idx = to_number_or_none(self.get_cell(row, "chap_idx"))
-        numbering = str(self.get_cell(row, "numbering")).strip()
+        cols = self._cols()
+        chap_name = str(_cell(row, cols.chap_name)).strip()
+        begin_raw = _cell(row, cols.chap_begin)
+        end_raw = _cell(row, cols.chap_end)
+
+        # Fast path: rows without a chapter skip numeric parsing entirely
+        if not chap_name and begin_raw == "" and end_raw == "":
+            return None
 
+        chap_begin = _cell_number(begin_raw)
+        chap_end = _cell_number(end_raw)
         if not chap_name and chap_begin is None and chap_end is None:
             return None
 
+        chap_idx = _cell_number(_cell(row, cols.chap_idx))
+        numbering = str(_cell(row, cols.numbering)).strip()
+
         return {
             "idx": chap_idx if chap_idx is not None else chapter_count + 1,
             "title": chap_name or None,
@@ -312,11 +382,8 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
         if not self.values:
             return self._ok("books.filter", {"books": [], "count": 0, "limit": limit})
 
-        # Collect books with all their rows
-        books_map = self._collect_all_books()
-
-        # Filter and build results
-        results = self._filter_books(books_map, where or {}, contains or {}, limit)
+        # Filter block by block and build results
+        results = self._filter_books(where or {}, contains or {}, limit)
 
         return self._ok("books.filter", {
             "books": results,
@@ -324,92 +391,82 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
             "limit": limit if limit and limit > 0 else None,
         })
 
-    def _collect_all_books(self) -> dict[str, dict]:
-        """Collect all books with their rows."""
-        from collections import defaultdict
-
-        books_map: dict[str, dict] = {}
-        current_id = None
-
-        for row in self.values[1:]:
-            id_cell = str(self.get_cell(row, "id")).strip()
-            if id_cell:
-                current_id = id_cell
-            if not current_id:
-                continue
-
-            if current_id not in books_map:
-                books_map[current_id] = {
-                    "meta": None,
-                    "chapters": [],
-                    "cols": defaultdict(list),
-                }
-
-            bucket = books_map[current_id]
-
-            if bucket["meta"] is None and id_cell:
-                bucket["meta"] = self._parse_meta(row)
-
-            chapter = self._parse_chapter(row, len(bucket["chapters"]))
-            if chapter:
-                bucket["chapters"].append(chapter)
-
-            # Collect column values for filtering
-            for ci in range(len(row)):
-                raw = row[ci]
-                if raw is not None and str(raw).strip():
-                    bucket["cols"][ci].append(str(raw))
-
-        return books_map
-
     def _filter_books(
         self,
-        books_map: dict[str, dict],
         where: dict[str, str],
         contains: dict[str, str],
         limit: int | None,
     ) -> list[BookDetails]:
-        """Filter books and build response list."""
-        from lib.sheet_utils import norm_header
-        from lib.common import normalize
-
-        normalized_headers = [norm_header(h) for h in self.headers]
-
-        def col_index_for(key: str) -> int:
-            nk = norm_header(key)
-            try:
-                return normalized_headers.index(nk)
-            except ValueError:
-                return -1
-
-        where_idx = [(col_index_for(k), str(v)) for k, v in where.items()]
-        contains_idx = [(col_index_for(k), str(v)) for k, v in contains.items()]
-
-        def matches_book(b: dict) -> bool:
-            for ci, v in where_idx:
-                if ci < 0:
-                    return False
-                vals = b["cols"].get(ci, [])
-                if not any(normalize(x) == normalize(v) for x in vals):
-                    return False
-            for ci, v in contains_idx:
-                if ci < 0:
-                    return False
-                vals = b["cols"].get(ci, [])
-                if not any(normalize(v) in normalize(x) for x in vals):
-                    return False
-            return True
+        """
+        Filter books and build response list.
+
+        Books are visited through the precomputed row blocks (all spans of an
+        ID, in first-appearance order). Conditions are grouped per column and
+        applied column by column: where reads matching books from a cached
+        reverse index, contains first checks the whole column's text and then
+        runs one substring search over each book's cached normalized cells
+        while streaming up to limit. Only matching books are parsed (memoized).
+        """
+        where_idx = [(self.header_col(k), normalize(str(v))) for k, v in where.items()]
+        contains_idx = [(self.header_col(k), normalize(str(v))) for k, v in contains.items()]
+
+        # A condition on a column the sheet does not have can never match
+        if any(ci < 0 for ci, _ in where_idx) or any(ci < 0 for ci, _ in contains_idx):
+            return []
+
+        # Conditions grouped per column: ci -> (where values, contains needles)
+        slots: dict[int, tuple[set[str], set[str]]] = {}
+        for ci, nv in where_idx:
+            slots.setdefault(ci, (set(), set()))[0].add(nv)
+        for ci, nv in contains_idx:
+            slots.setdefault(ci, (set(), set()))[1].add(nv)
+
+        values = self.values
+        index = self._book_index()
+        index.load_columns(values, slots)  # One row pass for all filtered columns
+        book_ids = list(index.blocks)
+
+        # Exact matches narrow the candidates via each column's reverse index
+        matched: list[int] | None = None  # None: every book still matches
+        for ci, (equals, _) in slots.items():
+            if not equals:
+                continue
+            postings = index.column_postings(values, ci)
+            for nv in equals:
+                hits = postings.get(nv, [])
+                if matched is None:
+                    matched = hits
+                else:
+                    hit_set = set(hits)
+                    matched = [k for k in matched if k in hit_set]
+            if not matched:
+                return []
+
+        # A needle found nowhere in its column rules out every book at once
+        for ci, (_, needles) in slots.items():
+            if needles:
+                text = index.column_text(values, ci)
+                if any(nv not in text for nv in needles):
+                    return []
+
+        # Contains conditions are checked while streaming, so scanning
+        # stops as soon as limit books have matched
+        contains_checks = [
+            (index.column_terms(values, ci), needles)
+            for ci, (_, needles) in slots.items() if needles
+        ]
+        cells_contain = index.cells_contain
 
         results: list[BookDetails] = []
         max_limit = limit if limit and limit > 0 else float("inf")
 
-        for id_, b in books_map.items():
-            if not b["meta"]:
-                continue
-            if not matches_book(b):
+        for k in range(len(book_ids)) if matched is None else matched:
+            if not all(
+                cells_contain(terms[k], nv) for terms, needles in contains_checks for nv in needles
+            ):
                 continue
 
-            results.append(self._build_book_response(b["meta"], b["chapters"]))
+            results.append(self._book_details(book_ids[k]))
 
             if len(results) >= max_limit:
                 break
@@ -435,24 +492,24 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
         if not self.values:
             return self._ok("books.list", {"books": [], "count": 0})
 
-        seen: set[str] = set()
-        books: list[dict[str, str]] = []
+        cols = self._cols()
+        title_i, subject_i = cols.title, cols.subject
 
-        for row in self.values[1:]:
-            id_raw = str(self.get_cell(row, "id")).strip()
-            if not id_raw or id_raw in seen:
-                continue
-            seen.add(id_raw)
+        # Distinct IDs come from the index; title/subject are read unstripped
+        # from each book's first row (its first block start)
+        index = self._book_index()
+        ids = index.ids[:limit] if limit and limit > 0 else index.ids
+        values = self.values
 
+        books: list[dict[str, str]] = []
+        for book_id in ids:
+            row = values[index.blocks[book_id][0][0] - 1]
             books.append({
-                "id": id_raw,
-                "title": str(self.get_cell(row, "title")),
-                "subject": str(self.get_cell(row, "subject")),
+                "id": book_id,
+                "title": str(_cell(row, title_i)),
+                "subject": str(_cell(row, subject_i)),
             })
 
-        if limit and limit > 0:
-            books = books[:limit]
-
         return self._ok("books.list", {"books": books, "count": len(books)})
 
     # === Create ===
@@ -483,7 +540,7 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
         if not title or not subject:
             return self._error("books.create", "BAD_REQUEST", "title と subject が必要です")
 
-        error = self.load_sheet("books.create")
+        error = self.load_sheet("books.create", fresh=True)
         if error:
             return error
 
@@ -493,7 +550,7 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
         # Generate ID
         sub_prefix = decide_prefix(subject, title)
         base_prefix = id_prefix.strip() if id_prefix else f"g{sub_prefix}"
-        existing_ids = extract_ids_from_values(self.values, self.column_indices.get("id", -1))
+        existing_ids = extract_ids_from_values(self.values, self._cols().id)
         new_id = next_id_for_prefix(base_prefix, existing_ids)
 
         # Build rows
@@ -501,6 +558,7 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
 
         # Append rows
         self.sheets.append_rows(self.file_id, self.sheet_name, rows)
+        self.invalidate_sheet_state()
 
         return self._ok("books.create", {"id": new_id, "created_rows": len(rows)})
 
@@ -514,52 +572,52 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
         chapters: list[dict] | None,
     ) -> list[list[Any]]:
         """Build rows for book creation."""
-        idx = self.column_indices
+        cols = self._cols()
         num_cols = len(self.headers)
         chapters = chapters or []
         rows: list[list[Any]] = []
 
         # Parent row
         parent = [""] * num_cols
-        if idx.get("id", -1) >= 0:
-            parent[idx["id"]] = new_id
-        if idx.get("title", -1) >= 0:
-            parent[idx["title"]] = title
-        if idx.get("subject", -1) >= 0:
-            parent[idx["subject"]] = subject
-        if idx.get("goal", -1) >= 0:
-            parent[idx["goal"]] = monthly_goal
-        if idx.get("unit", -1) >= 0:
-            parent[idx["unit"]] = unit_load if unit_load is not None else ""
+        if cols.id >= 0:
+            parent[cols.id] = new_id
+        if cols.title >= 0:
+            parent[cols.title] = title
+        if cols.subject >= 0:
+            parent[cols.subject] = subject
+        if cols.goal >= 0:
+            parent[cols.goal] = monthly_goal
+        if cols.unit >= 0:
+            parent[cols.unit] = unit_load if unit_load is not None else ""
 
         if chapters:
             # First chapter in parent row
             ch0 = chapters[0]
-            if idx.get("chap_idx", -1) >= 0:
-                parent[idx["chap_idx"]] = 1
-            if idx.get("chap_name", -1) >= 0:
-                parent[idx["chap_name"]] = ch0.get("title", "")
-            if idx.get("chap_begin", -1) >= 0:
-                parent[idx["chap_begin"]] = ch0.get("range", {}).get("start", "")
-            if idx.get("chap_end", -1) >= 0:
-                parent[idx["chap_end"]] = ch0.get("range", {}).get("end", "")
-            if idx.get("numbering", -1) >= 0:
-                parent[idx["numbering"]] = ch0.get("numbering", "")
+            if cols.chap_idx >= 0:
+                parent[cols.chap_idx] = 1
+            if cols.chap_name >= 0:
+                parent[cols.chap_name] = ch0.get("title", "")
+            if cols.chap_begin >= 0:
+                parent[cols.chap_begin] = ch0.get("range", {}).get("start", "")
+            if cols.chap_end >= 0:
+                parent[cols.chap_end] = ch0.get("range", {}).get("end", "")
+            if cols.numbering >= 0:
+                parent[cols.numbering] = ch0.get("numbering", "")
             rows.append(parent)
 
             # Remaining chapters
             for i, ch in enumerate(chapters[1:], 2):
                 child = [""] * num_cols
-                if idx.get("chap_idx", -1) >= 0:
-                    child[idx["chap_idx"]] = i
-                if idx.get("chap_name", -1) >= 0:
-                    child[idx["chap_name"]] = ch.get("title", "")
-                if idx.get("chap_begin", -1) >= 0:
-                    child[idx["chap_begin"]] = ch.get("range", {}).get("start", "")
-                if idx.get("chap_end", -1) >= 0:
-                    child[idx["chap_end"]] = ch.get("range", {}).get("end", "")
-                if idx.get("numbering", -1) >= 0:
-                    child[idx["numbering"]] = ch.get("numbering", "")
+                if cols.chap_idx >= 0:
+                    child[cols.chap_idx] = i
+                if cols.chap_name >= 0:
+                    child[cols.chap_name] = ch.get("title", "")
+                if cols.chap_begin >= 0:
+                    child[cols.chap_begin] = ch.get("range", {}).get("start", "")
+                if cols.chap_end >= 0:
+                    child[cols.chap_end] = ch.get("range", {}).get("end", "")
+                if cols.numbering >= 0:
+                    child[cols.numbering] = ch.get("numbering", "")
                 rows.append(child)
         else:
             rows.append(parent)
@@ -590,7 +648,7 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
         if not book_id:
             return self._error(op, "BAD_REQUEST", "book_id が必要です")
 
-        error = self.load_sheet(op)
+        error = self.load_sheet(op, fresh=True)
         if error:
             return error
 
@@ -634,28 +692,7 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
 
     def _find_book_block(self, target_id: str) -> tuple[int, int]:
         """Find parent row and end row for a book block."""
-        parent_row = -1
-        for i, row in enumerate(self.values[1:], 2):
-            id_val = str(self.get_cell(row, "id")).strip()
-            if id_val == target_id:
-                parent_row = i
-                break
-
-        if parent_row < 0:
-            return -1, -1
-
-        # Find block end
-        end_row = len(self.values) + 1
-        for i in range(parent_row, len(self.values) + 1):
-            if i > parent_row:
-                if i <= len(self.values):
-                    row = self.values[i - 1]
-                    id_cell = str(self.get_cell(row, "id")).strip()
-                    if id_cell:
-                        end_row = i
-                        break
-
-        return parent_row, end_row
+        return self._book_index().block(target_id) or (-1, -1)
 
     def _build_update_preview(
         self,
@@ -671,18 +708,18 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
             Tuple of (payload_for_cache, preview_data_for_response)
         """
         current = self.values[parent_row - 1]
-        idx = self.column_indices
+        cols = self._cols()
 
         meta_changes = {}
         fields = [
-            ("title", idx.get("title", -1)),
-            ("subject", idx.get("subject", -1)),
-            ("monthly_goal", idx.get("goal", -1)),
-            ("unit_load", idx.get("unit", -1)),
+            ("title", cols.title),
+            ("subject", cols.subject),
+            ("monthly_goal", cols.goal),
+            ("unit_load", cols.unit),
         ]
         for key, col_idx in fields:
             if key in updates:
-                from_val = self._get_cell_by_index(current, col_idx) if col_idx >= 0 else ""
+                from_val = _cell(current, col_idx)
                 to_val = updates[key]
                 if str(from_val) != str(to_val):
                     meta_changes[key] = {"from": from_val, "to": to_val}
@@ -693,8 +730,10 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
             next_child_rows = max(0, len(updates["chapters"]) - 1)
             chapters_preview = {"from_count": existing_child_rows, "to_count": next_child_rows}
 
+        # Only the changed values are cached for confirm; chapter edits are
+        # preview-only (the confirm step writes parent-row fields)
         payload = {
-            "updates": updates,
+            "meta_changes": {k: v["to"] for k, v in meta_changes.items()},
             "parent_row": parent_row,
             "end_row": end_row,
         }
@@ -707,24 +746,27 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
 
     def _execute_update(self, op: str, payload: dict[str, Any]) -> dict[str, Any]:
         """Apply confirmed update."""
-        updates_to_apply = payload["updates"]
+        updates_to_apply = payload["meta_changes"]
         parent_row = payload["parent_row"]
-        idx = self.column_indices
+        cols = self._cols()
         field_map = {
-            "title": idx.get("title", -1),
-            "subject": idx.get("subject", -1),
-            "monthly_goal": idx.get("goal", -1),
-            "unit_load": idx.get("unit", -1),
+            "title": cols.title,
+            "subject": cols.subject,
+            "monthly_goal": cols.goal,
+            "unit_load": cols.unit,
         }
 
-        update_requests = []
-        for key, col_idx in field_map.items():
-            if key in updates_to_apply and col_idx >= 0:
-                cell = f"{index_to_col_letter(col_idx)}{parent_row}"
-                update_requests.append({"range": cell, "values": [[updates_to_apply[key]]]})
+        # Changed cells of the parent row, written as contiguous ranges
+        cells = {
+            col_idx: updates_to_apply[key]
+            for key, col_idx in field_map.items()
+            if key in updates_to_apply and col_idx >= 0
+        }
+        update_requests = row_range_updates(parent_row, cells, self.col_letter)
 
         if update_requests:
             self.sheets.batch_update(self.file_id, self.sheet_name, update_requests)
+            self.invalidate_sheet_state()
 
         return self._ok(op, {"book_id": payload.get("book_id"), "updated": True})
 
@@ -750,7 +792,7 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
         if not book_id:
             return self._error(op, "BAD_REQUEST", "book_id が必要です")
 
-        error = self.load_sheet(op)
+        error = self.load_sheet(op, fresh=True)
         if error:
             return error
 
@@ -800,5 +842,6 @@ class BooksHandler(BaseHandler, SearchMixin, TwoPhaseOperationMixin):
         payload = result["payload"]
         del_count = payload["end_row"] - payload["parent_row"]
         self.sheets.delete_rows(self.file_id, self.sheet_name, payload["parent_row"], del_count)
+        self.invalidate_sheet_state()
 
         return self._ok(op, {"deleted_rows": del_count})
@@ -0,0 +1,337 @@
+"""
+Precomputed index over the books sheet.
+
+Built once per loaded values list (via BaseHandler.sheet_memo) so that
+searches do not re-tokenize or re-normalize every title on each call.
+"""
+from __future__ import annotations
+
+import sys
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from lib.common import normalize
+from lib.sheet_utils import tokenize
+
+from handlers.books.search import _idf_for_df
+
+# Separators for the concatenated search text (never produced by normalize()
+# for sheet text, so a needle match cannot span two fields)
+_FIELD_SEP = "\x1f"
+_RECORD_SEP = "\x1e"
+
+
+def _stripped_cell(row: list[Any], i: int) -> str:
+    """Stripped string of a cell by 0-based index ("" when absent or None)."""
+    if 0 <= i < len(row) and row[i] is not None:
+        return str(row[i]).strip()
+    return ""
+
+
+@dataclass
+class BookIndex:
+    """
+    Per-book data precomputed from the books sheet (search fields and row blocks).
+
+    Search fields are stored column-wise: position i of every list describes
+    the i-th distinct book (the first row carrying its ID).
+    """
+    ids: list[str]
+    titles: list[str]
+    subjects: list[str]
+    title_token_sets: list[frozenset[str]]
+    doc_freq: dict[str, int]
+    normalized_ids: list[str]
+    normalized_titles: list[str]
+    normalized_subjects: list[str]
+    # book_id -> [(parent_row, end_row), ...] as 1-based sheet rows, end exclusive.
+    # More than one span only when an ID is repeated further down the sheet.
+    blocks: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
+    # column index -> per-book normalized cells (see column_terms)
+    column_cache: dict[int, list[tuple[frozenset[str], str]]] = field(
+        default_factory=dict, repr=False
+    )
+    # column index -> normalized cell -> book positions (see column_postings)
+    postings_cache: dict[int, dict[str, list[int]]] = field(default_factory=dict, repr=False)
+    # column index -> every normalized cell of the column in one string (see column_text)
+    text_cache: dict[int, str] = field(default_factory=dict, repr=False)
+
+    # IDF by document frequency (0..total_docs); df is the only per-term input
+    idf_table: list[float] = field(init=False, repr=False)
+
+    # Derived lookup structures for candidate pre-selection
+    token_postings: dict[str, list[int]] = field(init=False, repr=False)
+    subject_postings: dict[str, list[int]] = field(init=False, repr=False)
+    _search_text: str = field(init=False, repr=False)
+    _record_starts: list[int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        total_docs = self.total_docs
+        self.idf_table = [_idf_for_df(df, total_docs) for df in range(total_docs + 1)]
+
+        token_postings: dict[str, list[int]] = defaultdict(list)
+        for i, tok_set in enumerate(self.title_token_sets):
+            for t in tok_set:
+                token_postings[t].append(i)
+        self.token_postings = dict(token_postings)
+
+        subject_postings: dict[str, list[int]] = defaultdict(list)
+        for i, subject in enumerate(self.normalized_subjects):
+            subject_postings[subject].append(i)
+        self.subject_postings = dict(subject_postings)
+
+        # One record per book: "id<US>title<US>subject", records joined by <RS>
+        records = [
+            f"{nid}{_FIELD_SEP}{title}{_FIELD_SEP}{subject}"
+            for nid, title, subject in zip(
+                self.normalized_ids, self.normalized_titles, self.normalized_subjects
+            )
+        ]
+        starts: list[int] = []
+        pos = 0
+        for record in records:
+            starts.append(pos)
+            pos += len(record) + 1
+        self._search_text = _RECORD_SEP.join(records)
+        self._record_starts = starts
+
+    @property
+    def total_docs(self) -> int:
+        """Document count used for IDF (at least 1)."""
+        return len(self.ids) or 1
+
+    def block(self, book_id: str) -> tuple[int, int] | None:
+        """First (parent_row, end_row) block for a book ID, or None."""
+        spans = self.blocks.get(book_id)
+        return spans[0] if spans else None
+
+    def rows_containing(self, needle: str) -> set[int]:
+        """
+        Positions whose normalized id, title or subject contains needle.
+
+        Scans the concatenated search text with str.find (a C-level search)
+        instead of testing every field in Python.
+        """
+        text, starts = self._search_text, self._record_starts
+        found: set[int] = set()
+        pos = text.find(needle)
+        while pos >= 0:
+            i = bisect_right(starts, pos) - 1
+            found.add(i)
+            if i + 1 >= len(starts):
+                break
+            pos = text.find(needle, starts[i + 1])
+        return found
+
+    def candidate_rows(
+        self,
+        q_normalized: str,
+        token_rows: Iterable[int],
+        subject_normalized: str | None,
+    ) -> list[int]:
+        """
+        Positions that can score above zero for a query, in sheet order.
+
+        A row scores only if the query (or its 3-char prefix) occurs in one
+        of its normalized fields, a query token is in its title (token_rows,
+        taken from the caller's postings pass), or its subject equals the
+        detected query subject. Every other row is skipped.
+        """
+        if not q_normalized or _FIELD_SEP in q_normalized or _RECORD_SEP in q_normalized:
+            return list(range(len(self.ids)))
+
+        # The 3-char prefix covers exact/phrase/partial matches as well as fuzzy3
+        needle = q_normalized[:3] if len(q_normalized) >= 3 else q_normalized
+        rows = self.rows_containing(needle)
+        rows.update(token_rows)
+        if subject_normalized is not None:
+            rows.update(self.subject_postings.get(subject_normalized, ()))
+        return sorted(rows)
+
+    def column_terms(
+        self, values: list[list[Any]], ci: int
+    ) -> list[tuple[frozenset[str], str]]:
+        """
+        Normalized non-empty cells of one column for every book, in blocks order.
+
+        Each entry is (set of normalized cells, cells joined by a field
+        separator) so equality is a set lookup and containment a single
+        substring search. Built once per column for the lifetime of the index.
+
+        Args:
+            values: The sheet values this index was built from
+            ci: 0-based column index
+
+        Returns:
+            One entry per book, aligned with blocks
+        """
+        try:
+            return self.column_cache[ci]
+        except KeyError:
+            self.load_columns(values, [ci])
+            return self.column_cache[ci]
+
+    def load_columns(self, values: list[list[Any]], cis: Iterable[int]) -> None:
+        """
+        Build column_terms for several columns in one pass over the rows.
+
+        Columns already cached are skipped; each book block is walked once
+        no matter how many columns a filter references.
+
+        Args:
+            values: The sheet values this index was built from
+            cis: 0-based column indices
+        """
+        missing = sorted({ci for ci in cis if ci not in self.column_cache})
+        if not missing:
+            return
+
+        per_column: dict[int, list[tuple[frozenset[str], str]]] = {ci: [] for ci in missing}
+        for spans in self.blocks.values():
+            cells: dict[int, list[str]] = {ci: [] for ci in missing}
+            for start, end in spans:
+                for row in values[start - 1:end - 1]:
+                    row_len = len(row)
+                    for ci in missing:
+                        if ci < row_len and row[ci] is not None:
+                            raw = str(row[ci])
+                            if raw.strip():
+                                cells[ci].append(normalize(raw))
+            for ci, column_cells in cells.items():
+                per_column[ci].append((frozenset(column_cells), _FIELD_SEP.join(column_cells)))
+        self.column_cache.update(per_column)
+
+    def column_postings(self, values: list[list[Any]], ci: int) -> dict[str, list[int]]:
+        """
+        Reverse index of one column: normalized cell -> book positions.
+
+        Positions are ascending (blocks order), so an exact-match filter
+        reads its matches directly instead of testing every book.
+
+        Args:
+            values: The sheet values this index was built from
+            ci: 0-based column index
+
+        Returns:
+            Mapping from normalized cell value to the books containing it
+        """
+        try:
+            return self.postings_cache[ci]
+        except KeyError:
+            pass
+
+        postings: dict[str, list[int]] = defaultdict(list)
+        for k, (cell_set, _) in enumerate(self.column_terms(values, ci)):
+            for cell in cell_set:
+                postings[cell].append(k)
+        result = self.postings_cache[ci] = dict(postings)
+        return result
+
+    def column_text(self, values: list[list[Any]], ci: int) -> str:
+        """
+        All normalized cells of one column joined into a single string.
+
+        A needle absent from this text is absent from every cell, so a
+        contains filter that cannot match anywhere is rejected with one
+        substring search instead of a test per book.
+
+        Args:
+            values: The sheet values this index was built from
+            ci: 0-based column index
+
+        Returns:
+            The column's per-book joined cells, separated by a record separator
+        """
+        try:
+            return self.text_cache[ci]
+        except KeyError:
+            pass
+
+        text = self.text_cache[ci] = _RECORD_SEP.join(
+            joined for _, joined in self.column_terms(values, ci)
+        )
+        return text
+
+    @staticmethod
+    def cells_contain(entry: tuple[frozenset[str], str], needle: str) -> bool:
+        """True if any cell of a column_terms entry contains needle."""
+        cell_set, joined = entry
+        if not cell_set:
+            return False
+        if _FIELD_SEP in needle:  # Could match across two joined cells
+            return any(needle in x for x in cell_set)
+        return needle in joined
+
+    def idf(self, term: str) -> float:
+        """IDF for a term, looked up from the precomputed table by its df."""
+        return self.idf_table[self.doc_freq.get(term, 0)]
+
+    @classmethod
+    def build(cls, values: list[list[Any]], column_indices: dict[str, int]) -> BookIndex:
+        """
+        Build the index from sheet values.
+
+        Parent rows are the first row of each distinct book ID; child
+        (chapter) rows without an ID are skipped for search but extend the
+        current block. Everything is collected in a single pass.
+
+        Args:
+            values: Sheet values including the header row
+            column_indices: Column index map from BaseHandler
+
+        Returns:
+            BookIndex for the given values
+        """
+        id_i = column_indices.get("id", -1)
+        title_i = column_indices.get("title", -1)
+        subject_i = column_indices.get("subject", -1)
+
+        doc_freq: Counter[str] = Counter()
+        ids: list[str] = []
+        titles: list[str] = []
+        subjects: list[str] = []
+        title_token_sets: list[frozenset[str]] = []
+        blocks: dict[str, list[tuple[int, int]]] = {}
+        open_id: str | None = None
+        open_row = 0
+
+        for i, row in enumerate(values[1:], 2):
+            id_raw = _stripped_cell(row, id_i)
+            if not id_raw:  # Blank or child row (chapter)
+                continue
+
+            # An ID row closes the previous block and opens a new one
+            if open_id is not None:
+                blocks[open_id].append((open_row, i))
+            open_id, open_row = id_raw, i
+
+            # blocks doubles as the seen-set: only an ID's first row is a book
+            if id_raw in blocks:
+                continue
+            blocks[id_raw] = []
+
+            title_raw = _stripped_cell(row, title_i)
+            ids.append(id_raw)
+            titles.append(title_raw)
+            subjects.append(sys.intern(_stripped_cell(row, subject_i)))
+
+            tok_set = frozenset(tokenize(title_raw))
+            title_token_sets.append(tok_set)
+            doc_freq.update(tok_set)
+
+        if open_id is not None:
+            blocks[open_id].append((open_row, len(values) + 1))
+
+        return cls(
+            ids=ids,
+            titles=titles,
+            subjects=subjects,
+            title_token_sets=title_token_sets,
+            doc_freq=dict(doc_freq),
+            normalized_ids=[normalize(x) for x in ids],
+            normalized_titles=[normalize(x) for x in titles],
+            normalized_subjects=[sys.intern(normalize(x)) for x in subjects],
+            blocks=blocks,
+        )
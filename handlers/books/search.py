@@ -5,16 +5,30 @@ Extracts search-related logic into a reusable mixin class.
 """
 from __future__ import annotations
 
+import heapq
 import math
-from collections import defaultdict
-from typing import Any, TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Sequence, TYPE_CHECKING
 
+from lib.common import normalize
 from lib.sheet_utils import tokenize
 
 if TYPE_CHECKING:
     from handlers.books.handler import BooksHandler
 
 
+@lru_cache(maxsize=4096)
+def _normalize_query(query: str) -> str:
+    """Memoized normalize() for query strings (repeated queries skip NFKC)."""
+    return normalize(query)
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_query(query: str) -> tuple[str, ...]:
+    """Memoized tokenize() for query strings; returns an immutable tuple."""
+    return tuple(tokenize(query))
+
+
 def _calculate_idf(term: str, doc_freq: dict[str, int], total_docs: int) -> float:
     """
     Calculate BM25-style IDF for a term.
@@ -27,10 +41,72 @@ def _calculate_idf(term: str, doc_freq: dict[str, int], total_docs: int) -> floa
     Returns:
         IDF score for the term
     """
-    df = doc_freq.get(term, 0)
+    return _idf_for_df(doc_freq.get(term, 0), total_docs)
+
+
+def _idf_for_df(df: int, total_docs: int) -> float:
+    """BM25-style IDF for a document frequency (see _calculate_idf)."""
     return math.log(((total_docs - df + 0.5) / (df + 0.5)) + 1)
 
 
+def _score_row(
+    norm_id: str,
+    norm_title: str,
+    norm_subject: str,
+    idf_hit_fwd: float,
+    q_normalized: str,
+    sum_idf_q: float,
+    subject_normalized: str | None,
+) -> tuple[float, str]:
+    """
+    Score one book's normalized fields against the query.
+
+    This is the per-row hot path of books.find. It only touches plain
+    strings and floats (no handler or index attribute lookups).
+    idf_hit_fwd is the summed IDF of query tokens found in the title.
+
+    Returns:
+        (score, reason) tuple; score 0 means no match
+    """
+    hay = [h for h in (norm_id, norm_title, norm_subject) if len(h) >= 2]
+
+    # Calculate IDF coverage
+    cov_idf_fwd = idf_hit_fwd / sum_idf_q
+
+    # Base scoring
+    score = 0.0
+    reason = ""
+
+    if q_normalized in hay:
+        score = 1.0
+        reason = "exact"
+    elif q_normalized in norm_title:
+        score = 0.95
+        reason = "phrase"
+    elif any(q_normalized in h for h in hay):
+        score = 0.90
+        reason = "partial_target"
+    elif cov_idf_fwd > 0:
+        score = 0.80
+        reason = "coverage_q_in_title"
+    elif len(q_normalized) >= 3:
+        short = q_normalized[:3]
+        if any(short in h for h in hay):
+            score = 0.72
+            reason = "fuzzy3"
+
+    # Bonus
+    bonus = 0.0
+    if cov_idf_fwd > 0:
+        bonus += min(0.12, 0.12 * cov_idf_fwd)
+    if norm_title.startswith(q_normalized):
+        bonus += 0.02
+    if subject_normalized and subject_normalized == norm_subject:
+        bonus += 0.02
+
+    return min(1, score + bonus), reason
+
+
 class SearchMixin:
     """
     IDF-weighted search functionality for BooksHandler.
@@ -41,146 +117,84 @@ class SearchMixin:
 
     # Subject detection keywords (defined in handler, referenced here)
     SUBJECT_KEYS: list[str]
+    SUBJECT_KEY_RANKS: dict[str, int]
 
     def _score_candidates(self: "BooksHandler", query: str) -> list[dict[str, Any]]:
-        """Score all parent rows against the query."""
-        from lib.common import normalize
-
-        q_normalized = normalize(query)
-        q_tokens = tokenize(query)
+        """Score all parent rows against the query (unordered; see _apply_gap_cutoff)."""
+        q_normalized = _normalize_query(query)
+        q_tokens = _tokenize_query(query)
         query_subject = self._detect_subject(q_tokens)
+        subject_normalized = normalize(query_subject) if query_subject else None
 
-        # Build document frequency and collect parent rows
-        doc_freq, parent_rows = self._build_doc_freq()
-        total_docs = len(parent_rows) or 1
+        # Document frequencies and title token sets are precomputed per sheet load
+        index = self._book_index()
 
-        # Calculate IDF for query tokens
+        # Calculate IDF for query tokens once per query (term -> idf)
         unique_q_tokens = list(set(q_tokens))
-        sum_idf_q = sum(_calculate_idf(t, doc_freq, total_docs) for t in unique_q_tokens) or 1
-
+        idf_q = {t: index.idf(t) for t in unique_q_tokens}
+        sum_idf_q = sum(idf_q.values()) or 1
+
+        # Sparse accumulation of title IDF hits via the token postings
+        # (row -> summed IDF of query tokens in its title). This single pass
+        # over the postings also yields the token-matched candidate rows.
+        idf_hits: dict[int, float] = {}
+        token_postings = index.token_postings
+        for t, idf in idf_q.items():
+            for i in token_postings.get(t, ()):
+                idf_hits[i] = idf_hits.get(i, 0) + idf
+
+        # Only rows that can score above zero are scored
+        rows = index.candidate_rows(q_normalized, idf_hits.keys(), subject_normalized)
+
+        ids, titles, subjects = index.ids, index.titles, index.subjects
+        norm_ids, norm_titles = index.normalized_ids, index.normalized_titles
+        norm_subjects = index.normalized_subjects
         candidates = []
-        for r in parent_rows:
-            score, reason = self._score_single(
-                r, q_normalized, unique_q_tokens, doc_freq, total_docs, sum_idf_q, query_subject
+        for i in rows:
+            score, reason = _score_row(
+                norm_ids[i], norm_titles[i], norm_subjects[i], idf_hits.get(i, 0),
+                q_normalized, sum_idf_q, subject_normalized,
             )
             if score > 0:
                 candidates.append({
-                    "book_id": r["id"],
-                    "title": r["title"],
-                    "subject": r["subject"],
+                    "book_id": ids[i],
+                    "title": titles[i],
+                    "subject": subjects[i],
                     "score": round(score, 4),
                     "reason": reason,
                 })
 
-        candidates.sort(key=lambda x: -x["score"])
         return candidates
 
-    def _build_doc_freq(self: "BooksHandler") -> tuple[dict[str, int], list[dict[str, Any]]]:
-        """Build document frequency map and parent row list."""
-        seen: set[str] = set()
-        doc_freq: dict[str, int] = defaultdict(int)
-        parent_rows: list[dict[str, Any]] = []
-
-        for row in self.values[1:]:
-            id_raw = str(self.get_cell(row, "id")).strip()
-            title_raw = str(self.get_cell(row, "title")).strip()
-            subject_raw = str(self.get_cell(row, "subject")).strip()
-
-            if not id_raw and not title_raw and not subject_raw:
-                continue
-            if not id_raw:  # Child row (chapter)
-                continue
-            if id_raw in seen:
-                continue
-            seen.add(id_raw)
-
-            parent_rows.append({
-                "id": id_raw,
-                "title": title_raw,
-                "subject": subject_raw,
-            })
-
-            # Count document frequency
-            tok_set = set(tokenize(title_raw))
-            for t in tok_set:
-                doc_freq[t] += 1
-
-        return doc_freq, parent_rows
-
-    def _detect_subject(self: "BooksHandler", tokens: list[str]) -> str | None:
-        """Detect subject keyword from query tokens."""
-        return next(
-            (k for k in self.SUBJECT_KEYS if k.lower() in [t.lower() for t in tokens]),
-            None
-        )
-
-    def _score_single(
-        self: "BooksHandler",
-        r: dict[str, Any],
-        q_normalized: str,
-        unique_q_tokens: list[str],
-        doc_freq: dict[str, int],
-        total_docs: int,
-        sum_idf_q: float,
-        query_subject: str | None,
-    ) -> tuple[float, str]:
-        """Score a single candidate against the query."""
-        from lib.common import normalize
-
-        hay = [normalize(r["id"]), normalize(r["title"]), normalize(r["subject"])]
-        hay = [h for h in hay if h and len(h) >= 2]
-
-        combined_norm = normalize(r["title"])
-        title_tok_set = set(tokenize(r["title"]))
-
-        # Calculate IDF coverage
-        idf_hit_fwd = sum(_calculate_idf(t, doc_freq, total_docs)
-                         for t in unique_q_tokens if t in title_tok_set)
-        cov_idf_fwd = idf_hit_fwd / sum_idf_q
-
-        # Base scoring
-        score = 0.0
-        reason = ""
-
-        if any(h == q_normalized for h in hay):
-            score = 1.0
-            reason = "exact"
-        elif q_normalized in combined_norm:
-            score = 0.95
-            reason = "phrase"
-        elif any(q_normalized in h for h in hay):
-            score = 0.90
-            reason = "partial_target"
-        elif cov_idf_fwd > 0:
-            score = 0.80
-            reason = "coverage_q_in_title"
-        else:
-            short = q_normalized[:3] if len(q_normalized) >= 3 else ""
-            if short and any(short in h for h in hay):
-                score = 0.72
-                reason = "fuzzy3"
-
-        # Bonus
-        bonus = 0.0
-        if cov_idf_fwd > 0:
-            bonus += min(0.12, 0.12 * cov_idf_fwd)
-        if combined_norm.startswith(q_normalized):
-            bonus += 0.02
-        if query_subject and normalize(query_subject) == normalize(r["subject"]):
-            bonus += 0.02
-
-        return min(1, score + bonus), reason
+    def _detect_subject(self: "BooksHandler", tokens: Sequence[str]) -> str | None:
+        """
+        Detect subject keyword from query tokens.
+
+        One dict probe per token; when several tokens are subjects, the one
+        listed first in SUBJECT_KEYS wins.
+        """
+        ranks = self.SUBJECT_KEY_RANKS
+        hits = [ranks[f] for f in (t.casefold() for t in tokens) if f in ranks]
+        return self.SUBJECT_KEYS[min(hits)] if hits else None
 
     def _apply_gap_cutoff(self: "BooksHandler", candidates: list[dict], limit: int) -> list[dict]:
-        """Apply score gap cutoff and limit."""
+        """
+        Rank candidates, then apply score gap cutoff and limit.
+
+        Only the top limit + 1 entries can affect the result, so they are
+        selected with a partial sort (heapq.nlargest is stable, matching a
+        full descending sort) and the gap scan runs on those alone.
+        """
         min_gap = 0.05
-        cut_index = len(candidates)
-        for i in range(len(candidates) - 1):
-            if candidates[i]["score"] - candidates[i + 1]["score"] >= min_gap:
+        n = limit + 1 if limit >= 0 else len(candidates)  # negative limit slices from the end
+        top = heapq.nlargest(n, candidates, key=lambda x: x["score"])
+        cut_index = len(top)
+        for i in range(len(top) - 1):
+            if top[i]["score"] - top[i + 1]["score"] >= min_gap:
                 cut_index = i + 1
                 break
 
-        return candidates[:min(limit, cut_index)]
+        return top[:min(limit, cut_index)]
 
     def _calculate_confidence(self: "BooksHandler", sliced: list[dict]) -> float:
         """Calculate confidence score from top candidates."""
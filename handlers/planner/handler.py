@@ -7,7 +7,11 @@ Provides reading and writing operations for planner sheets.
 from __future__ import annotations
 
 import re
-from typing import Any, NamedTuple
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import takewhile
+from typing import Any, ClassVar, NamedTuple
 
 from sheets_client import SheetsClient
 from config import (
@@ -16,6 +20,7 @@ from config import (
     STUDENT_COLUMNS,
     WEEKLY_SHEET_NAMES,
     MONTHLY_SHEET_NAME,
+    MONTHLY_DATA_RANGE,
     MONTHPLAN_SHEET_NAME,
     MONTHPLAN_WEEK_COLUMNS,
     WEEK_METRICS_COLUMNS,
@@ -28,6 +33,19 @@ from lib.common import ok, ng, to_number_or_none
 from lib.sheet_utils import pick_col, norm_header, extract_spreadsheet_id
 
 
+# A-column planner code: month code (3-4 digits) followed by a book ID
+_BOOK_CODE_RE = re.compile(r"^(\d{3,4})(.+)$")
+# A4 of a weekly planner sheet starts with such a code
+_A4_CODE_RE = re.compile(r"^\d{3,4}.+")
+# Threads used to read A4 of each sheet when the batch read fails
+_A4_PROBE_WORKERS = 8
+# Columns A-R of a monthly planner row
+_MONTHLY_ROW_WIDTH = 18
+
+# How long a spreadsheet's weekly sheet name is reused before probing again (seconds)
+WEEKLY_SHEET_TTL_SECONDS = 300.0
+
+
 class PlannerSheetResult(NamedTuple):
     """Result of resolving and opening a planner sheet."""
     file_id: str | None
@@ -35,7 +53,7 @@ class PlannerSheetResult(NamedTuple):
     error: dict | None
 
 
-def _parse_book_code(raw: str) -> dict[str, Any]:
+def _parse_book_code(raw: str) -> tuple[int | None, str]:
     """
     Parse A column code like '261gEC001' into month_code and book_id.
 
@@ -43,19 +61,83 @@ def _parse_book_code(raw: str) -> dict[str, Any]:
         raw: Raw code string from A column
 
     Returns:
-        Dict with month_code (int or None) and book_id (str)
+        (month_code, book_id) - month_code is an int or None
     """
     s = str(raw or "").strip()
     if not s:
-        return {"month_code": None, "book_id": ""}
+        return None, ""
 
-    match = re.match(r"^(\d{3,4})(.+)$", s)
+    match = _BOOK_CODE_RE.match(s)
     if not match:
-        return {"month_code": None, "book_id": s}
+        return None, s
+
+    return int(match.group(1)), match.group(2)
+
+
+def _sheet_range(sheet_name: str, a1: str) -> str:
+    """A1 range qualified with a quoted sheet name, e.g. "'週間管理'!A4"."""
+    quoted = sheet_name.replace("'", "''")
+    return f"'{quoted}'!{a1}"
+
+
+def _a_cell(row: list[Any]) -> str:
+    """
+    Stripped A cell of a row ("" when the row or cell is empty).
+
+    Empty rows and cells return before any conversion; string cells skip
+    the str() call.
+    """
+    if not row:
+        return ""
+    a = row[0]
+    if a == "" or a is None:
+        return ""
+    return a.strip() if type(a) is str else str(a).strip()
+
+
+def _worksheet_a4(ws: Any) -> str:
+    """Stripped A4 text of a worksheet ("" when empty or unreadable)."""
+    try:
+        value = ws.acell("A4").value
+    except Exception:
+        return ""
+    return str(value or "").strip()
 
-    code = int(match.group(1))
-    book_id = match.group(2)
-    return {"month_code": code, "book_id": book_id}
+
+def _read_a4_concurrently(worksheets: list[Any]) -> list[str]:
+    """
+    A4 text of every worksheet, one request per sheet run on a thread pool.
+
+    Fallback for when the batch read is unavailable; results keep the
+    worksheet order so the first matching sheet still wins.
+    """
+    if not worksheets:
+        return []
+    workers = min(_A4_PROBE_WORKERS, len(worksheets))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_worksheet_a4, worksheets))
+
+
+def _first_value(values: list[list[Any]]) -> str:
+    """Stripped text of the top-left cell of a range read ("" when empty)."""
+    if values and values[0] and values[0][0] is not None:
+        return str(values[0][0]).strip()
+    return ""
+
+
+def _cell_int(value: Any) -> int | None:
+    """
+    Integer value of a cell, or None when blank or not an integer.
+
+    Int cells pass through; text (the formatted monthly read) is stripped
+    and checked with str.isdecimal before parsing, so non-numeric rows are
+    rejected without raising.
+    """
+    if isinstance(value, int):
+        return value
+    s = str(value).strip()
+    digits = s[1:] if s[:1] in ("-", "+") else s
+    return int(s) if digits.isdecimal() else None
 
 
 def _norm_year_2digit(year: Any) -> int | None:
@@ -83,6 +165,13 @@ class PlannerHandler:
     - monthly_filter: Monthly planner filtering
     """
 
+    # Students Master values list -> {student_id: planner spreadsheet ID}
+    _planner_ids: ClassVar[tuple[list[list[Any]], dict[str, str | None]] | None] = None
+
+    # Spreadsheet ID -> (expires_at on time.monotonic(), weekly planner sheet name).
+    # Names rarely change; the TTL bounds how long a renamed sheet is missed.
+    _weekly_sheet_names: ClassVar[dict[str, tuple[float, str]]] = {}
+
     def __init__(self, sheets: SheetsClient) -> None:
         """Initialize PlannerHandler with a SheetsClient."""
         self.sheets = sheets
@@ -145,9 +234,24 @@ class PlannerHandler:
 
         try:
             values = self.sheets.get_all_values(STUDENTS_MASTER_ID, STUDENTS_SHEET)
-            if len(values) < 2:
-                return None
+            return self._planner_id_map(values).get(student_id)
+        except Exception:
+            return None
+
+    def _planner_id_map(self, values: list[list[Any]]) -> dict[str, str | None]:
+        """
+        Map every student ID in the Students Master to its planner spreadsheet ID.
 
+        Built in one pass and reused for as long as SheetsClient returns the
+        same (cached) values list, so a lookup is a dict hit instead of a
+        header resolution and row scan per call.
+        """
+        cached = PlannerHandler._planner_ids
+        if cached is not None and cached[0] is values:
+            return cached[1]
+
+        planner_ids: dict[str, str | None] = {}
+        if len(values) >= 2:
             headers = [str(h) for h in values[0]]
             idx_id = pick_col(headers, STUDENT_COLUMNS["id"])
             idx_planner = pick_col(headers, STUDENT_COLUMNS["planner_sheet_id"])
@@ -163,49 +267,88 @@ class PlannerHandler:
 
             for row in values[1:]:
                 id_val = str(row[idx_id]).strip() if idx_id >= 0 and idx_id < len(row) else ""
-                if id_val != student_id:
-                    continue
+                if id_val in planner_ids:
+                    continue  # First row of an ID wins
+
+                planner_id = None
 
                 # Try planner_sheet_id column
                 if idx_planner >= 0 and idx_planner < len(row):
-                    planner_id = str(row[idx_planner]).strip()
-                    if planner_id:
-                        return planner_id
+                    planner_id = str(row[idx_planner]).strip() or None
 
                 # Try link column
-                if idx_link >= 0 and idx_link < len(row):
+                if planner_id is None and idx_link >= 0 and idx_link < len(row):
                     link = str(row[idx_link]).strip()
-                    extracted = extract_spreadsheet_id(link)
-                    if extracted:
-                        return extracted
+                    planner_id = extract_spreadsheet_id(link) or None
 
-                return None
+                planner_ids[id_val] = planner_id
 
-            return None
-        except Exception:
-            return None
+        PlannerHandler._planner_ids = (values, planner_ids)
+        return planner_ids
 
     def _find_weekly_sheet(self, spreadsheet_id: str) -> str | None:
-        """Find the weekly planner sheet name in a spreadsheet."""
+        """
+        Find the weekly planner sheet name in a spreadsheet.
+
+        A found name is remembered per spreadsheet ID for
+        WEEKLY_SHEET_TTL_SECONDS, so later calls make no probing requests
+        (see invalidate_weekly_sheet). After that the sheets are probed
+        again, picking up a renamed or deleted sheet.
+        """
+        cached = self._weekly_sheet_names.get(spreadsheet_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        name = self._probe_weekly_sheet(spreadsheet_id)
+        if name is not None:
+            expires_at = time.monotonic() + WEEKLY_SHEET_TTL_SECONDS
+            self._weekly_sheet_names[spreadsheet_id] = (expires_at, name)
+        else:
+            self._weekly_sheet_names.pop(spreadsheet_id, None)
+        return name
+
+    @classmethod
+    def invalidate_weekly_sheet(cls, spreadsheet_id: str | None = None) -> None:
+        """Forget the weekly sheet name of one spreadsheet (or of all), e.g. after a rename."""
+        if spreadsheet_id is None:
+            cls._weekly_sheet_names.clear()
+        else:
+            cls._weekly_sheet_names.pop(spreadsheet_id, None)
+
+    def _probe_weekly_sheet(self, spreadsheet_id: str) -> str | None:
+        """
+        Look up the weekly planner sheet name through the Sheets API.
+
+        Sheet titles come from one metadata request; when none of the known
+        names exists, every sheet's A4 is read in one batch request.
+        """
         try:
             ss = self.sheets.open_by_id(spreadsheet_id)
+            worksheets = ss.worksheets()
+            titles = [ws.title for ws in worksheets]
 
             # Try known sheet names
+            known = set(titles)
             for name in WEEKLY_SHEET_NAMES:
-                try:
-                    ss.worksheet(name)
+                if name in known:
                     return name
-                except Exception:
-                    continue
+
+            if not titles:
+                return None
 
             # Scan sheets for planner pattern (A4 matches month code + ID pattern)
-            for ws in ss.worksheets():
-                try:
-                    a4 = ws.acell("A4").value
-                    if a4 and re.match(r"^\d{3,4}.+", str(a4).strip()):
-                        return ws.title
-                except Exception:
-                    continue
+            try:
+                batch = ss.values_batch_get([_sheet_range(t, "A4") for t in titles])
+                a4_values = [
+                    _first_value(value_range.get("values", []))
+                    for value_range in batch.get("valueRanges", [])
+                ]
+            except Exception:
+                a4_values = _read_a4_concurrently(worksheets)
+
+            for title, a4 in zip(titles, a4_values):
+                if a4 and _A4_CODE_RE.match(a4):
+                    return title
 
             return None
         except Exception:
@@ -234,23 +377,21 @@ class PlannerHandler:
         except Exception as e:
             return ng("planner.ids_list", "ERROR", str(e))
 
-        items = []
-        for i, row in enumerate(abcd):
-            r = PLANNER_START_ROW + i
-            a = str(row[0]).strip() if len(row) > 0 else ""
-            if not a:
-                break  # Stop at first empty A cell
+        # A codes up to (not including) the first empty A cell; zip stops there
+        codes = takewhile(bool, map(_a_cell, abcd))
 
+        items = []
+        for r, (a, row) in enumerate(zip(codes, abcd), PLANNER_START_ROW):
             b = str(row[1]).strip() if len(row) > 1 else ""
             c = str(row[2]).strip() if len(row) > 2 else ""
             d = str(row[3]).strip() if len(row) > 3 else ""
 
-            parsed = _parse_book_code(a)
+            month_code, book_id = _parse_book_code(a)
             items.append({
                 "row": r,
                 "raw_code": a,
-                "month_code": parsed["month_code"],
-                "book_id": parsed["book_id"],
+                "month_code": month_code,
+                "book_id": book_id,
                 "subject": b,
                 "title": c,
                 "guideline_note": d,
@@ -271,9 +412,11 @@ class PlannerHandler:
         fid, sname = result.file_id, result.sheet_name
 
         try:
+            # All five header cells in one request
+            cell_values = self.sheets.batch_get(fid, sname, WEEK_START_CELLS)
             week_starts = []
-            for cell_addr in WEEK_START_CELLS:
-                val = self.sheets.get_cell(fid, sname, cell_addr)
+            for vals in cell_values:
+                val = vals[0][0] if vals and vals[0] else None
                 week_starts.append(str(val) if val else "")
 
             return ok("planner.dates.get", {"week_starts": week_starts})
@@ -315,12 +458,16 @@ class PlannerHandler:
         fid, sname = result.file_id, result.sheet_name
 
         try:
-            weeks = []
-            for week_idx in range(1, 6):
-                cols = WEEK_METRICS_COLUMNS[week_idx]
-                range_notation = f"{cols['time']}{PLANNER_START_ROW}:{cols['guide']}{PLANNER_END_ROW}"
-                vals = self.sheets.get_range(fid, sname, range_notation)
+            # All five weeks' time:guide ranges in one request
+            week_cols = [WEEK_METRICS_COLUMNS[w] for w in range(1, 6)]
+            ranges = [
+                f"{cols['time']}{PLANNER_START_ROW}:{cols['guide']}{PLANNER_END_ROW}"
+                for cols in week_cols
+            ]
+            week_values = self.sheets.batch_get(fid, sname, ranges)
 
+            weeks = []
+            for week_idx, (cols, vals) in enumerate(zip(week_cols, week_values), 1):
                 items = []
                 for j, row in enumerate(vals):
                     r = PLANNER_START_ROW + j
@@ -356,12 +503,13 @@ class PlannerHandler:
         fid, sname = result.file_id, result.sheet_name
 
         try:
-            weeks = []
-            for week_idx in range(1, 6):
-                col = WEEK_METRICS_COLUMNS[week_idx]["plan"]
-                range_notation = f"{col}{PLANNER_START_ROW}:{col}{PLANNER_END_ROW}"
-                vals = self.sheets.get_range(fid, sname, range_notation)
+            # All five weeks' plan columns in one request
+            plan_cols = [WEEK_METRICS_COLUMNS[w]["plan"] for w in range(1, 6)]
+            ranges = [f"{col}{PLANNER_START_ROW}:{col}{PLANNER_END_ROW}" for col in plan_cols]
+            week_values = self.sheets.batch_get(fid, sname, ranges)
 
+            weeks = []
+            for week_idx, (col, vals) in enumerate(zip(plan_cols, week_values), 1):
                 items = []
                 for j, row in enumerate(vals):
                     r = PLANNER_START_ROW + j
@@ -402,18 +550,20 @@ class PlannerHandler:
 
         fid, sname = result.file_id, result.sheet_name
 
-        # Read ABCD for book_id resolution
-        try:
-            abcd = self.sheets.get_range(fid, sname, "A4:D30")
-        except Exception as e:
-            return ng("planner.plan.set", "ERROR", str(e))
-
-        # Build book_id -> row map
-        book_row_map = self._build_book_row_map(abcd)
-
         # Single mode
         if items is None:
-            return self._plan_set_single(fid, sname, week_index, plan_text, row, book_id, overwrite, book_row_map)
+            return self._plan_set_single(fid, sname, week_index, plan_text, row, book_id, overwrite)
+
+        # Read ABCD only if some item must be resolved from its book_id
+        book_row_map: dict[str, int] = {}
+        if any(not it.get("row") and it.get("book_id") for it in items):
+            try:
+                abcd = self.sheets.get_range(fid, sname, "A4:D30")
+            except Exception as e:
+                return ng("planner.plan.set", "ERROR", str(e))
+
+            # Build book_id -> row map
+            book_row_map = self._build_book_row_map(abcd)
 
         # Batch mode
         return self._plan_set_batch(fid, sname, items, overwrite, book_row_map)
@@ -422,12 +572,12 @@ class PlannerHandler:
         """Build a mapping from book_id to row number."""
         book_row_map = {}
         for i, abcd_row in enumerate(abcd):
-            a = str(abcd_row[0]).strip() if len(abcd_row) > 0 else ""
+            a = _a_cell(abcd_row)
             if not a:
                 break
-            parsed = _parse_book_code(a)
-            if parsed["book_id"]:
-                book_row_map[parsed["book_id"]] = PLANNER_START_ROW + i
+            _, book_id = _parse_book_code(a)
+            if book_id:
+                book_row_map[book_id] = PLANNER_START_ROW + i
         return book_row_map
 
     def _plan_set_single(
@@ -439,9 +589,13 @@ class PlannerHandler:
         row: int | None,
         book_id: str | None,
         overwrite: bool,
-        book_row_map: dict[str, int],
     ) -> dict[str, Any]:
-        """Set plan text in single mode."""
+        """
+        Set plan text in single mode.
+
+        ABCD is read only when the row must be resolved from book_id; the
+        precondition cells are then read with one batch_get.
+        """
         if not week_index or week_index < 1 or week_index > 5:
             return ng("planner.plan.set", "BAD_REQUEST", "week_index must be 1..5")
 
@@ -452,27 +606,32 @@ class PlannerHandler:
         # Resolve row
         target_row = row
         if not target_row and book_id:
-            target_row = book_row_map.get(str(book_id))
+            try:
+                abcd = self.sheets.get_range(fid, sname, "A4:D30")
+            except Exception as e:
+                return ng("planner.plan.set", "ERROR", str(e))
+            target_row = self._build_book_row_map(abcd).get(str(book_id))
 
         if not target_row:
             return ng("planner.plan.set", "ROW_NOT_FOUND", "row or book_id did not match any row")
 
         cols = WEEK_METRICS_COLUMNS[week_index]
+        plan_cell = f"{cols['plan']}{target_row}"
 
         try:
+            # A, weekly minutes and current plan in one request
+            cells = self.sheets.batch_get(fid, sname, [f"A{target_row}", f"{cols['time']}{target_row}", plan_cell])
+            a_val, time_val, current = (_first_value(v) for v in cells)
+
             # Check preconditions
-            a_val = self.sheets.get_cell(fid, sname, f"A{target_row}")
-            if not str(a_val or "").strip():
+            if not a_val:
                 return ng("planner.plan.set", "PRECONDITION_A_EMPTY", "A[row] must not be empty")
 
-            time_val = self.sheets.get_cell(fid, sname, f"{cols['time']}{target_row}")
-            if not str(time_val or "").strip():
+            if not time_val:
                 return ng("planner.plan.set", "PRECONDITION_TIME_EMPTY",
                          f"weekly_minutes cell ({cols['time']}{target_row}) must not be empty")
 
             # Check existing
-            plan_cell = f"{cols['plan']}{target_row}"
-            current = str(self.sheets.get_cell(fid, sname, plan_cell) or "").strip()
             if not overwrite and current:
                 return ng("planner.plan.set", "ALREADY_EXISTS", "cell already has text; set overwrite=true to replace")
 
@@ -489,9 +648,15 @@ class PlannerHandler:
         default_overwrite: bool,
         book_row_map: dict[str, int],
     ) -> dict[str, Any]:
-        """Set plan text in batch mode."""
-        results = []
-        updates_by_col: dict[str, list[tuple[int, str]]] = {}
+        """
+        Set plan text in batch mode.
+
+        Preconditions for every item are read with one batch_get and all
+        accepted cells are written with one batch_update.
+        """
+        results: list[dict | None] = []
+        # (result index, target_row, week columns, plan text, overwrite)
+        pending: list[tuple[int, int, dict[str, str], str, bool]] = []
 
         for item in items:
             wk = item.get("week_index")
@@ -516,42 +681,54 @@ class PlannerHandler:
                 results.append({"ok": False, "error": {"code": "ROW_NOT_FOUND", "message": "row or book_id did not match"}})
                 continue
 
-            cols = WEEK_METRICS_COLUMNS[wk]
+            # One bad address would fail the shared batch request for every item
+            target_row = _cell_int(target_row)
+            if target_row is None or not PLANNER_START_ROW <= target_row <= PLANNER_END_ROW:
+                results.append({"ok": False, "error": {"code": "BAD_ROW",
+                               "message": f"row must be {PLANNER_START_ROW}..{PLANNER_END_ROW}"}})
+                continue
+
+            pending.append((len(results), target_row, WEEK_METRICS_COLUMNS[wk], txt, ow))
+            results.append(None)  # Filled in once the preconditions are read
+
+        # Read the precondition cells of every pending item in one request.
+        # Each address is read once however many items share it; the plan
+        # cell is only needed when the item may not overwrite.
+        positions: dict[str, int] = {}
+        for _, target_row, cols, _, ow in pending:
+            addrs = [f"A{target_row}", f"{cols['time']}{target_row}"]
+            if not ow:
+                addrs.append(f"{cols['plan']}{target_row}")
+            for addr in addrs:
+                positions.setdefault(addr, len(positions))
+        try:
+            cells = self.sheets.batch_get(fid, sname, list(positions))
+        except Exception as e:
+            return ng("planner.plan.set", "ERROR", str(e))
+
+        def cell_text(addr: str) -> str:
+            return _first_value(cells[positions[addr]])
+
+        updates: list[dict[str, Any]] = []
+        for i, target_row, cols, txt, ow in pending:
             cell_a1 = f"{cols['plan']}{target_row}"
 
+            if not cell_text(f"A{target_row}"):
+                results[i] = {"ok": False, "error": {"code": "PRECONDITION_A_EMPTY", "message": "A[row] must not be empty"}}
+            elif not cell_text(f"{cols['time']}{target_row}"):
+                results[i] = {"ok": False, "error": {"code": "PRECONDITION_TIME_EMPTY", "message": "weekly_minutes cell empty"}}
+            elif not ow and cell_text(cell_a1):
+                results[i] = {"ok": False, "cell": cell_a1, "error": {"code": "ALREADY_EXISTS", "message": "cell already has text"}}
+            else:
+                updates.append({"range": cell_a1, "values": [[txt]]})
+                results[i] = {"ok": True, "cell": cell_a1}
+
+        # Apply all accepted writes in one request, parsed like update_cell in single mode
+        if updates:
             try:
-                # Check preconditions
-                a_val = self.sheets.get_cell(fid, sname, f"A{target_row}")
-                if not str(a_val or "").strip():
-                    results.append({"ok": False, "error": {"code": "PRECONDITION_A_EMPTY", "message": "A[row] must not be empty"}})
-                    continue
-
-                time_val = self.sheets.get_cell(fid, sname, f"{cols['time']}{target_row}")
-                if not str(time_val or "").strip():
-                    results.append({"ok": False, "error": {"code": "PRECONDITION_TIME_EMPTY", "message": "weekly_minutes cell empty"}})
-                    continue
-
-                current = str(self.sheets.get_cell(fid, sname, cell_a1) or "").strip()
-                if not ow and current:
-                    results.append({"ok": False, "cell": cell_a1, "error": {"code": "ALREADY_EXISTS", "message": "cell already has text"}})
-                    continue
-
-                # Add to updates
-                col = cols["plan"]
-                if col not in updates_by_col:
-                    updates_by_col[col] = []
-                updates_by_col[col].append((target_row, txt))
-                results.append({"ok": True, "cell": cell_a1})
+                self.sheets.batch_update(fid, sname, updates, value_input_option="USER_ENTERED")
             except Exception as e:
-                results.append({"ok": False, "error": {"code": "ERROR", "message": str(e)}})
-
-        # Apply batch updates
-        for col, row_vals in updates_by_col.items():
-            for target_row, txt in row_vals:
-                try:
-                    self.sheets.update_cell(fid, sname, f"{col}{target_row}", txt)
-                except Exception:
-                    pass  # Already logged in results
+                return ng("planner.plan.set", "ERROR", str(e))
 
         return ok("planner.plan.set", {"updated": True, "results": results})
 
@@ -624,11 +801,11 @@ class PlannerHandler:
             return ng(op, "NOT_FOUND", f"monthly sheet not found: {e}")
 
         try:
-            all_values = ws.get_all_values()
-            if len(all_values) <= 1:
+            rows = ws.get(MONTHLY_DATA_RANGE)  # Formatted: week cells keep their display text
+            if not rows:
                 return ok(op, {"year": yy, "month": mm, "items": [], "count": 0})
 
-            items = self._parse_monthly_rows(all_values[1:], yy, mm)
+            items = self._parse_monthly_rows(rows, {(yy, mm)}).get((yy, mm), [])
 
             return ok(op, {
                 "year": yy,
@@ -681,8 +858,8 @@ class PlannerHandler:
             return ng(op, "NOT_FOUND", f"monthly sheet not found: {e}")
 
         try:
-            all_values = ws.get_all_values()
-            if len(all_values) <= 1:
+            rows = ws.get(MONTHLY_DATA_RANGE)  # Formatted: week cells keep their display text
+            if not rows:
                 return ok(op, {
                     "year_months": [{"year": yy, "month": mm} for yy, mm in normalized_ym],
                     "items": [],
@@ -694,8 +871,10 @@ class PlannerHandler:
             all_items: list[dict] = []
             by_month: dict[str, list[dict]] = {}
 
+            # One pass over the sheet buckets rows for every requested month
+            buckets = self._parse_monthly_rows(rows, set(normalized_ym))
             for yy, mm in normalized_ym:
-                items = self._parse_monthly_rows(all_values[1:], yy, mm)
+                items = buckets.get((yy, mm), [])
                 all_items.extend(items)
                 # Key format: "YY-MM" (e.g., "25-06")
                 key = f"{yy:02d}-{mm:02d}"
@@ -710,64 +889,65 @@ class PlannerHandler:
         except Exception as e:
             return ng(op, "ERROR", str(e))
 
-    def _parse_monthly_rows(self, rows: list[list], target_year: int, target_month: int) -> list[dict]:
-        """Parse monthly planner rows and filter by year/month."""
-        items = []
-
-        for i, row in enumerate(rows):
-            r = i + 2  # Sheet row number
-
-            a = str(row[0]) if len(row) > 0 else ""
-            b = str(row[1]).strip() if len(row) > 1 else ""
-            c = str(row[2]).strip() if len(row) > 2 else ""
+    def _parse_monthly_rows(
+        self,
+        rows: list[list],
+        targets: set[tuple[int, int]],
+    ) -> dict[tuple[int, int], list[dict]]:
+        """
+        Parse monthly planner rows and group them by (year, month).
 
-            if not a and not b and not c:
-                continue
+        Only rows whose (year, month) is in targets are parsed, in a single
+        pass however many months are requested.
+        """
+        buckets: dict[tuple[int, int], list[dict]] = defaultdict(list)
 
-            try:
-                b_num = int(b) if b else None
-                c_num = int(c) if c else None
-            except ValueError:
+        for i, row in enumerate(rows):
+            # Year/month decide the match, so test B/C before touching the rest
+            rl = len(row)
+            if rl < 3:
+                continue  # No year/month: blank or short rows never match
+
+            # Blank or non-integer cells give None, which no target matches
+            b_num = _cell_int(row[1])
+            c_num = _cell_int(row[2])
+            if (b_num, c_num) not in targets:
                 continue
 
-            if b_num != target_year or c_num != target_month:
-                continue
+            r = i + 2  # Sheet row number
 
-            # Extract additional columns (G-R)
-            book_id = str(row[6]) if len(row) > 6 else ""
-            subject = str(row[7]) if len(row) > 7 else ""
-            title = str(row[8]) if len(row) > 8 else ""
-            guideline_note = str(row[9]) if len(row) > 9 else ""
-            unit_load = to_number_or_none(row[10]) if len(row) > 10 else None
-            monthly_minutes = to_number_or_none(row[11]) if len(row) > 11 else None
-            guideline_amount = to_number_or_none(row[12]) if len(row) > 12 else None
+            # Pad once so every column A-R can be read without a length check
+            if rl < _MONTHLY_ROW_WIDTH:
+                row = row + [""] * (_MONTHLY_ROW_WIDTH - rl)
+            (a, _, _, _, _, _, book_id, subject, title, guideline_note,
+             unit_load, monthly_minutes, guideline_amount, *week_cells) = row[:_MONTHLY_ROW_WIDTH]
 
             # Week columns (N-R)
-            weeks = []
-            for j, col_idx in enumerate([13, 14, 15, 16, 17]):
-                actual = str(row[col_idx]) if len(row) > col_idx else ""
-                weeks.append({"index": j + 1, "actual": actual})
+            weeks = [
+                {"index": j, "actual": str(cell)}
+                for j, cell in enumerate(week_cells, 1)
+            ]
 
             # Calculate month code
-            month_code = (b_num * 10 + c_num) if b_num is not None and c_num is not None else None
+            month_code = b_num * 10 + c_num
 
-            items.append({
+            buckets[b_num, c_num].append({
                 "row": r,
-                "raw_code": a,
+                "raw_code": str(a),
                 "month_code": month_code,
                 "year": b_num,
                 "month": c_num,
-                "book_id": book_id,
-                "subject": subject,
-                "title": title,
-                "guideline_note": guideline_note,
-                "unit_load": unit_load,
-                "monthly_minutes": monthly_minutes,
-                "guideline_amount": guideline_amount,
+                "book_id": str(book_id),
+                "subject": str(subject),
+                "title": str(title),
+                "guideline_note": str(guideline_note),
+                "unit_load": to_number_or_none(unit_load),
+                "monthly_minutes": to_number_or_none(monthly_minutes),
+                "guideline_amount": to_number_or_none(guideline_amount),
                 "weeks": weeks,
             })
 
-        return items
+        return buckets
 
     # === Monthplan Operations ===
 
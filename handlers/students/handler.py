@@ -6,6 +6,8 @@ Implements student CRUD operations with two-phase update/delete.
 """
 from __future__ import annotations
 
+import heapq
+from itertools import islice
 from dataclasses import dataclass
 from typing import Any, ClassVar
 
@@ -14,8 +16,20 @@ from core.two_phase_mixin import TwoPhaseOperationMixin
 from sheets_client import SheetsClient
 from config import STUDENTS_MASTER_ID, STUDENTS_SHEET, STUDENT_COLUMNS
 from lib.common import normalize
-from lib.sheet_utils import norm_header, extract_spreadsheet_id
-from lib.id_rules import next_id_for_prefix, extract_ids_from_values
+from lib.sheet_utils import norm_header, extract_spreadsheet_id, row_range_updates
+from lib.id_rules import next_id_for_prefix
+
+
+def _is_blank_row(row: list[Any]) -> bool:
+    """
+    True if every cell of a row is empty or whitespace.
+
+    Rows of only "" / None are caught by the C-level any(); otherwise the
+    per-cell strip check stops at the first non-blank cell (usually the ID).
+    """
+    if not any(row):
+        return all(c == "" or c is None for c in row)  # 0 / False are not blank
+    return not any(str(c).strip() for c in row)
 
 
 @dataclass
@@ -84,35 +98,56 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
         if len(self.values) < 2:
             return self._ok("students.list", {"students": [], "count": 0})
 
+        # Rows past the limit are never converted
+        max_results = limit if limit and limit > 0 else len(self.values)
+        cols = self._student_columns()
         students: list[dict] = []
-        for row in self.values[1:]:
-            if not any(str(c).strip() for c in row):
+        for row in islice(self.values, 1, None):
+            if _is_blank_row(row):
                 continue
-            students.append(self._row_to_student(row))
-
-        if limit and limit > 0:
-            students = students[:limit]
+            students.append(self._row_to_student(row, cols))
+            if len(students) >= max_results:
+                break
 
         return self._ok("students.list", {"students": students, "count": len(students)})
 
-    def _row_to_student(self, row: list[Any]) -> dict[str, Any]:
-        """Convert a row to a student dict with planner ID extraction."""
-        planner_link = str(self.get_cell(row, "planner_link"))
-        planner_sheet_id = str(self.get_cell(row, "planner_sheet_id"))
+    def _student_columns(self) -> tuple[int, ...]:
+        """Column indices of the student fields, in COLUMN_SPEC order (once per values)."""
+        return self.sheet_memo(
+            "student_columns",
+            lambda: tuple(self.column_indices.get(k, -1) for k in self.COLUMN_SPEC),
+        )
+
+    def _row_to_student(
+        self, row: list[Any], cols: tuple[int, ...] | None = None
+    ) -> dict[str, Any]:
+        """
+        Convert a row to a student dict with planner ID extraction.
+
+        Callers converting many rows pass cols from _student_columns() so
+        the column lookup is done once instead of per field and row.
+        """
+        if cols is None:
+            cols = self._student_columns()
+        id_i, name_i, grade_i, status_i, link_i, sheet_id_i, doc_i, tags_i = cols
+        get = self._get_cell_by_index
+
+        planner_link = str(get(row, link_i))
+        planner_sheet_id = str(get(row, sheet_id_i))
 
         # Extract planner ID from link if not explicitly set
         if not planner_sheet_id and planner_link:
             planner_sheet_id = extract_spreadsheet_id(planner_link) or ""
 
         return {
-            "id": str(self.get_cell(row, "id")).strip(),
-            "name": str(self.get_cell(row, "name")),
-            "grade": str(self.get_cell(row, "grade")),
-            "status": str(self.get_cell(row, "status")),
+            "id": str(get(row, id_i)).strip(),
+            "name": str(get(row, name_i)),
+            "grade": str(get(row, grade_i)),
+            "status": str(get(row, status_i)),
             "planner_sheet_id": planner_sheet_id,
             "planner_link": planner_link,
-            "meeting_doc": str(self.get_cell(row, "meeting_doc")),
-            "tags": str(self.get_cell(row, "tags")),
+            "meeting_doc": str(get(row, doc_i)),
+            "tags": str(get(row, tags_i)),
         }
 
     # === Find ===
@@ -143,9 +178,11 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
         q = normalize(query)
         candidates = self._score_candidates_simple(q)
 
-        candidates.sort(key=lambda x: -x["score"])
+        # Partial sort when limited (heapq.nlargest is stable, like the full sort)
         if limit and limit > 0:
-            candidates = candidates[:limit]
+            candidates = heapq.nlargest(limit, candidates, key=lambda x: x["score"])
+        else:
+            candidates.sort(key=lambda x: -x["score"])
 
         return self._ok("students.find", {
             "query": query,
@@ -158,21 +195,24 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
         """Score candidates with simple exact/partial matching."""
         candidates: list[dict] = []
 
-        for row in self.values[1:]:
-            id_val = str(self.get_cell(row, "id")).strip()
-            name_val = str(self.get_cell(row, "name")).strip()
-
+        # Normalized ID/name columns are built once per loaded values
+        columns = zip(
+            self.column_values("id"),
+            self.column_values("name"),
+            self.normalized_column_values("id"),
+            self.normalized_column_values("name"),
+        )
+        for id_val, name_val, id_norm, name_norm in columns:
             if not id_val and not name_val:
                 continue
 
-            hay = [normalize(id_val), normalize(name_val)]
             score = 0.0
             reason = ""
 
-            if any(h == query_normalized for h in hay):
+            if query_normalized == id_norm or query_normalized == name_norm:
                 score = 1.0
                 reason = "exact"
-            elif any(query_normalized in h for h in hay):
+            elif query_normalized in id_norm or query_normalized in name_norm:
                 score = 0.9
                 reason = "partial"
 
@@ -208,12 +248,12 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
 
         target = str(student_id).strip()
 
-        for row in self.values[1:]:
-            id_val = str(self.get_cell(row, "id")).strip()
-            if id_val == target:
-                return self._ok("students.get", {"student": self._row_to_student(row)})
+        row_index = self.find_row_by_id("id", target)
+        if row_index is None:
+            return self._error("students.get", "NOT_FOUND", f"student '{target}' not found")
 
-        return self._error("students.get", "NOT_FOUND", f"student '{target}' not found")
+        student = self._row_to_student(self.values[row_index - 1])
+        return self._ok("students.get", {"student": student})
 
     def get_multiple(self, student_ids: list[str]) -> dict[str, Any]:
         """
@@ -234,12 +274,16 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
             return error
 
         want = set(str(x).strip() for x in student_ids)
+        cols = self._student_columns()
         results: list[dict] = []
 
-        for row in self.values[1:]:
-            id_val = str(self.get_cell(row, "id")).strip()
+        # Stop as soon as every requested ID has been found
+        for row, id_val in zip(islice(self.values, 1, None), self.column_values("id")):
             if id_val and id_val in want:
-                results.append(self._row_to_student(row))
+                results.append(self._row_to_student(row, cols))
+                want.discard(id_val)
+                if not want:
+                    break
 
         return self._ok("students.get", {"students": results})
 
@@ -271,7 +315,8 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
 
         # Use BaseHandler.filter_by_conditions() for filtering
         filtered = self.filter_by_conditions(where, contains, limit)
-        results = [self._row_to_student(row) for _, row in filtered]
+        cols = self._student_columns()
+        results = [self._row_to_student(row, cols) for _, row in filtered]
 
         return self._ok("students.filter", {"students": results, "count": len(results)})
 
@@ -292,22 +337,61 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
         Returns:
             Response with new student ID
         """
-        error = self.load_sheet("students.create")
+        error = self.load_sheet("students.create", fresh=True)
         if error:
             return error
 
-        # Generate new ID
-        prefix = id_prefix.strip() if id_prefix else "s"
-        existing_ids = extract_ids_from_values(self.values, self.column_indices.get("id", -1))
-        new_id = next_id_for_prefix(prefix, existing_ids)
+        new_id = self._append_students([record or {}], id_prefix)[0]
 
-        # Build new row
-        new_row = self._build_create_row(new_id, record or {})
+        return self._ok("students.create", {"id": new_id, "created": True})
 
-        # Append row
-        self.sheets.append_rows(self.file_id, self.sheet_name, [new_row])
+    def create_many(
+        self,
+        records: list[dict],
+        id_prefix: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Create several students with a single append.
 
-        return self._ok("students.create", {"id": new_id, "created": True})
+        Args:
+            records: Student data dicts, one per new student
+            id_prefix: Custom ID prefix (default: "s")
+
+        Returns:
+            Response with the new student IDs, in records order
+        """
+        if not records:
+            return self._error("students.create_many", "BAD_REQUEST", "records is required")
+
+        error = self.load_sheet("students.create_many", fresh=True)
+        if error:
+            return error
+
+        new_ids = self._append_students(records, id_prefix)
+
+        return self._ok("students.create_many", {
+            "ids": new_ids, "count": len(new_ids), "created": True,
+        })
+
+    def _append_students(self, records: list[dict], id_prefix: str | None) -> list[str]:
+        """
+        Assign new IDs to records and append their rows in one request.
+
+        Existing IDs are scanned once; later IDs advance from the previous
+        new one instead of re-reading the sheet.
+        """
+        prefix = id_prefix.strip() if id_prefix else "s"
+        new_id = next_id_for_prefix(prefix, list(self.column_values("id")))
+
+        new_ids: list[str] = []
+        new_rows: list[list[Any]] = []
+        for record in records:
+            new_ids.append(new_id)
+            new_rows.append(self._build_create_row(new_id, record))
+            new_id = next_id_for_prefix(prefix, [new_id])
+
+        self.sheets.append_rows(self.file_id, self.sheet_name, new_rows)
+        return new_ids
 
     def _build_create_row(self, new_id: str, record: dict) -> list[Any]:
         """Build a new row for student creation."""
@@ -317,7 +401,7 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
             new_row[idx_id] = new_id
 
         # Copy from record using normalized header matching
-        norm_map = {norm_header(h): i for i, h in enumerate(self.headers)}
+        norm_map = self._header_norm_map()
         for k, v in record.items():
             ci = norm_map.get(norm_header(k), -1)
             if ci >= 0:
@@ -325,6 +409,18 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
 
         return new_row
 
+    def _header_norm_map(self) -> dict[str, int]:
+        """
+        Map norm_header(header) -> column index, built once per values.
+
+        A repeated header maps to its last column, as record/update keys
+        always have.
+        """
+        return self.sheet_memo(
+            "header_norm_map",
+            lambda: {norm_header(h): i for i, h in enumerate(self.headers)},
+        )
+
     # === Update (Two-phase) ===
 
     def update(
@@ -349,7 +445,7 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
         if not student_id:
             return self._error(op, "BAD_REQUEST", "student_id is required")
 
-        error = self.load_sheet(op)
+        error = self.load_sheet(op, fresh=True)
         if error:
             return error
 
@@ -388,12 +484,11 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
         return self._execute_update(op, result["payload"])
 
     def _find_student_row(self, target_id: str) -> int:
-        """Find the 1-based row index for a student."""
-        for i, row in enumerate(self.values[1:], 2):
-            id_val = str(self.get_cell(row, "id")).strip()
-            if id_val == target_id:
-                return i
-        return -1
+        """Find the 1-based row index for a student (-1 if not found)."""
+        if not target_id.strip():
+            return -1
+        row_index = self.find_row_by_id("id", target_id)
+        return row_index if row_index is not None else -1
 
     def _build_update_preview(
         self,
@@ -409,7 +504,7 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
         """
         current_row = self.values[row_index - 1]  # 0-indexed
         diffs = {}
-        norm_map = {norm_header(h): i for i, h in enumerate(self.headers)}
+        norm_map = self._header_norm_map()
 
         for k, v in updates.items():
             ci = norm_map.get(norm_header(k), -1)
@@ -430,14 +525,15 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
         """Apply confirmed update."""
         updates_to_apply = payload["updates"]
         row_index = payload["row_index"]
-        norm_map = {norm_header(h): i for i, h in enumerate(self.headers)}
+        norm_map = self._header_norm_map()
 
-        update_requests = []
+        # Changed cells of the row, written as contiguous ranges
+        cells: dict[int, Any] = {}
         for k, v in updates_to_apply.items():
             ci = norm_map.get(norm_header(k), -1)
             if ci >= 0:
-                cell = f"{chr(ord('A') + ci)}{row_index}"
-                update_requests.append({"range": cell, "values": [[v]]})
+                cells[ci] = v
+        update_requests = row_range_updates(row_index, cells, self.col_letter)
 
         if update_requests:
             self.sheets.batch_update(self.file_id, self.sheet_name, update_requests)
@@ -466,7 +562,7 @@ class StudentsHandler(BaseHandler, TwoPhaseOperationMixin):
         if not student_id:
             return self._error(op, "BAD_REQUEST", "student_id is required")
 
-        error = self.load_sheet(op)
+        error = self.load_sheet(op, fresh=True)
         if error:
             return error
 
@@ -4,6 +4,8 @@ Preview/Confirm cache for two-phase operations.
 Provides a shared cache for update/delete preview tokens,
 replacing duplicate implementations in books.py and students.py.
 """
+import threading
+import time
 import uuid
 from typing import Any
 
@@ -12,6 +14,10 @@ class PreviewCache:
     """
     Thread-safe in-memory cache for preview/confirm tokens.
 
+    Entries expire ttl_seconds after they are stored; expired tokens are
+    never returned. At most maxsize entries are kept: a full cache first
+    drops expired entries, then the oldest ones.
+
     Usage:
         cache = PreviewCache()
 
@@ -24,16 +30,21 @@ class PreviewCache:
             # Token expired or invalid
     """
 
-    def __init__(self, ttl_seconds: int = 300) -> None:
+    def __init__(self, ttl_seconds: int = 300, maxsize: int = 10000) -> None:
         """
         Initialize cache with TTL.
 
         Args:
-            ttl_seconds: Time-to-live for cached entries (default 5 minutes).
-                         Note: TTL is advisory; cleanup not automatic.
+            ttl_seconds: Time-to-live for cached entries (default 5 minutes)
+            maxsize: Maximum number of entries kept (default 10000)
         """
-        self._cache: dict[str, Any] = {}
+        # Keyed by (prefix, token): no per-call string building, and a prefix
+        # can be cleared without parsing keys. Values are (expires_at, data)
+        # on the time.monotonic() clock, in insertion (= expiry) order.
+        self._cache: dict[tuple[str, str], tuple[float, Any]] = {}
         self._ttl_seconds = ttl_seconds
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
 
     @property
     def ttl_seconds(self) -> int:
@@ -42,12 +53,12 @@ class PreviewCache:
 
     @property
     def size(self) -> int:
-        """Get current number of cached entries."""
+        """Get current number of cached entries (expired ones not yet evicted included)."""
         return len(self._cache)
 
-    def _make_key(self, prefix: str, token: str) -> str:
+    def _make_key(self, prefix: str, token: str) -> tuple[str, str]:
         """Create internal cache key from prefix and token."""
-        return f"{prefix}:{token}"
+        return (prefix, token)
 
     def store(
         self,
@@ -70,9 +81,31 @@ class PreviewCache:
             token = str(uuid.uuid4())
 
         key = self._make_key(prefix, token)
-        self._cache[key] = data
+        with self._lock:
+            self._cache.pop(key, None)  # Re-stored keys move to the end
+            if len(self._cache) >= self._maxsize:
+                self._evict(time.monotonic())
+            self._cache[key] = (time.monotonic() + self._ttl_seconds, data)
         return token
 
+    def _evict(self, now: float) -> None:
+        """
+        Make room for one entry (caller holds the lock).
+
+        Entries are in expiry order, so expired ones are a prefix of the
+        dict; if none has expired the oldest entries are dropped instead.
+        """
+        cache = self._cache
+        expired = []
+        for key, (expires_at, _) in cache.items():
+            if expires_at > now:
+                break
+            expired.append(key)
+        for key in expired:
+            del cache[key]
+        while cache and len(cache) >= self._maxsize:
+            del cache[next(iter(cache))]
+
     def get(self, prefix: str, token: str) -> dict[str, Any] | None:
         """
         Get cached data without removing it.
@@ -82,10 +115,13 @@ class PreviewCache:
             token: Token from store()
 
         Returns:
-            Cached data or None if not found
+            Cached data or None if not found or expired
         """
         key = self._make_key(prefix, token)
-        return self._cache.get(key)
+        entry = self._cache.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
 
     def pop(self, prefix: str, token: str) -> dict[str, Any] | None:
         """
@@ -96,10 +132,14 @@ class PreviewCache:
             token: Token from store()
 
         Returns:
-            Cached data or None if not found
+            Cached data or None if not found or expired
         """
         key = self._make_key(prefix, token)
-        return self._cache.pop(key, None)
+        with self._lock:
+            entry = self._cache.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
 
     def clear_prefix(self, prefix: str) -> int:
         """
@@ -111,10 +151,10 @@ class PreviewCache:
         Returns:
             Number of entries removed
         """
-        prefix_pattern = f"{prefix}:"
-        keys_to_remove = [k for k in self._cache if k.startswith(prefix_pattern)]
-        for k in keys_to_remove:
-            del self._cache[k]
+        with self._lock:
+            keys_to_remove = [k for k in self._cache if k[0] == prefix]
+            for k in keys_to_remove:
+                del self._cache[k]
         return len(keys_to_remove)
 
     def clear_all(self) -> int:
@@ -124,6 +164,7 @@ class PreviewCache:
         Returns:
             Number of entries removed
         """
-        count = len(self._cache)
-        self._cache.clear()
+        with self._lock:
+            count = len(self._cache)
+            self._cache.clear()
         return count
@@ -5,7 +5,8 @@ Ported from apps/gas/src/lib/sheet_utils.ts
 import re
 import math
 import unicodedata
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
 # Stopwords for tokenization (common words that don't help with search)
 STOPWORDS = {
@@ -14,6 +15,7 @@ STOPWORDS = {
 }
 
 
+@lru_cache(maxsize=1024)
 def norm_header(s: str) -> str:
     """
     Normalize a header string for matching.
@@ -148,6 +150,50 @@ def index_to_col_letter(index: int) -> str:
     return result
 
 
+def row_range_updates(
+    row: int,
+    cells: dict[int, Any],
+    col_letter: Callable[[int], str] = index_to_col_letter,
+) -> list[dict[str, Any]]:
+    """
+    Build batch_update entries for cells of one row, one entry per contiguous run.
+
+    Adjacent columns are written with a single range (e.g. B5:D5) instead of
+    one entry per cell. Gaps are never filled in, so cells that are not
+    being changed (possibly formulas) are left untouched.
+
+    Args:
+        row: 1-based sheet row
+        cells: 0-based column index -> new value
+        col_letter: Column letter function (e.g. a handler's memoized one)
+
+    Returns:
+        List of {"range", "values"} dicts for SheetsClient.batch_update
+    """
+    updates: list[dict[str, Any]] = []
+    run: list[int] = []
+    for ci in sorted(cells):
+        if run and ci != run[-1] + 1:
+            updates.append(_run_update(row, run, cells, col_letter))
+            run = []
+        run.append(ci)
+    if run:
+        updates.append(_run_update(row, run, cells, col_letter))
+    return updates
+
+
+def _run_update(
+    row: int, run: list[int], cells: dict[int, Any], col_letter: Callable[[int], str]
+) -> dict[str, Any]:
+    start = f"{col_letter(run[0])}{row}"
+    rng = start if len(run) == 1 else f"{start}:{col_letter(run[-1])}{row}"
+    return {"range": rng, "values": [[cells[ci] for ci in run]]}
+
+
+# Spreadsheet IDs are long runs of URL-safe base64 characters
+_SPREADSHEET_ID_RE = re.compile(r"[-\w]{25,}")
+
+
 def extract_spreadsheet_id(url: Any) -> str | None:
     """
     Extract spreadsheet ID from a Google Sheets URL or raw ID string.
@@ -160,5 +206,5 @@ def extract_spreadsheet_id(url: Any) -> str | None:
     """
     if not url:
         return None
-    match = re.search(r"[-\w]{25,}", str(url))
+    match = _SPREADSHEET_ID_RE.search(str(url))
     return match.group(0) if match else None
@@ -4,7 +4,7 @@ CRAM Books MCP Server
 Connects Claude to Google Sheets via direct Google Sheets API access.
 No longer depends on GAS WebApp intermediary.
 """
-import os
+import asyncio
 import sys
 from typing import Any
 
@@ -48,6 +48,8 @@ def log(*a):
 
 
 # ===== Books Tools =====
+# Handler calls do blocking Sheets I/O, so they run in a worker thread to
+# keep the event loop free for other requests.
 
 @mcp.tool()
 async def books_find(query: Any) -> dict:
@@ -78,7 +80,7 @@ async def books_find(query: Any) -> dict:
 
     sheets = get_sheets_client()
     handler = BooksHandler(sheets)
-    return handler.find(q)
+    return await asyncio.to_thread(handler.find, q)
 
 
 @mcp.tool()
@@ -103,9 +105,9 @@ async def books_get(book_id: Any = None, book_ids: Any = None) -> dict:
     handler = BooksHandler(sheets)
 
     if many:
-        return handler.get_multiple(many)
+        return await asyncio.to_thread(handler.get_multiple, many)
     if single:
-        return handler.get(single)
+        return await asyncio.to_thread(handler.get, single)
 
     return bad_request("books.get", "book_id or book_ids is required")
 
@@ -124,7 +126,8 @@ async def books_filter(where: Any = None, contains: Any = None, limit: int | Non
     """
     sheets = get_sheets_client()
     handler = BooksHandler(sheets)
-    return handler.filter(
+    return await asyncio.to_thread(
+        handler.filter,
         where=where if isinstance(where, dict) else None,
         contains=contains if isinstance(contains, dict) else None,
         limit=limit,
@@ -136,7 +139,7 @@ async def books_list(limit: int | None = None) -> dict:
     """参考書を簡易一覧（id/subject/title のみ）。"""
     sheets = get_sheets_client()
     handler = BooksHandler(sheets)
-    return handler.list(limit=limit)
+    return await asyncio.to_thread(handler.list, limit=limit)
 
 
 @mcp.tool()
@@ -163,7 +166,8 @@ async def books_create(
     """
     sheets = get_sheets_client()
     handler = BooksHandler(sheets)
-    return handler.create(
+    return await asyncio.to_thread(
+        handler.create,
         title=title,
         subject=subject,
         unit_load=int(unit_load) if unit_load is not None else None,
@@ -188,9 +192,9 @@ async def books_update(book_id: Any, updates: Any = None, confirm_token: str | N
     handler = BooksHandler(sheets)
 
     if confirm_token:
-        return handler.update(bid, confirm_token=confirm_token)
+        return await asyncio.to_thread(handler.update, bid, confirm_token=confirm_token)
     elif isinstance(updates, dict):
-        return handler.update(bid, updates=updates)
+        return await asyncio.to_thread(handler.update, bid, updates=updates)
     else:
         return bad_request("books.update", "updates is required for preview")
 
@@ -204,7 +208,7 @@ async def books_delete(book_id: Any, confirm_token: str | None = None) -> dict:
 
     sheets = get_sheets_client()
     handler = BooksHandler(sheets)
-    return handler.delete(bid, confirm_token=confirm_token)
+    return await asyncio.to_thread(handler.delete, bid, confirm_token=confirm_token)
 
 
 # ===== Students Tools =====
@@ -311,6 +315,17 @@ async def students_create(record: dict[str, Any] | None = None, id_prefix: str |
     return handler.create(record=record, id_prefix=id_prefix)
 
 
+@mcp.tool()
+async def students_create_many(records: Any = None, id_prefix: str | None = None) -> dict:
+    """生徒の一括作成。records は record（シート見出し→値）のリスト。1回の追記で書き込みます。"""
+    if not isinstance(records, list) or not records or not all(isinstance(r, dict) for r in records):
+        return bad_request("students.create_many", "records must be a non-empty list of dicts")
+
+    sheets = get_sheets_client()
+    handler = StudentsHandler(sheets)
+    return handler.create_many(records, id_prefix=id_prefix)
+
+
 @mcp.tool()
 async def students_update(student_id: Any, updates: dict[str, Any] | None = None, confirm_token: str | None = None) -> dict:
     """生徒の更新（二段階）。"""
@@ -693,6 +708,7 @@ async def tools_help() -> dict:
         {"name": "students_get", "desc": "生徒の詳細取得", "args": {"student_id": "string", "student_ids": "string[]"}},
         {"name": "students_filter", "desc": "条件で生徒を絞り込み", "args": {"where": "dict", "contains": "dict"}},
         {"name": "students_create", "desc": "生徒の新規作成", "args": {"record": "dict"}},
+        {"name": "students_create_many", "desc": "生徒の一括作成", "args": {"records": "dict[]"}},
         {"name": "students_update", "desc": "生徒の更新（二段階）", "args": {"student_id": "string", "updates": "dict"}},
         {"name": "students_delete", "desc": "生徒の削除（二段階）", "args": {"student_id": "string"}},
         {"name": "planner_ids_list", "desc": "プランナーのID一覧取得", "args": {"student_id": "string"}},
@@ -715,6 +731,7 @@ if __name__ == "__main__":
     from starlette.applications import Starlette
     from starlette.routing import Route
     from starlette.responses import JSONResponse
+    from env_loader import get_port
 
     async def healthz(request):
         return JSONResponse({"status": "ok"})
@@ -750,6 +767,6 @@ if __name__ == "__main__":
         else:
             await starlette_app(scope, receive, send)
 
-    port = int(os.getenv("PORT", "8080"))
+    port = get_port()
     log(f"Starting server on port {port}")
     uvicorn.run(combined_app, host="0.0.0.0", port=port, lifespan="on")
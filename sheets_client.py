@@ -2,7 +2,11 @@
 Google Sheets API client using gspread.
 Provides Service Account authentication and common sheet operations.
 """
+import functools
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import gspread
 from google.oauth2.service_account import Credentials
 from typing import Any
@@ -12,23 +16,51 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive.readonly",
 ]
 
+# How long get_all_values() results are reused before refetching (seconds)
+VALUES_CACHE_TTL_SECONDS = 30.0
+
+# Threads used by get_all_values_batch()
+VALUES_BATCH_WORKERS = 8
+
+
+def _invalidates_values(method):
+    """Drop cached values for (spreadsheet_id, sheet_name) around a write."""
+    @functools.wraps(method)
+    def wrapper(self, spreadsheet_id: str, sheet_name: str, *args, **kwargs):
+        self.invalidate_values(spreadsheet_id, sheet_name)
+        try:
+            return method(self, spreadsheet_id, sheet_name, *args, **kwargs)
+        finally:
+            # Also after: a read racing with the write may have re-cached old data
+            self.invalidate_values(spreadsheet_id, sheet_name)
+    return wrapper
+
 
 class SheetsClient:
     """Wrapper around gspread for Google Sheets API access."""
 
-    def __init__(self, credentials_json: str | dict):
+    def __init__(
+        self,
+        credentials_json: str | dict,
+        values_ttl_seconds: float = VALUES_CACHE_TTL_SECONDS,
+    ):
         """
         Initialize the client with Service Account credentials.
 
         Args:
             credentials_json: Either a JSON string or dict containing
                              the Service Account credentials.
+            values_ttl_seconds: TTL for cached get_all_values() results
+                               (0 disables the cache).
         """
         if isinstance(credentials_json, str):
             credentials_json = json.loads(credentials_json)
         creds = Credentials.from_service_account_info(credentials_json, scopes=SCOPES)
         self.gc = gspread.authorize(creds)
         self._spreadsheet_cache: dict[str, gspread.Spreadsheet] = {}
+        self._values_ttl = values_ttl_seconds
+        self._values_cache: dict[tuple[str, str], tuple[float, list[list[str]]]] = {}
+        self._values_lock = threading.Lock()
 
     def open_by_id(self, spreadsheet_id: str) -> gspread.Spreadsheet:
         """Open a spreadsheet by ID with caching."""
@@ -41,26 +73,103 @@ class SheetsClient:
         ss = self.open_by_id(spreadsheet_id)
         return ss.worksheet(sheet_name)
 
-    def get_all_values(self, spreadsheet_id: str, sheet_name: str) -> list[list[str]]:
-        """Get all values from a worksheet as a 2D list."""
+    def get_all_values(
+        self, spreadsheet_id: str, sheet_name: str, fresh: bool = False
+    ) -> list[list[str]]:
+        """
+        Get all values from a worksheet as a 2D list.
+
+        Results are cached per (spreadsheet_id, sheet_name) for the values TTL
+        and dropped by any write made through this client. The returned list
+        is shared between callers and must be treated as read-only.
+
+        Args:
+            fresh: Skip the cached values and read the sheet (the result
+                   still refreshes the cache). Writers use this so edits
+                   made outside this process within the TTL are seen.
+        """
+        key = (spreadsheet_id, sheet_name)
+        if not fresh:
+            with self._values_lock:
+                cached = self._values_cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
         ws = self.get_worksheet(spreadsheet_id, sheet_name)
-        return ws.get_all_values()
+        values = ws.get_all_values()
+        if self._values_ttl > 0:
+            with self._values_lock:
+                self._values_cache[key] = (time.monotonic() + self._values_ttl, values)
+        return values
+
+    def get_all_values_batch(
+        self, sheets: list[tuple[str, str]]
+    ) -> list[list[list[str]]]:
+        """
+        get_all_values for several sheets, fetched concurrently.
+
+        Each read is a separate request (they may target different
+        spreadsheets), so uncached sheets are read on a small thread pool
+        and share the network wait. Cached values are reused as usual.
+
+        Args:
+            sheets: (spreadsheet_id, sheet_name) pairs
+
+        Returns:
+            One 2D list per pair, in the order given
+        """
+        if len(sheets) <= 1:
+            return [self.get_all_values(fid, sname) for fid, sname in sheets]
+        workers = min(VALUES_BATCH_WORKERS, len(sheets))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda key: self.get_all_values(*key), sheets))
+
+    def invalidate_values(self, spreadsheet_id: str, sheet_name: str | None = None) -> None:
+        """Drop cached values for one sheet, or for every sheet of a spreadsheet."""
+        with self._values_lock:
+            if sheet_name is not None:
+                self._values_cache.pop((spreadsheet_id, sheet_name), None)
+            else:
+                for key in [k for k in self._values_cache if k[0] == spreadsheet_id]:
+                    del self._values_cache[key]
 
     def get_range(self, spreadsheet_id: str, sheet_name: str, range_notation: str) -> list[list[Any]]:
         """Get values from a specific range (e.g., 'A1:D30')."""
         ws = self.get_worksheet(spreadsheet_id, sheet_name)
         return ws.get(range_notation)
 
+    def batch_get(
+        self,
+        spreadsheet_id: str,
+        sheet_name: str,
+        ranges: list[str],
+    ) -> list[list[list[Any]]]:
+        """
+        Get values from several ranges of one worksheet in a single request.
+
+        Args:
+            ranges: A1 ranges without the sheet name, e.g. ['A4', 'E4:G30']
+
+        Returns:
+            One 2D list per range, in the order given ([] for empty ranges)
+        """
+        if not ranges:
+            return []
+        ws = self.get_worksheet(spreadsheet_id, sheet_name)
+        return [list(vr) for vr in ws.batch_get(ranges)]
+
     def get_cell(self, spreadsheet_id: str, sheet_name: str, cell: str) -> Any:
         """Get a single cell value."""
         ws = self.get_worksheet(spreadsheet_id, sheet_name)
         return ws.acell(cell).value
 
+    @_invalidates_values
     def update_cell(self, spreadsheet_id: str, sheet_name: str, cell: str, value: Any) -> None:
         """Update a single cell."""
         ws = self.get_worksheet(spreadsheet_id, sheet_name)
         ws.update_acell(cell, value)
 
+    @_invalidates_values
     def update_range(
         self,
         spreadsheet_id: str,
@@ -72,11 +181,13 @@ class SheetsClient:
         ws = self.get_worksheet(spreadsheet_id, sheet_name)
         ws.update(range_notation, values)
 
+    @_invalidates_values
     def batch_update(
         self,
         spreadsheet_id: str,
         sheet_name: str,
         updates: list[dict],
+        value_input_option: str | None = None,
     ) -> None:
         """
         Batch update multiple ranges.
@@ -84,10 +195,16 @@ class SheetsClient:
         Args:
             updates: List of dicts with 'range' and 'values' keys.
                     e.g., [{'range': 'A1', 'values': [[1,2]]}, ...]
+            value_input_option: 'USER_ENTERED' to parse values as typed in
+                    the UI (as update_cell does); default keeps gspread's RAW
         """
         ws = self.get_worksheet(spreadsheet_id, sheet_name)
-        ws.batch_update(updates)
+        if value_input_option is None:
+            ws.batch_update(updates)
+        else:
+            ws.batch_update(updates, value_input_option=value_input_option)
 
+    @_invalidates_values
     def append_rows(
         self,
         spreadsheet_id: str,
@@ -98,6 +215,7 @@ class SheetsClient:
         ws = self.get_worksheet(spreadsheet_id, sheet_name)
         ws.append_rows(rows)
 
+    @_invalidates_values
     def insert_rows(
         self,
         spreadsheet_id: str,
@@ -109,6 +227,7 @@ class SheetsClient:
         ws = self.get_worksheet(spreadsheet_id, sheet_name)
         ws.insert_rows([[]] * num_rows, row=row_index)
 
+    @_invalidates_values
     def delete_rows(
         self,
         spreadsheet_id: str,
@@ -126,11 +245,14 @@ class SheetsClient:
         return ws.row_count
 
     def clear_cache(self, spreadsheet_id: str | None = None) -> None:
-        """Clear the spreadsheet cache (useful after modifications)."""
+        """Clear the spreadsheet and values caches (useful after modifications)."""
         if spreadsheet_id:
             self._spreadsheet_cache.pop(spreadsheet_id, None)
+            self.invalidate_values(spreadsheet_id)
         else:
             self._spreadsheet_cache.clear()
+            with self._values_lock:
+                self._values_cache.clear()
 
 
 # Singleton instance for the application
@@ -144,9 +266,13 @@ def get_sheets_client() -> SheetsClient:
     """
     global _sheets_client
     if _sheets_client is None:
-        from env_loader import get_google_credentials
+        from env_loader import get_google_credentials, get_values_cache_ttl
         credentials = get_google_credentials()
-        _sheets_client = SheetsClient(credentials)
+        ttl = get_values_cache_ttl()
+        _sheets_client = SheetsClient(
+            credentials,
+            values_ttl_seconds=VALUES_CACHE_TTL_SECONDS if ttl is None else ttl,
+        )
     return _sheets_client
 
 
@@ -66,6 +66,19 @@ class TestBaseHandlerLoadSheet:
         assert handler.column_indices["name"] == 1
         assert handler.column_indices["status"] == 2
 
+    def test_load_sheet_fresh_bypasses_cache(self):
+        """Should ask the client for a fresh read when requested."""
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [["ID"], ["001"]]
+
+        handler = ConcreteHandler(mock_sheets)
+        result = handler.load_sheet("test.op", fresh=True)
+
+        assert result is None
+        mock_sheets.get_all_values.assert_called_once_with(
+            handler.file_id, handler.sheet_name, fresh=True
+        )
+
     def test_load_sheet_empty_returns_error(self):
         """Should return error for empty sheet."""
         mock_sheets = MagicMock()
@@ -92,6 +105,75 @@ class TestBaseHandlerLoadSheet:
         assert "Connection failed" in result["error"]["message"]
 
 
+class TestBaseHandlerSheetMemo:
+    """Tests for memoized header state and sheet_memo."""
+
+    def test_reuses_state_for_same_values(self):
+        """Should share column indices and memos while values are unchanged."""
+        values = [["ID", "Name", "Status"], ["001", "Alice", "Active"]]
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = values
+
+        first = ConcreteHandler(mock_sheets)
+        first.load_sheet("test.op")
+        built = first.sheet_memo("ids", lambda: ["001"])
+
+        second = ConcreteHandler(mock_sheets)
+        second.load_sheet("test.op")
+
+        assert second.column_indices is first.column_indices
+        assert second.sheet_memo("ids", lambda: pytest.fail("rebuilt")) is built
+
+    def test_rebuilds_for_new_values(self):
+        """Should rebuild state when a fresh values list is loaded."""
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [["ID", "Name"], ["001", "Alice"]]
+        first = ConcreteHandler(mock_sheets)
+        first.load_sheet("test.op")
+        first.sheet_memo("ids", lambda: ["001"])
+
+        mock_sheets.get_all_values.return_value = [["Name", "ID"], ["Bob", "002"]]
+        second = ConcreteHandler(mock_sheets)
+        second.load_sheet("test.op")
+
+        assert second.column_indices["id"] == 1
+        assert second.sheet_memo("ids", lambda: ["002"]) == ["002"]
+
+    def test_invalidate_sheet_state_forces_rebuild(self):
+        """Should rebuild memos after invalidation even for the same values list."""
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [["ID", "Name"], ["001", "Alice"]]
+        first = ConcreteHandler(mock_sheets)
+        first.load_sheet("test.op")
+        first.sheet_memo("ids", lambda: ["001"])
+        first.invalidate_sheet_state()
+
+        second = ConcreteHandler(mock_sheets)
+        second.load_sheet("test.op")
+
+        assert second.sheet_memo("ids", lambda: ["rebuilt"]) == ["rebuilt"]
+
+    def test_header_col_matches_normalized_first_header(self):
+        """Should resolve headers after normalization, first occurrence winning."""
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [["ID", "Ｎａｍｅ", "Name"], ["001", "a", "b"]]
+        handler = ConcreteHandler(mock_sheets)
+        handler.load_sheet("test.op")
+
+        assert handler.header_col(" name ") == 1
+        assert handler.header_col("missing") == -1
+
+    def test_col_letter_covers_and_exceeds_header_width(self):
+        """Should return column letters inside and beyond the loaded headers."""
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [["ID", "Name", "Status"]]
+        handler = ConcreteHandler(mock_sheets)
+        handler.load_sheet("test.op")
+
+        assert handler.col_letter(2) == "C"
+        assert handler.col_letter(27) == "AB"
+
+
 class TestBaseHandlerCellAccess:
     """Tests for cell access methods."""
 
@@ -140,6 +222,40 @@ class TestBaseHandlerCellAccess:
         assert handler.get_cell(row, "id") == "001"
         assert handler.get_cell(row, "name", "default") == "default"
 
+    def test_column_values_strips_and_pads_rows(self):
+        """Should return one stripped string per data row, "" for gaps."""
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["ID", "Name"],
+            [" 001 ", "Alice"],
+            ["002"],
+            [None, "Carol"],
+        ]
+
+        handler = ConcreteHandler(mock_sheets)
+        handler.load_sheet("test.op")
+
+        assert handler.column_values("id") == ("001", "002", "")
+        assert handler.column_values("name") == ("Alice", "", "Carol")
+        assert handler.column_values("status") == ("", "", "")
+        assert handler.column_values("id") is handler.column_values("id")
+
+    def test_normalized_column_values(self):
+        """Should normalize each cell once per loaded values."""
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["ID", "Name"],
+            ["Ａ01", " ALICE "],
+            ["002"],
+        ]
+
+        handler = ConcreteHandler(mock_sheets)
+        handler.load_sheet("test.op")
+
+        assert handler.normalized_column_values("id") == ("a01", "002")
+        assert handler.normalized_column_values("name") == ("alice", "")
+        assert handler.normalized_column_values("name") is handler.normalized_column_values("name")
+
 
 class TestBaseHandlerFindRow:
     """Tests for row finding methods."""
@@ -239,6 +355,28 @@ class TestBaseHandlerFilter:
         )
         assert len(results) == 2
 
+    def test_filter_normalizes_values_and_rejects_unknown_columns(self):
+        """Should compare normalized cells and match nothing for an unknown column."""
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["ID", "Name", "Status"],
+            ["001", "Ａｌｉｃｅ", " ACTIVE "],
+            ["002", "Bob", "Active"],
+            ["003", "Charlie"],
+        ]
+
+        handler = ConcreteHandler(mock_sheets)
+        handler.load_sheet("test.op")
+
+        results = handler.filter_by_conditions(where={"Status": "active"}, contains={"Name": "li"})
+        assert [r[0] for r in results] == [2]
+        assert handler.filter_by_conditions(where={"Missing": "x"}) == []
+        assert handler.filter_by_conditions(contains={"Status": ""}) == [
+            (2, ["001", "Ａｌｉｃｅ", " ACTIVE "]),
+            (3, ["002", "Bob", "Active"]),
+            (4, ["003", "Charlie"]),
+        ]
+
 
 class TestBaseHandlerResponses:
     """Tests for response helper methods."""
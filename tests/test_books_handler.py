@@ -45,6 +45,15 @@ class TestBooksHandlerColumnSpec:
         for key in required_keys:
             assert key in BooksHandler.COLUMN_SPEC, f"Missing key: {key}"
 
+    def test_book_columns_mirror_column_spec(self):
+        """Should expose one BookColumns field per COLUMN_SPEC key."""
+        from handlers.books import BooksHandler
+        from handlers.books.handler import BookColumns
+
+        assert set(BookColumns._fields) == set(BooksHandler.COLUMN_SPEC)
+        cols = BookColumns.from_indices({"id": 0, "title": 2})
+        assert (cols.id, cols.title, cols.subject) == (0, 2, -1)
+
 
 class TestBooksHandlerFind:
     """Tests for find method (IDF search)."""
@@ -120,6 +129,74 @@ class TestBooksHandlerFind:
         assert result["ok"] is True
         assert len(result["data"]["candidates"]) <= 2
 
+    def test_find_reuses_index_for_same_values(self):
+        """Should build the search index once per loaded values list."""
+        from unittest.mock import patch
+        from handlers.books import BooksHandler
+        from handlers.books.index import BookIndex
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["参考書ID", "参考書名", "教科"],
+            ["gMA001", "青チャート", "数学"],
+            ["gEN001", "英語長文", "英語"],
+        ]
+
+        with patch.object(BookIndex, "build", wraps=BookIndex.build) as build:
+            first = BooksHandler(mock_sheets).find("青チャート")
+            second = BooksHandler(mock_sheets).find("英語")
+
+        assert build.call_count == 1
+        assert first["data"]["top"]["book_id"] == "gMA001"
+        assert second["data"]["top"]["book_id"] == "gEN001"
+
+    def test_find_skips_rows_that_cannot_match(self):
+        """Should score only pre-selected candidate rows."""
+        from unittest.mock import patch
+        from handlers.books import BooksHandler, search
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["参考書ID", "参考書名", "教科"],
+            ["gMA001", "青チャート", "数学"],
+            ["gEN001", "英語長文", "英語"],
+            ["gEN002", "英文法", "英語"],
+        ]
+        handler = BooksHandler(mock_sheets)
+
+        with patch(
+            "handlers.books.search._score_row", wraps=search._score_row
+        ) as score_row:
+            result = handler.find("青チャート")
+
+        assert result["data"]["top"]["book_id"] == "gMA001"
+        assert score_row.call_count == 1
+
+    def test_detect_subject_prefers_earlier_subject_key(self):
+        """Should pick the subject listed first in SUBJECT_KEYS."""
+        from handlers.books import BooksHandler
+
+        handler = BooksHandler(MagicMock())
+
+        assert handler._detect_subject(["数学", "英語"]) == "英語"
+        assert handler._detect_subject(["青チャート"]) is None
+
+    def test_gap_cutoff_ranks_unordered_candidates(self):
+        """Should rank by score (ties keep input order) before cutting at a gap."""
+        from handlers.books import BooksHandler
+
+        handler = BooksHandler(MagicMock())
+        candidates = [
+            {"book_id": "a", "score": 0.8},
+            {"book_id": "b", "score": 0.95},
+            {"book_id": "c", "score": 0.5},
+            {"book_id": "d", "score": 0.95},
+        ]
+
+        result = handler._apply_gap_cutoff(candidates, limit=10)
+
+        assert [c["book_id"] for c in result] == ["b", "d"]
+
 
 class TestBooksHandlerGet:
     """Tests for get method."""
@@ -192,6 +269,42 @@ class TestBooksHandlerGet:
         assert "books" in result["data"]
         assert len(result["data"]["books"]) == 2
 
+    def test_get_reuses_response_for_same_values(self):
+        """Should build each book response once per loaded sheet."""
+        from unittest.mock import patch
+        from handlers.books import BooksHandler
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["参考書ID", "参考書名", "教科", "月間目標"],
+            ["gMA001", "青チャート", "数学", "1日2時間"],
+        ]
+
+        with patch.object(
+            BooksHandler, "_build_book_response", autospec=True,
+            side_effect=BooksHandler._build_book_response,
+        ) as build:
+            first = BooksHandler(mock_sheets).get("gMA001")
+            second = BooksHandler(mock_sheets).get("gMA001")
+
+        assert first == second
+        assert build.call_count == 1
+
+
+    def test_get_does_not_memoize_unknown_ids(self):
+        """Should keep only found books in the response memo."""
+        from handlers.books import BooksHandler
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["参考書ID", "参考書名", "教科"],
+            ["gMA001", "青チャート", "数学"],
+        ]
+
+        handler = BooksHandler(mock_sheets)
+        handler.get_multiple(["gMA001", "gXX999"])
+
+        assert list(handler.sheet_memo("book_responses", dict)) == ["gMA001"]
 
 class TestBooksHandlerFilter:
     """Tests for filter method."""
@@ -232,6 +345,65 @@ class TestBooksHandlerFilter:
         assert result["ok"] is True
         assert result["data"]["count"] == 2
 
+    def test_filter_contains_checks_each_cell_of_the_block(self):
+        """Should match child-row cells but never across two cells."""
+        from handlers.books import BooksHandler
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["参考書ID", "参考書名", "教科", "章の名前"],
+            ["gMA001", "青チャート", "数学", "ab"],
+            ["", "", "", "cd"],
+            ["gEN001", "英語長文", "英語", "bc"],
+        ]
+        handler = BooksHandler(mock_sheets)
+
+        child = handler.filter(contains={"章の名前": "cd"})
+        across = handler.filter(contains={"章の名前": "bc"})
+
+        assert [b["id"] for b in child["data"]["books"]] == ["gMA001"]
+        assert [b["id"] for b in across["data"]["books"]] == ["gEN001"]
+
+    def test_filter_unknown_column_returns_empty_without_scanning(self):
+        """Should return no books for an unknown column before touching the index."""
+        from unittest.mock import patch
+        from handlers.books import BooksHandler
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["参考書ID", "参考書名", "教科"],
+            ["gMA001", "青チャート", "数学"],
+        ]
+        handler = BooksHandler(mock_sheets)
+
+        with patch.object(BooksHandler, "_book_index") as book_index:
+            result = handler.filter(where={"存在しない列": "x"}, contains={"教科": "数"})
+
+        assert result["ok"] is True
+        assert result["data"]["count"] == 0
+        book_index.assert_not_called()
+
+    def test_filter_contains_absent_from_column_skips_books(self):
+        """Should reject a needle missing from the whole column without per-book checks."""
+        from unittest.mock import patch
+        from handlers.books import BooksHandler
+        from handlers.books.index import BookIndex
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["参考書ID", "参考書名", "教科"],
+            ["gMA001", "青チャート", "数学"],
+            ["gEN001", "英単語", "英語"],
+        ]
+        handler = BooksHandler(mock_sheets)
+
+        with patch.object(BookIndex, "cells_contain") as cells_contain:
+            result = handler.filter(contains={"教科": "国語"})
+
+        assert result["ok"] is True
+        assert result["data"]["count"] == 0
+        cells_contain.assert_not_called()
+
     def test_filter_with_limit(self):
         """Should respect limit parameter."""
         from handlers.books import BooksHandler
@@ -332,6 +504,21 @@ class TestBooksHandlerCreate:
         # Should be gMA002 (next after gMA001)
         assert result["data"]["id"] == "gMA002"
 
+    def test_create_reads_sheet_fresh(self):
+        """Should bypass the values cache when allocating the next ID."""
+        from handlers.books import BooksHandler
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["参考書ID", "参考書名", "教科"],
+            ["gMA001", "既存の本", "数学"],
+        ]
+
+        handler = BooksHandler(mock_sheets)
+        handler.create(title="新しい本", subject="数学")
+
+        assert mock_sheets.get_all_values.call_args.kwargs == {"fresh": True}
+
     def test_create_appends_rows(self):
         """Should append rows for parent and chapters."""
         from handlers.books import BooksHandler
@@ -403,6 +590,24 @@ class TestBooksHandlerUpdate:
         assert confirm_result["ok"] is True
         assert confirm_result["data"]["updated"] is True
 
+    def test_update_confirm_writes_only_changed_fields(self):
+        """Should cache and write only the fields that differ from the sheet."""
+        from handlers.books import BooksHandler
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["参考書ID", "参考書名", "教科"],
+            ["gMA001", "青チャート", "数学"],
+        ]
+        handler = BooksHandler(mock_sheets)
+
+        preview = handler.update("gMA001", updates={"title": "新タイトル", "subject": "数学"})
+        handler.update("gMA001", confirm_token=preview["data"]["confirm_token"])
+
+        mock_sheets.batch_update.assert_called_once()
+        requests = mock_sheets.batch_update.call_args[0][2]
+        assert requests == [{"range": "B2", "values": [["新タイトル"]]}]
+
     def test_update_expired_token(self):
         """Should reject expired/invalid token."""
         from handlers.books import BooksHandler
@@ -440,6 +645,28 @@ class TestBooksHandlerDelete:
         assert result["data"]["requires_confirmation"] is True
         assert "confirm_token" in result["data"]
 
+    def test_delete_preview_covers_child_rows(self):
+        """Should span the parent row through its chapter rows only."""
+        from handlers.books import BooksHandler
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["参考書ID", "参考書名", "教科", "章の名前"],
+            ["gMA001", "青チャート", "数学", "第1章"],
+            ["gMA002", "黄チャート", "数学", "第1章"],
+            ["", "", "", "第2章"],
+            ["", "", "", ""],
+            ["gEN001", "英語長文", "英語", "第1章"],
+        ]
+
+        handler = BooksHandler(mock_sheets)
+        result = handler.delete("gMA002")
+
+        assert result["ok"] is True
+        preview = result["data"]["preview"]
+        assert preview["delete_rows"] == 3
+        assert preview["range"] == {"start_row": 3, "end_row": 5}
+
     def test_delete_confirm_mode(self):
         """Should delete with valid confirm_token."""
         from handlers.books import BooksHandler
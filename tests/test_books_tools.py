@@ -7,47 +7,35 @@ Updated for direct Google Sheets API architecture.
 import pytest
 from unittest.mock import patch, MagicMock
 
-from server import (
-    books_find,
-    books_get,
-    books_filter,
-    books_create,
-    books_update,
-    books_delete,
-    books_list,
-)
-
 
 class TestBooksFind:
     """Tests for books_find tool"""
 
     @pytest.mark.asyncio
-    async def test_find_book_success(self, mock_sheets_client, mock_handler_responses):
+    async def test_find_book_success(self, mock_books_handler, books_find):
         """Should find books matching query"""
-        mock_handler = MagicMock()
-        mock_handler.find.return_value = mock_handler_responses["books.find"]
-        with patch("server.get_sheets_client", return_value=mock_sheets_client), \
-             patch("server.BooksHandler", return_value=mock_handler):
+        with mock_books_handler("find", "books.find") as mock_handler:
             result = await books_find(query="青チャート")
+            mock_handler.find.assert_called_once()
             assert result.get("ok") is True
             assert "candidates" in result.get("data", {})
 
     @pytest.mark.asyncio
-    async def test_find_requires_query(self):
+    async def test_find_requires_query(self, books_find):
         """Should return error when query is missing"""
         result = await books_find(query=None)
         assert result.get("ok") is False
         assert "error" in result
 
     @pytest.mark.asyncio
-    async def test_find_empty_query(self):
+    async def test_find_empty_query(self, books_find):
         """Should return error when query is empty"""
         result = await books_find(query="")
         assert result.get("ok") is False
         assert "error" in result
 
     @pytest.mark.asyncio
-    async def test_find_with_dict_input(self, mock_sheets_client, mock_handler_responses):
+    async def test_find_with_dict_input(self, mock_sheets_client, mock_handler_responses, books_find):
         """Should accept dict with query key"""
         mock_handler = MagicMock()
         mock_handler.find.return_value = mock_handler_responses["books.find"]
@@ -57,7 +45,7 @@ class TestBooksFind:
             assert result.get("ok") is True
 
     @pytest.mark.asyncio
-    async def test_find_handles_error(self, mock_sheets_client):
+    async def test_find_handles_error(self, mock_sheets_client, books_find):
         """Should handle handler errors gracefully"""
         error_response = {"ok": False, "op": "books.find", "error": {"code": "NOT_FOUND", "message": "No books found"}}
         mock_handler = MagicMock()
@@ -67,12 +55,23 @@ class TestBooksFind:
             result = await books_find(query="NonExistent")
             assert result.get("ok") is False
 
+    @pytest.mark.asyncio
+    async def test_find_runs_handler_off_event_loop_thread(self, mock_books_handler, books_find):
+        """Should run the blocking handler call in a worker thread"""
+        import threading
+
+        loop_thread = threading.get_ident()
+        with mock_books_handler("find", "books.find") as mock_handler:
+            mock_handler.find.side_effect = lambda q: {"ok": True, "thread": threading.get_ident()}
+            result = await books_find(query="青チャート")
+            assert result["thread"] != loop_thread
+
 
 class TestBooksGet:
     """Tests for books_get tool"""
 
     @pytest.mark.asyncio
-    async def test_get_single_book(self, mock_sheets_client, mock_handler_responses):
+    async def test_get_single_book(self, mock_sheets_client, mock_handler_responses, books_get):
         """Should get single book by ID"""
         mock_handler = MagicMock()
         mock_handler.get.return_value = mock_handler_responses["books.get"]
@@ -83,7 +82,15 @@ class TestBooksGet:
             assert "book" in result.get("data", {})
 
     @pytest.mark.asyncio
-    async def test_get_multiple_books(self, mock_sheets_client, mock_handler_responses):
+    async def test_get_propagates_handler_error(self, mock_books_handler, books_get):
+        """Should pass handler errors through unchanged"""
+        with mock_books_handler("get", "books.get.unknown"):
+            result = await books_get(book_id="gXX999")
+            assert result.get("ok") is False
+            assert result["error"]["code"] == "NOT_FOUND"
+
+    @pytest.mark.asyncio
+    async def test_get_multiple_books(self, mock_sheets_client, mock_handler_responses, books_get):
         """Should get multiple books by IDs"""
         mock_handler = MagicMock()
         mock_handler.get_multiple.return_value = {"ok": True, "op": "books.get", "data": {"books": []}}
@@ -93,7 +100,7 @@ class TestBooksGet:
             assert result.get("ok") is True
 
     @pytest.mark.asyncio
-    async def test_get_requires_id(self, mock_sheets_client):
+    async def test_get_requires_id(self, mock_sheets_client, books_get):
         """Should return error when no ID provided"""
         with patch("server.get_sheets_client", return_value=mock_sheets_client):
             result = await books_get()
@@ -101,7 +108,7 @@ class TestBooksGet:
             assert "error" in result
 
     @pytest.mark.asyncio
-    async def test_get_handles_not_found(self, mock_sheets_client):
+    async def test_get_handles_not_found(self, mock_sheets_client, books_get):
         """Should handle book not found error"""
         error_response = {"ok": False, "op": "books.get", "error": {"code": "NOT_FOUND", "message": "Book not found"}}
         mock_handler = MagicMock()
@@ -116,7 +123,7 @@ class TestBooksFilter:
     """Tests for books_filter tool"""
 
     @pytest.mark.asyncio
-    async def test_filter_by_subject(self, mock_sheets_client, mock_handler_responses):
+    async def test_filter_by_subject(self, mock_sheets_client, mock_handler_responses, books_filter):
         """Should filter books by subject"""
         mock_handler = MagicMock()
         mock_handler.filter.return_value = mock_handler_responses["books.filter"]
@@ -127,7 +134,7 @@ class TestBooksFilter:
             assert "books" in result.get("data", {})
 
     @pytest.mark.asyncio
-    async def test_filter_by_contains(self, mock_sheets_client, mock_handler_responses):
+    async def test_filter_by_contains(self, mock_sheets_client, mock_handler_responses, books_filter):
         """Should filter books by partial match"""
         mock_handler = MagicMock()
         mock_handler.filter.return_value = mock_handler_responses["books.filter"]
@@ -137,7 +144,7 @@ class TestBooksFilter:
             assert result.get("ok") is True
 
     @pytest.mark.asyncio
-    async def test_filter_with_limit(self, mock_sheets_client, mock_handler_responses):
+    async def test_filter_with_limit(self, mock_sheets_client, mock_handler_responses, books_filter):
         """Should respect limit parameter"""
         mock_handler = MagicMock()
         mock_handler.filter.return_value = mock_handler_responses["books.filter"]
@@ -147,7 +154,7 @@ class TestBooksFilter:
             assert result.get("ok") is True
 
     @pytest.mark.asyncio
-    async def test_filter_no_params_returns_all(self, mock_sheets_client, mock_handler_responses):
+    async def test_filter_no_params_returns_all(self, mock_sheets_client, mock_handler_responses, books_filter):
         """Should return all books when no filter specified"""
         mock_handler = MagicMock()
         mock_handler.filter.return_value = mock_handler_responses["books.filter"]
@@ -161,7 +168,7 @@ class TestBooksCreate:
     """Tests for books_create tool"""
 
     @pytest.mark.asyncio
-    async def test_create_book(self, mock_sheets_client, mock_handler_responses):
+    async def test_create_book(self, mock_sheets_client, mock_handler_responses, books_create):
         """Should create new book"""
         mock_handler = MagicMock()
         mock_handler.create.return_value = mock_handler_responses["books.create"]
@@ -172,7 +179,7 @@ class TestBooksCreate:
             assert result.get("data", {}).get("id") is not None
 
     @pytest.mark.asyncio
-    async def test_create_with_chapters(self, mock_sheets_client, mock_handler_responses):
+    async def test_create_with_chapters(self, mock_sheets_client, mock_handler_responses, books_create):
         """Should create book with chapter information"""
         mock_handler = MagicMock()
         mock_handler.create.return_value = mock_handler_responses["books.create"]
@@ -183,7 +190,7 @@ class TestBooksCreate:
             assert result.get("ok") is True
 
     @pytest.mark.asyncio
-    async def test_create_with_custom_prefix(self, mock_sheets_client, mock_handler_responses):
+    async def test_create_with_custom_prefix(self, mock_sheets_client, mock_handler_responses, books_create):
         """Should use custom ID prefix"""
         mock_handler = MagicMock()
         mock_handler.create.return_value = mock_handler_responses["books.create"]
@@ -197,7 +204,7 @@ class TestBooksUpdate:
     """Tests for books_update tool (two-phase)"""
 
     @pytest.mark.asyncio
-    async def test_update_preview(self, mock_sheets_client, mock_handler_responses):
+    async def test_update_preview(self, mock_sheets_client, mock_handler_responses, books_update):
         """Should return preview without confirm_token"""
         mock_handler = MagicMock()
         mock_handler.update.return_value = mock_handler_responses["books.update_preview"]
@@ -209,7 +216,7 @@ class TestBooksUpdate:
             assert "confirm_token" in data
 
     @pytest.mark.asyncio
-    async def test_update_confirm(self, mock_sheets_client, mock_handler_responses):
+    async def test_update_confirm(self, mock_sheets_client, mock_handler_responses, books_update):
         """Should apply update with valid confirm_token"""
         mock_handler = MagicMock()
         mock_handler.update.return_value = mock_handler_responses["books.update_confirm"]
@@ -220,14 +227,14 @@ class TestBooksUpdate:
             assert result.get("data", {}).get("updated") is True
 
     @pytest.mark.asyncio
-    async def test_update_requires_book_id(self):
+    async def test_update_requires_book_id(self, books_update):
         """Should require book_id"""
         result = await books_update(book_id=None, updates={"title": "New"})
         assert result.get("ok") is False
         assert "error" in result
 
     @pytest.mark.asyncio
-    async def test_update_invalid_token(self, mock_sheets_client):
+    async def test_update_invalid_token(self, mock_sheets_client, books_update):
         """Should handle invalid confirm_token"""
         error_response = {"ok": False, "op": "books.update", "error": {"code": "CONFIRM_EXPIRED", "message": "Token expired"}}
         mock_handler = MagicMock()
@@ -242,7 +249,7 @@ class TestBooksDelete:
     """Tests for books_delete tool (two-phase)"""
 
     @pytest.mark.asyncio
-    async def test_delete_preview(self, mock_sheets_client, mock_handler_responses):
+    async def test_delete_preview(self, mock_sheets_client, mock_handler_responses, books_delete):
         """Should return preview without confirm_token"""
         mock_handler = MagicMock()
         mock_handler.delete.return_value = mock_handler_responses["books.delete_preview"]
@@ -254,7 +261,7 @@ class TestBooksDelete:
             assert "confirm_token" in data
 
     @pytest.mark.asyncio
-    async def test_delete_confirm(self, mock_sheets_client, mock_handler_responses):
+    async def test_delete_confirm(self, mock_sheets_client, mock_handler_responses, books_delete):
         """Should delete with valid confirm_token"""
         mock_handler = MagicMock()
         mock_handler.delete.return_value = mock_handler_responses["books.delete_confirm"]
@@ -265,7 +272,7 @@ class TestBooksDelete:
             assert result.get("data", {}).get("deleted") is True
 
     @pytest.mark.asyncio
-    async def test_delete_requires_book_id(self):
+    async def test_delete_requires_book_id(self, books_delete):
         """Should require book_id"""
         result = await books_delete(book_id=None)
         assert result.get("ok") is False
@@ -276,7 +283,7 @@ class TestBooksList:
     """Tests for books_list tool"""
 
     @pytest.mark.asyncio
-    async def test_list_all_books(self, mock_sheets_client, mock_handler_responses):
+    async def test_list_all_books(self, mock_sheets_client, mock_handler_responses, books_list):
         """Should list all books"""
         mock_handler = MagicMock()
         mock_handler.list.return_value = mock_handler_responses["books.list"]
@@ -287,7 +294,7 @@ class TestBooksList:
             assert "books" in result.get("data", {})
 
     @pytest.mark.asyncio
-    async def test_list_with_limit(self, mock_sheets_client, mock_handler_responses):
+    async def test_list_with_limit(self, mock_sheets_client, mock_handler_responses, books_list):
         """Should respect limit parameter"""
         mock_handler = MagicMock()
         mock_handler.list.return_value = mock_handler_responses["books.list"]
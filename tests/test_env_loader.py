@@ -0,0 +1,123 @@
+"""
+Tests for env_loader.
+Environment reads are memoized, so each test clears the cache around its changes.
+"""
+import json
+
+import pytest
+
+import env_loader
+from env_loader import (
+    clear_env_cache,
+    get_google_credentials,
+    get_hmac_secret,
+    get_port,
+    get_values_cache_ttl,
+    is_hmac_required,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_env_cache():
+    clear_env_cache()
+    yield
+    clear_env_cache()
+
+
+class TestGetGoogleCredentials:
+    """Tests for get_google_credentials"""
+
+    def test_from_json_env(self, monkeypatch):
+        """Should parse GOOGLE_CREDENTIALS_JSON"""
+        monkeypatch.delenv("GOOGLE_CREDENTIALS_FILE", raising=False)
+        monkeypatch.setenv("GOOGLE_CREDENTIALS_JSON", '{"type": "service_account", "project_id": "p1"}')
+        assert get_google_credentials()["project_id"] == "p1"
+
+    def test_from_file(self, monkeypatch, tmp_path):
+        """Should prefer GOOGLE_CREDENTIALS_FILE over the JSON env var"""
+        creds_file = tmp_path / "creds.json"
+        creds_file.write_text(json.dumps({"type": "service_account", "project_id": "from-file"}))
+        monkeypatch.setenv("GOOGLE_CREDENTIALS_FILE", str(creds_file))
+        assert get_google_credentials()["project_id"] == "from-file"
+
+    def test_missing_file(self, monkeypatch, tmp_path):
+        """Should raise when the credentials file does not exist"""
+        monkeypatch.setenv("GOOGLE_CREDENTIALS_FILE", str(tmp_path / "missing.json"))
+        with pytest.raises(RuntimeError, match="not found"):
+            get_google_credentials()
+
+    def test_invalid_json(self, monkeypatch):
+        """Should raise RuntimeError for malformed JSON"""
+        monkeypatch.delenv("GOOGLE_CREDENTIALS_FILE", raising=False)
+        monkeypatch.setenv("GOOGLE_CREDENTIALS_JSON", "{not json")
+        with pytest.raises(RuntimeError, match="Invalid GOOGLE_CREDENTIALS_JSON"):
+            get_google_credentials()
+
+    def test_memoized_until_cleared(self, monkeypatch):
+        """Should parse once and only re-read after clear_env_cache()"""
+        monkeypatch.delenv("GOOGLE_CREDENTIALS_FILE", raising=False)
+        monkeypatch.setenv("GOOGLE_CREDENTIALS_JSON", '{"project_id": "first"}')
+        first = get_google_credentials()
+
+        monkeypatch.setenv("GOOGLE_CREDENTIALS_JSON", '{"project_id": "second"}')
+        assert get_google_credentials() is first
+
+        clear_env_cache()
+        assert get_google_credentials()["project_id"] == "second"
+
+
+class TestSimpleGetters:
+    """Tests for port and HMAC getters"""
+
+    def test_port_default(self, monkeypatch):
+        """Should default to 8080"""
+        monkeypatch.delenv("PORT", raising=False)
+        assert get_port() == 8080
+
+    def test_port_from_env(self, monkeypatch):
+        """Should read PORT"""
+        monkeypatch.setenv("PORT", "9000")
+        assert get_port() == 9000
+
+    @pytest.mark.parametrize("value,expected", [
+        ("true", True),
+        ("1", True),
+        ("Yes", True),
+        ("ON", True),
+        ("false", False),
+        ("", False),
+    ])
+    def test_hmac_required(self, env_vars, value, expected):
+        """Should accept the usual truthy spellings"""
+        env_vars(MCP_HMAC_REQUIRED=value)
+        assert is_hmac_required() is expected
+
+    def test_hmac_secret(self, env_vars):
+        """Should return None for an empty secret"""
+        env_vars(MCP_HMAC_SECRET="")
+        assert get_hmac_secret() is None
+        env_vars(MCP_HMAC_SECRET="s3cret")
+        assert get_hmac_secret() == "s3cret"
+
+    def test_values_cache_ttl(self, monkeypatch, env_vars):
+        """Should be None when unset and clamp negative values to 0"""
+        monkeypatch.delenv("SHEETS_VALUES_CACHE_TTL", raising=False)
+        assert get_values_cache_ttl() is None
+        env_vars(SHEETS_VALUES_CACHE_TTL="60")
+        assert get_values_cache_ttl() == 60.0
+        env_vars(SHEETS_VALUES_CACHE_TTL="-5")
+        assert get_values_cache_ttl() == 0.0
+
+    def test_mock_hmac_secret_fixture(self, mock_hmac_secret):
+        """Should see both HMAC variables set by the fixture"""
+        assert is_hmac_required() is True
+        assert get_hmac_secret() == mock_hmac_secret
+
+
+class TestEnvFile:
+    """Tests for lazy .env discovery"""
+
+    def test_find_env_file_memoized(self):
+        """Should only probe the filesystem once"""
+        assert env_loader._find_env_file() is env_loader._find_env_file()
+        assert env_loader._find_env_file.cache_info().currsize == 1
@@ -5,7 +5,10 @@ Pure functions that can be tested without mocking Google Sheets.
 import pytest
 
 from lib.common import normalize, to_number_or_none, ok, ng
-from lib.sheet_utils import norm_header, pick_col, tokenize, parse_monthly_goal, col_letter_to_index, extract_spreadsheet_id
+from lib.sheet_utils import (
+    norm_header, pick_col, tokenize, parse_monthly_goal, col_letter_to_index,
+    extract_spreadsheet_id, row_range_updates,
+)
 from lib.id_rules import decide_prefix, next_id_for_prefix, extract_ids_from_values
 from lib.input_parser import (
     strip_quotes as _strip_quotes,
@@ -244,6 +247,24 @@ class TestColLetterToIndex:
         assert col_letter_to_index("aa") == 26
 
 
+class TestRowRangeUpdates:
+    """Tests for row_range_updates function"""
+
+    def test_contiguous_columns_share_one_range(self):
+        result = row_range_updates(5, {2: "c", 1: "b", 3: "d"})
+        assert result == [{"range": "B5:D5", "values": [["b", "c", "d"]]}]
+
+    def test_gaps_split_ranges(self):
+        result = row_range_updates(2, {0: "a", 4: "e"})
+        assert result == [
+            {"range": "A2", "values": [["a"]]},
+            {"range": "E2", "values": [["e"]]},
+        ]
+
+    def test_empty(self):
+        assert row_range_updates(2, {}) == []
+
+
 class TestToNumberOrNone:
     """Tests for to_number_or_none function"""
 
@@ -29,7 +29,7 @@ class TestPlannerHandlerResolve:
         mock_sheets = MagicMock()
         mock_ss = MagicMock()
         mock_sheets.open_by_id.return_value = mock_ss
-        mock_ss.worksheet.return_value = MagicMock()
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
 
         handler = PlannerHandler(mock_sheets)
         result = handler.resolve_planner(spreadsheet_id="direct-id-12345")
@@ -48,13 +48,135 @@ class TestPlannerHandlerResolve:
         ]
         mock_ss = MagicMock()
         mock_sheets.open_by_id.return_value = mock_ss
-        mock_ss.worksheet.return_value = MagicMock()
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
 
         handler = PlannerHandler(mock_sheets)
         result = handler.resolve_planner(student_id="s001")
 
         assert result.file_id == "1abc-XYZ_123456789012345678901234567890"
 
+    def test_resolve_prefers_known_sheet_name_from_metadata(self):
+        """Should pick a known weekly sheet from one title listing without probing cells."""
+        from handlers.planner import PlannerHandler
+
+        mock_sheets = MagicMock()
+        mock_ss = MagicMock()
+        mock_sheets.open_by_id.return_value = mock_ss
+        mock_ss.worksheets.return_value = [MagicMock(title="表紙"), MagicMock(title="週間計画")]
+
+        handler = PlannerHandler(mock_sheets)
+        result = handler.resolve_planner(spreadsheet_id="direct-id-12345")
+
+        assert result.sheet_name == "週間計画"
+        mock_ss.worksheet.assert_not_called()
+        mock_ss.values_batch_get.assert_not_called()
+
+    def test_resolve_scans_a4_of_all_sheets_in_one_request(self):
+        """Should fall back to one batch read of every sheet's A4."""
+        from handlers.planner import PlannerHandler
+
+        mock_sheets = MagicMock()
+        mock_ss = MagicMock()
+        mock_sheets.open_by_id.return_value = mock_ss
+        mock_ss.worksheets.return_value = [MagicMock(title="表紙"), MagicMock(title="Bob's plan")]
+        mock_ss.values_batch_get.return_value = {"valueRanges": [
+            {"range": "'表紙'!A4"},
+            {"range": "'Bob''s plan'!A4", "values": [[" 261gMA001 "]]},
+        ]}
+
+        handler = PlannerHandler(mock_sheets)
+        result = handler.resolve_planner(spreadsheet_id="direct-id-12345")
+
+        assert result.sheet_name == "Bob's plan"
+        mock_ss.values_batch_get.assert_called_once_with(["'表紙'!A4", "'Bob''s plan'!A4"])
+
+    def test_resolve_reads_a4_per_sheet_when_batch_read_fails(self):
+        """Should fall back to per-sheet A4 reads and keep the first match in sheet order."""
+        from handlers.planner import PlannerHandler
+
+        sheets = [MagicMock(title=t) for t in ("表紙", "計画A", "計画B")]
+        for ws, a4 in zip(sheets, ["", "261gMA001", "262gEN001"]):
+            ws.acell.return_value.value = a4
+        mock_sheets = MagicMock()
+        mock_ss = MagicMock()
+        mock_sheets.open_by_id.return_value = mock_ss
+        mock_ss.worksheets.return_value = sheets
+        mock_ss.values_batch_get.side_effect = Exception("unsupported")
+
+        handler = PlannerHandler(mock_sheets)
+        result = handler.resolve_planner(spreadsheet_id="direct-id-12345")
+
+        assert result.sheet_name == "計画A"
+        for ws in sheets:
+            ws.acell.assert_called_once_with("A4")
+
+    def test_resolve_reuses_student_map_for_same_values(self):
+        """Should parse the Students Master once per values list."""
+        from handlers.planner import PlannerHandler
+        from lib.sheet_utils import pick_col
+
+        values = [
+            ["生徒ID", "名前", "プランナーID"],
+            ["s001", "田中太郎", "planner-1"],
+            ["s002", "鈴木花子", "planner-2"],
+        ]
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = values
+
+        handler = PlannerHandler(mock_sheets)
+        with patch("handlers.planner.handler.pick_col", wraps=pick_col) as pick:
+            assert handler._resolve_spreadsheet_id("s001", None) == "planner-1"
+            assert handler._resolve_spreadsheet_id("s002", None) == "planner-2"
+            built_calls = pick.call_count
+
+            mock_sheets.get_all_values.return_value = [values[0], ["s001", "田中太郎", "planner-9"]]
+            assert handler._resolve_spreadsheet_id("s001", None) == "planner-9"
+
+        assert built_calls == 3  # id, planner_sheet_id, planner_link columns resolved once
+        assert pick.call_count == 6
+
+    def test_resolve_remembers_weekly_sheet_per_spreadsheet(self):
+        """Should probe a spreadsheet's sheets once until invalidated."""
+        from handlers.planner import PlannerHandler
+
+        mock_sheets = MagicMock()
+        mock_ss = MagicMock()
+        mock_sheets.open_by_id.return_value = mock_ss
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
+
+        handler = PlannerHandler(mock_sheets)
+        handler.resolve_planner(spreadsheet_id="sheet-a")
+        result = PlannerHandler(mock_sheets).resolve_planner(spreadsheet_id="sheet-a")
+
+        assert result.sheet_name == "週間管理"
+        assert mock_ss.worksheets.call_count == 1
+
+        PlannerHandler.invalidate_weekly_sheet("sheet-a")
+        handler.resolve_planner(spreadsheet_id="sheet-a")
+        assert mock_ss.worksheets.call_count == 2
+
+    def test_resolve_reprobes_weekly_sheet_after_ttl(self, monkeypatch):
+        """Should pick up a renamed weekly sheet once the remembered name expires."""
+        import handlers.planner.handler as planner_module
+        from handlers.planner import PlannerHandler
+
+        now = [1000.0]
+        monkeypatch.setattr(planner_module.time, "monotonic", lambda: now[0])
+        mock_sheets = MagicMock()
+        mock_ss = MagicMock()
+        mock_sheets.open_by_id.return_value = mock_ss
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
+
+        handler = PlannerHandler(mock_sheets)
+        assert handler.resolve_planner(spreadsheet_id="sheet-a").sheet_name == "週間管理"
+
+        mock_ss.worksheets.return_value = [MagicMock(title="週間計画")]
+        now[0] += planner_module.WEEKLY_SHEET_TTL_SECONDS - 1
+        assert handler.resolve_planner(spreadsheet_id="sheet-a").sheet_name == "週間管理"
+        now[0] += 1
+        assert handler.resolve_planner(spreadsheet_id="sheet-a").sheet_name == "週間計画"
+        assert mock_ss.worksheets.call_count == 2
+
     def test_resolve_not_found(self):
         """Should return error when planner not found."""
         from handlers.planner import PlannerHandler
@@ -81,7 +203,7 @@ class TestPlannerHandlerIdsList:
         mock_sheets = MagicMock()
         mock_ss = MagicMock()
         mock_sheets.open_by_id.return_value = mock_ss
-        mock_ss.worksheet.return_value = MagicMock()
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
         mock_sheets.get_range.return_value = [
             ["261gMA001", "数学", "青チャート", "1日2問"],
             ["261gEN001", "英語", "長文読解", "1日1題"],
@@ -95,6 +217,28 @@ class TestPlannerHandlerIdsList:
         assert result["data"]["items"][0]["book_id"] == "gMA001"
         assert result["data"]["items"][0]["subject"] == "数学"
 
+    def test_ids_list_stops_at_first_empty_a(self):
+        """Rows after the first empty A cell should be ignored."""
+        from handlers.planner import PlannerHandler
+
+        mock_sheets = MagicMock()
+        mock_ss = MagicMock()
+        mock_sheets.open_by_id.return_value = mock_ss
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
+        mock_sheets.get_range.return_value = [
+            ["261gMA001", "数学", "青チャート"],
+            [],
+            ["261gEN001", "英語", "長文読解", "1日1題"],
+        ]
+
+        handler = PlannerHandler(mock_sheets)
+        result = handler.ids_list(spreadsheet_id="test-id")
+
+        items = result["data"]["items"]
+        assert result["data"]["count"] == 1
+        assert items[0]["row"] == 4
+        assert items[0]["guideline_note"] == ""
+
 
 class TestPlannerHandlerDates:
     """Tests for dates_get and dates_set methods."""
@@ -106,8 +250,10 @@ class TestPlannerHandlerDates:
         mock_sheets = MagicMock()
         mock_ss = MagicMock()
         mock_sheets.open_by_id.return_value = mock_ss
-        mock_ss.worksheet.return_value = MagicMock()
-        mock_sheets.get_cell.side_effect = ["2025-01-06", "2025-01-13", "2025-01-20", "2025-01-27", "2025-02-03"]
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
+        mock_sheets.batch_get.return_value = [
+            [["2025-01-06"]], [["2025-01-13"]], [["2025-01-20"]], [["2025-01-27"]], [],
+        ]
 
         handler = PlannerHandler(mock_sheets)
         result = handler.dates_get(spreadsheet_id="test-id")
@@ -115,6 +261,11 @@ class TestPlannerHandlerDates:
         assert result["ok"] is True
         assert len(result["data"]["week_starts"]) == 5
         assert result["data"]["week_starts"][0] == "2025-01-06"
+        assert result["data"]["week_starts"][4] == ""
+        mock_sheets.batch_get.assert_called_once_with(
+            "test-id", "週間管理", ["D1", "L1", "T1", "AB1", "AJ1"]
+        )
+        mock_sheets.get_cell.assert_not_called()
 
     def test_dates_set_requires_start_date(self):
         """Should return error when start_date is missing."""
@@ -135,7 +286,7 @@ class TestPlannerHandlerDates:
         mock_sheets = MagicMock()
         mock_ss = MagicMock()
         mock_sheets.open_by_id.return_value = mock_ss
-        mock_ss.worksheet.return_value = MagicMock()
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
 
         handler = PlannerHandler(mock_sheets)
         result = handler.dates_set("2025-01-06", spreadsheet_id="test-id")
@@ -155,18 +306,23 @@ class TestPlannerHandlerMetrics:
         mock_sheets = MagicMock()
         mock_ss = MagicMock()
         mock_sheets.open_by_id.return_value = mock_ss
-        mock_ss.worksheet.return_value = MagicMock()
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
         # Return mock data for each week's range
-        mock_sheets.get_range.return_value = [
+        mock_sheets.batch_get.return_value = [[
             ["60", "5", "10"],  # Row 4: 60 min, 5 units, 10 guideline
             ["30", "3", "5"],   # Row 5
-        ]
+        ]] * 5
 
         handler = PlannerHandler(mock_sheets)
         result = handler.metrics_get(spreadsheet_id="test-id")
 
         assert result["ok"] is True
         assert len(result["data"]["weeks"]) == 5
+        assert result["data"]["weeks"][0]["items"][0]["weekly_minutes"] == 60
+        mock_sheets.batch_get.assert_called_once_with(
+            "test-id", "週間管理",
+            ["E4:G30", "M4:O30", "U4:W30", "AC4:AE30", "AK4:AM30"],
+        )
 
 
 class TestPlannerHandlerPlanGet:
@@ -179,17 +335,20 @@ class TestPlannerHandlerPlanGet:
         mock_sheets = MagicMock()
         mock_ss = MagicMock()
         mock_sheets.open_by_id.return_value = mock_ss
-        mock_ss.worksheet.return_value = MagicMock()
-        mock_sheets.get_range.return_value = [
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
+        mock_sheets.batch_get.return_value = [[
             ["1-10"],  # Row 4
             ["11-20"], # Row 5
-        ]
+        ]] * 5
 
         handler = PlannerHandler(mock_sheets)
         result = handler.plan_get(spreadsheet_id="test-id")
 
         assert result["ok"] is True
         assert len(result["data"]["weeks"]) == 5
+        assert result["data"]["weeks"][4]["column"] == "AN"
+        assert result["data"]["weeks"][4]["items"][1]["plan_text"] == "11-20"
+        mock_sheets.batch_get.assert_called_once()
 
 
 class TestPlannerHandlerPlanSet:
@@ -202,9 +361,9 @@ class TestPlannerHandlerPlanSet:
         mock_sheets = MagicMock()
         mock_ss = MagicMock()
         mock_sheets.open_by_id.return_value = mock_ss
-        mock_ss.worksheet.return_value = MagicMock()
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
         mock_sheets.get_range.return_value = [["261gMA001", "数学", "青チャート", ""]]
-        mock_sheets.get_cell.side_effect = ["261gMA001", "60", ""]  # A, time, plan
+        mock_sheets.batch_get.return_value = [[["261gMA001"]], [["60"]], []]  # A, time, plan
 
         handler = PlannerHandler(mock_sheets)
         result = handler.plan_set(
@@ -216,6 +375,35 @@ class TestPlannerHandlerPlanSet:
 
         assert result["ok"] is True
         assert result["data"]["updated"] is True
+        mock_sheets.batch_get.assert_called_once_with("test-id", "週間管理", ["A4", "E4", "H4"])
+        mock_sheets.get_range.assert_not_called()  # row given: no ABCD read
+        mock_sheets.update_cell.assert_called_once_with("test-id", "週間管理", "H4", "1-10")
+
+    def test_plan_set_single_mode_resolves_book_id(self):
+        """Should read ABCD only to resolve book_id, then check the row."""
+        from handlers.planner import PlannerHandler
+
+        mock_sheets = MagicMock()
+        mock_ss = MagicMock()
+        mock_sheets.open_by_id.return_value = mock_ss
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
+        mock_sheets.get_range.return_value = [
+            ["261gMA001", "数学", "青チャート", ""],
+            ["261gEN001", "英語", "長文読解", ""],
+        ]
+        mock_sheets.batch_get.return_value = [[["261gEN001"]], [["60"]], [["済"]]]
+
+        handler = PlannerHandler(mock_sheets)
+        result = handler.plan_set(
+            week_index=2,
+            plan_text="11-20",
+            book_id="gEN001",
+            spreadsheet_id="test-id"
+        )
+
+        assert result["ok"] is False
+        assert result["error"]["code"] == "ALREADY_EXISTS"
+        mock_sheets.batch_get.assert_called_once_with("test-id", "週間管理", ["A5", "M5", "P5"])
 
     def test_plan_set_rejects_too_long(self):
         """Should reject plan_text that exceeds max length."""
@@ -224,7 +412,7 @@ class TestPlannerHandlerPlanSet:
         mock_sheets = MagicMock()
         mock_ss = MagicMock()
         mock_sheets.open_by_id.return_value = mock_ss
-        mock_ss.worksheet.return_value = MagicMock()
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
         mock_sheets.get_range.return_value = [["261gMA001", "数学", "青チャート", ""]]
 
         handler = PlannerHandler(mock_sheets)
@@ -245,7 +433,7 @@ class TestPlannerHandlerPlanSet:
         mock_sheets = MagicMock()
         mock_ss = MagicMock()
         mock_sheets.open_by_id.return_value = mock_ss
-        mock_ss.worksheet.return_value = MagicMock()
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
         mock_sheets.get_range.return_value = [["261gMA001", "数学", "青チャート", ""]]
 
         handler = PlannerHandler(mock_sheets)
@@ -266,9 +454,9 @@ class TestPlannerHandlerPlanSet:
         mock_sheets = MagicMock()
         mock_ss = MagicMock()
         mock_sheets.open_by_id.return_value = mock_ss
-        mock_ss.worksheet.return_value = MagicMock()
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
         mock_sheets.get_range.return_value = [["261gMA001", "数学", "青チャート", ""]]
-        mock_sheets.get_cell.side_effect = ["261gMA001", "60", ""] * 3  # Repeated for multiple items
+        mock_sheets.batch_get.return_value = [[["261gMA001"]], [["60"]], [], [["60"]], []]  # A4, then time/plan per week
 
         handler = PlannerHandler(mock_sheets)
         result = handler.plan_set(
@@ -281,6 +469,98 @@ class TestPlannerHandlerPlanSet:
 
         assert result["ok"] is True
 
+    def test_plan_set_batch_reads_and_writes_once(self):
+        """Should check every item from one batch read and write accepted cells together."""
+        from handlers.planner import PlannerHandler
+
+        mock_sheets = MagicMock()
+        mock_ss = MagicMock()
+        mock_sheets.open_by_id.return_value = mock_ss
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
+        mock_sheets.get_range.return_value = [["261gMA001", "数学", "青チャート", ""]]
+        mock_sheets.batch_get.return_value = [
+            [["261gMA001"]], [["60"]], [],  # A4, week 1 time/plan: writable
+            [["60"]], [["済"]],             # Week 2: plan already set
+            [], [],                         # Week 3: no weekly minutes
+        ]
+
+        handler = PlannerHandler(mock_sheets)
+        result = handler.plan_set(
+            items=[
+                {"week_index": 1, "row": 4, "plan_text": "1-10"},
+                {"week_index": 2, "row": 4, "plan_text": "11-20"},
+                {"week_index": 6, "row": 4, "plan_text": "x"},
+                {"week_index": 3, "book_id": "gMA001", "plan_text": "21-30"},
+            ],
+            spreadsheet_id="test-id"
+        )
+
+        results = result["data"]["results"]
+        assert [r["ok"] for r in results] == [True, False, False, False]
+        assert results[1]["error"]["code"] == "ALREADY_EXISTS"
+        assert results[2]["error"]["code"] == "BAD_WEEK"
+        assert results[3]["error"]["code"] == "PRECONDITION_TIME_EMPTY"
+        mock_sheets.batch_get.assert_called_once_with(
+            "test-id", "週間管理", ["A4", "E4", "H4", "M4", "P4", "U4", "X4"]
+        )
+        mock_sheets.batch_update.assert_called_once_with(
+            "test-id", "週間管理", [{"range": "H4", "values": [["1-10"]]}],
+            value_input_option="USER_ENTERED",
+        )
+        mock_sheets.get_cell.assert_not_called()
+
+
+    def test_plan_set_batch_bad_row_fails_only_that_item(self):
+        """Should report BAD_ROW per item and still write the valid ones."""
+        from handlers.planner import PlannerHandler
+
+        mock_sheets = MagicMock()
+        mock_ss = MagicMock()
+        mock_sheets.open_by_id.return_value = mock_ss
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
+        mock_sheets.batch_get.return_value = [[["261gMA001"]], [["60"]], []]
+
+        handler = PlannerHandler(mock_sheets)
+        result = handler.plan_set(
+            items=[
+                {"week_index": 1, "row": -3, "plan_text": "x"},
+                {"week_index": 1, "row": 4, "plan_text": "1-10"},
+                {"week_index": 1, "row": "abc", "plan_text": "x"},
+                {"week_index": 1, "row": 31, "plan_text": "x"},
+            ],
+            spreadsheet_id="test-id"
+        )
+
+        results = result["data"]["results"]
+        assert [r["ok"] for r in results] == [False, True, False, False]
+        assert {results[i]["error"]["code"] for i in (0, 2, 3)} == {"BAD_ROW"}
+        mock_sheets.batch_get.assert_called_once_with("test-id", "週間管理", ["A4", "E4", "H4"])
+        mock_sheets.batch_update.assert_called_once_with(
+            "test-id", "週間管理", [{"range": "H4", "values": [["1-10"]]}],
+            value_input_option="USER_ENTERED",
+        )
+
+    def test_plan_set_batch_overwrite_skips_plan_read(self):
+        """Should not read the plan cell for items allowed to overwrite."""
+        from handlers.planner import PlannerHandler
+
+        mock_sheets = MagicMock()
+        mock_ss = MagicMock()
+        mock_sheets.open_by_id.return_value = mock_ss
+        mock_ss.worksheets.return_value = [MagicMock(title="週間管理")]
+        mock_sheets.get_range.return_value = [["261gMA001", "数学", "青チャート", ""]]
+        mock_sheets.batch_get.return_value = [[["261gMA001"]], [["60"]]]
+
+        handler = PlannerHandler(mock_sheets)
+        result = handler.plan_set(
+            items=[{"week_index": 1, "row": 4, "plan_text": "1-10"}],
+            overwrite=True,
+            spreadsheet_id="test-id"
+        )
+
+        assert result["data"]["results"] == [{"ok": True, "cell": "H4"}]
+        mock_sheets.batch_get.assert_called_once_with("test-id", "週間管理", ["A4", "E4"])
+        mock_sheets.get_range.assert_not_called()  # Every item has a row
 
 class TestPlannerHandlerMonthlyFilter:
     """Tests for monthly_filter method."""
@@ -295,8 +575,7 @@ class TestPlannerHandlerMonthlyFilter:
         mock_sheets.open_by_id.return_value = mock_ss
         # monthly_filter directly opens the monthly sheet by name
         mock_ss.worksheet.return_value = mock_ws
-        mock_ws.get_all_values.return_value = [
-            ["ID", "年", "月", "D", "E", "F", "書籍ID", "教科", "タイトル", "備考", "負荷", "月時間", "目安量", "W1", "W2", "W3", "W4", "W5"],
+        mock_ws.get.return_value = [  # Rows from A2 (below the header)
             ["code1", "25", "1", "", "", "", "gMA001", "数学", "青チャート", "note", "5", "60", "10", "A", "B", "C", "D", "E"],
             ["code2", "25", "2", "", "", "", "gEN001", "英語", "長文", "note", "3", "30", "5", "X", "Y", "Z", "", ""],
         ]
@@ -318,8 +597,7 @@ class TestPlannerHandlerMonthlyFilter:
         mock_sheets.open_by_id.return_value = mock_ss
         # monthly_filter directly opens the monthly sheet by name
         mock_ss.worksheet.return_value = mock_ws
-        mock_ws.get_all_values.return_value = [
-            ["ID", "年", "月"],
+        mock_ws.get.return_value = [
             ["code1", "25", "1"],
         ]
 
@@ -329,6 +607,31 @@ class TestPlannerHandlerMonthlyFilter:
         assert result["ok"] is True
         assert result["data"]["year"] == 25
 
+    def test_monthly_filter_reads_formatted_values(self):
+        """Should read A2:R formatted, keeping display text of week cells."""
+        from handlers.planner import PlannerHandler
+
+        mock_sheets = MagicMock()
+        mock_ss = MagicMock()
+        mock_ws = MagicMock()
+        mock_sheets.open_by_id.return_value = mock_ss
+        mock_ss.worksheet.return_value = mock_ws
+        mock_ws.get.return_value = [
+            ["", "", ""],
+            ["code1", " 25", "1", "", "", "", "gMA001", "数学", "青チャート", "", "5", "60",
+             "10", "1:30", "50%", "", "", ""],
+            ["code2", "年", "月"],
+        ]
+
+        handler = PlannerHandler(mock_sheets)
+        result = handler.monthly_filter(year=25, month=1, spreadsheet_id="test-id")
+
+        assert result["data"]["count"] == 1
+        item = result["data"]["items"][0]
+        assert (item["row"], item["month_code"], item["monthly_minutes"]) == (3, 251, 60)
+        assert [w["actual"] for w in item["weeks"]] == ["1:30", "50%", "", "", ""]
+        mock_ws.get.assert_called_once_with("A2:R")
+
     def test_monthly_filter_validates_month(self):
         """Should validate month is 1-12."""
         from handlers.planner import PlannerHandler
@@ -349,37 +652,37 @@ class TestPlannerHandlerBookCodeParsing:
         """Should parse month code and book ID from A column."""
         from handlers.planner import _parse_book_code
 
-        result = _parse_book_code("261gMA001")
+        month_code, book_id = _parse_book_code("261gMA001")
 
-        assert result["month_code"] == 261
-        assert result["book_id"] == "gMA001"
+        assert month_code == 261
+        assert book_id == "gMA001"
 
     def test_parse_book_code_with_4digit_month(self):
         """Should handle 4-digit month codes."""
         from handlers.planner import _parse_book_code
 
-        result = _parse_book_code("2512gMA001")
+        month_code, book_id = _parse_book_code("2512gMA001")
 
-        assert result["month_code"] == 2512
-        assert result["book_id"] == "gMA001"
+        assert month_code == 2512
+        assert book_id == "gMA001"
 
     def test_parse_book_code_empty(self):
         """Should handle empty input."""
         from handlers.planner import _parse_book_code
 
-        result = _parse_book_code("")
+        month_code, book_id = _parse_book_code("")
 
-        assert result["month_code"] is None
-        assert result["book_id"] == ""
+        assert month_code is None
+        assert book_id == ""
 
     def test_parse_book_code_no_prefix(self):
         """Should handle input without month code prefix."""
         from handlers.planner import _parse_book_code
 
-        result = _parse_book_code("gMA001")
+        month_code, book_id = _parse_book_code("gMA001")
 
-        assert result["month_code"] is None
-        assert result["book_id"] == "gMA001"
+        assert month_code is None
+        assert book_id == "gMA001"
 
 
 class TestPlannerHandlerMonthlyFilterMultiple:
@@ -392,7 +695,7 @@ class TestPlannerHandlerMonthlyFilterMultiple:
         mock_ws = MagicMock()
         mock_sheets.open_by_id.return_value = mock_ss
         mock_ss.worksheet.return_value = mock_ws
-        mock_ws.get_all_values.return_value = data
+        mock_ws.get.return_value = data[1:]  # Monthly rows are read from A2
         return mock_sheets
 
     def test_multiple_year_months_returns_combined_items(self):
@@ -7,26 +7,12 @@ Updated for direct Google Sheets API architecture.
 import pytest
 from unittest.mock import patch, MagicMock
 
-from server import (
-    planner_ids_list,
-    planner_dates_get,
-    planner_dates_set,
-    planner_metrics_get,
-    planner_plan_get,
-    planner_plan_set,
-    planner_plan_create,
-    planner_monthly_filter,
-    planner_guidance,
-    monthplan_get,
-    monthplan_set,
-)
-
 
 class TestPlannerIdsList:
     """Tests for planner_ids_list tool"""
 
     @pytest.mark.asyncio
-    async def test_list_ids_with_spreadsheet_id(self, mock_sheets_client, mock_handler_responses):
+    async def test_list_ids_with_spreadsheet_id(self, mock_sheets_client, mock_handler_responses, planner_ids_list):
         """Should list planner IDs with spreadsheet_id"""
         mock_handler = MagicMock()
         mock_handler.ids_list.return_value = mock_handler_responses["planner.ids_list"]
@@ -37,7 +23,7 @@ class TestPlannerIdsList:
             assert "items" in result.get("data", {})
 
     @pytest.mark.asyncio
-    async def test_list_ids_with_student_id(self, mock_sheets_client, mock_handler_responses):
+    async def test_list_ids_with_student_id(self, mock_sheets_client, mock_handler_responses, planner_ids_list):
         """Should list planner IDs with student_id"""
         mock_handler = MagicMock()
         mock_handler.ids_list.return_value = mock_handler_responses["planner.ids_list"]
@@ -47,7 +33,7 @@ class TestPlannerIdsList:
             assert result.get("ok") is True
 
     @pytest.mark.asyncio
-    async def test_list_ids_requires_identifier(self):
+    async def test_list_ids_requires_identifier(self, planner_ids_list):
         """Should require student_id or spreadsheet_id"""
         result = await planner_ids_list()
         assert result.get("ok") is False
@@ -58,7 +44,7 @@ class TestPlannerDatesGet:
     """Tests for planner_dates_get tool"""
 
     @pytest.mark.asyncio
-    async def test_get_dates(self, mock_sheets_client, mock_handler_responses):
+    async def test_get_dates(self, mock_sheets_client, mock_handler_responses, planner_dates_get):
         """Should get week start dates"""
         mock_handler = MagicMock()
         mock_handler.dates_get.return_value = mock_handler_responses["planner.dates.get"]
@@ -73,7 +59,7 @@ class TestPlannerDatesSet:
     """Tests for planner_dates_set tool"""
 
     @pytest.mark.asyncio
-    async def test_set_dates(self, mock_sheets_client):
+    async def test_set_dates(self, mock_sheets_client, planner_dates_set):
         """Should set week start date"""
         response = {"ok": True, "op": "planner.dates.set", "data": {"updated": True}}
         mock_handler = MagicMock()
@@ -87,7 +73,7 @@ class TestPlannerDatesSet:
             assert result.get("ok") is True
 
     @pytest.mark.asyncio
-    async def test_set_dates_requires_start_date(self):
+    async def test_set_dates_requires_start_date(self, planner_dates_set):
         """Should require start_date"""
         result = await planner_dates_set(
             start_date=None,
@@ -101,7 +87,7 @@ class TestPlannerMetricsGet:
     """Tests for planner_metrics_get tool"""
 
     @pytest.mark.asyncio
-    async def test_get_metrics(self, mock_sheets_client, mock_handler_responses):
+    async def test_get_metrics(self, mock_sheets_client, mock_handler_responses, planner_metrics_get):
         """Should get planner metrics"""
         mock_handler = MagicMock()
         mock_handler.metrics_get.return_value = mock_handler_responses["planner.metrics.get"]
@@ -116,11 +102,12 @@ class TestPlannerPlanGet:
     """Tests for planner_plan_get tool"""
 
     @pytest.mark.asyncio
-    async def test_get_plan(self, mock_sheets_client, mock_handler_responses):
+    async def test_get_plan(self, mock_sheets_client, mock_handler_responses_mut, planner_plan_get):
         """Should get plan data with metrics"""
+        # planner_plan_get merges metrics into the plan items in place
         mock_handler = MagicMock()
-        mock_handler.plan_get.return_value = mock_handler_responses["planner.plan.get"]
-        mock_handler.metrics_get.return_value = mock_handler_responses["planner.metrics.get"]
+        mock_handler.plan_get.return_value = mock_handler_responses_mut["planner.plan.get"]
+        mock_handler.metrics_get.return_value = mock_handler_responses_mut["planner.metrics.get"]
         with patch("server.get_sheets_client", return_value=mock_sheets_client), \
              patch("server.PlannerHandler", return_value=mock_handler):
             result = await planner_plan_get(spreadsheet_id="test-sheet-id")
@@ -132,7 +119,7 @@ class TestPlannerPlanSet:
     """Tests for planner_plan_set tool"""
 
     @pytest.mark.asyncio
-    async def test_set_plan(self, mock_sheets_client, mock_handler_responses):
+    async def test_set_plan(self, mock_sheets_client, mock_handler_responses, planner_plan_set):
         """Should set plan entry"""
         mock_handler = MagicMock()
         mock_handler.plan_set.return_value = mock_handler_responses["planner.plan.set"]
@@ -151,7 +138,7 @@ class TestPlannerPlanCreate:
     """Tests for planner_plan_create tool"""
 
     @pytest.mark.asyncio
-    async def test_create_plan(self, mock_sheets_client, mock_handler_responses):
+    async def test_create_plan(self, mock_sheets_client, mock_handler_responses, planner_plan_create):
         """Should create plan entries"""
         mock_handler = MagicMock()
         mock_handler.dates_get.return_value = mock_handler_responses["planner.dates.get"]
@@ -163,14 +150,14 @@ class TestPlannerPlanCreate:
             assert result.get("ok") is True
 
     @pytest.mark.asyncio
-    async def test_create_requires_items(self):
+    async def test_create_requires_items(self, planner_plan_create):
         """Should require items"""
         result = await planner_plan_create(items=None, spreadsheet_id="test-sheet-id")
         assert result.get("ok") is False
         assert "error" in result
 
     @pytest.mark.asyncio
-    async def test_create_empty_items(self):
+    async def test_create_empty_items(self, planner_plan_create):
         """Should handle empty items list"""
         result = await planner_plan_create(items=[], spreadsheet_id="test-sheet-id")
         assert result.get("ok") is False
@@ -180,7 +167,7 @@ class TestPlannerMonthlyFilter:
     """Tests for planner_monthly_filter tool"""
 
     @pytest.mark.asyncio
-    async def test_filter_by_year_month(self, mock_sheets_client):
+    async def test_filter_by_year_month(self, mock_sheets_client, planner_monthly_filter):
         """Should filter by year and month"""
         response = {
             "ok": True,
@@ -208,7 +195,7 @@ class TestPlannerMonthlyFilter:
             assert "items" in result.get("data", {})
 
     @pytest.mark.asyncio
-    async def test_filter_normalizes_year(self, mock_sheets_client):
+    async def test_filter_normalizes_year(self, mock_sheets_client, planner_monthly_filter):
         """Should normalize 4-digit year to 2-digit"""
         response = {
             "ok": True,
@@ -231,7 +218,7 @@ class TestPlannerMonthlyFilterMultiple:
     """Tests for planner_monthly_filter with year_months parameter"""
 
     @pytest.mark.asyncio
-    async def test_multiple_year_months(self, mock_sheets_client):
+    async def test_multiple_year_months(self, mock_sheets_client, planner_monthly_filter):
         """Should pass year_months to handler"""
         response = {
             "ok": True,
@@ -262,7 +249,7 @@ class TestPlannerMonthlyFilterMultiple:
             assert "by_month" in result.get("data", {})
 
     @pytest.mark.asyncio
-    async def test_year_months_passed_to_handler(self, mock_sheets_client):
+    async def test_year_months_passed_to_handler(self, mock_sheets_client, planner_monthly_filter):
         """Should correctly pass year_months parameter to handler"""
         mock_handler = MagicMock()
         mock_handler.monthly_filter.return_value = {"ok": True, "data": {}}
@@ -279,7 +266,7 @@ class TestPlannerMonthlyFilterMultiple:
             assert call_kwargs["year_months"] == [{"year": 2025, "month": 8}]
 
     @pytest.mark.asyncio
-    async def test_backward_compatible_single_month(self, mock_sheets_client):
+    async def test_backward_compatible_single_month(self, mock_sheets_client, planner_monthly_filter):
         """Should still work with year/month params"""
         response = {
             "ok": True,
@@ -304,14 +291,14 @@ class TestPlannerGuidance:
     """Tests for planner_guidance tool"""
 
     @pytest.mark.asyncio
-    async def test_get_guidance(self):
+    async def test_get_guidance(self, planner_guidance):
         """Should return guidance data"""
         result = await planner_guidance()
         assert result.get("ok") is True
         assert "data" in result
 
     @pytest.mark.asyncio
-    async def test_guidance_contains_structure(self):
+    async def test_guidance_contains_structure(self, planner_guidance):
         """Should contain sheet structure info"""
         result = await planner_guidance()
         data = result.get("data", {})
@@ -321,7 +308,7 @@ class TestPlannerGuidance:
         assert "workflow" in data
 
     @pytest.mark.asyncio
-    async def test_guidance_no_api_call(self):
+    async def test_guidance_no_api_call(self, planner_guidance):
         """Should not require API call - this is a static response"""
         # This should work without any mocking
         result = await planner_guidance()
@@ -333,7 +320,7 @@ class TestMonthplanGet:
     """Tests for monthplan_get tool"""
 
     @pytest.mark.asyncio
-    async def test_get_monthplan_with_spreadsheet_id(self, mock_sheets_client):
+    async def test_get_monthplan_with_spreadsheet_id(self, mock_sheets_client, monthplan_get):
         """Should get monthplan data with spreadsheet_id"""
         response = {
             "ok": True,
@@ -366,7 +353,7 @@ class TestMonthplanGet:
             assert "grand_total" in data
 
     @pytest.mark.asyncio
-    async def test_get_monthplan_with_student_id(self, mock_sheets_client):
+    async def test_get_monthplan_with_student_id(self, mock_sheets_client, monthplan_get):
         """Should get monthplan data with student_id"""
         response = {
             "ok": True,
@@ -381,7 +368,7 @@ class TestMonthplanGet:
             assert result.get("ok") is True
 
     @pytest.mark.asyncio
-    async def test_get_monthplan_requires_identifier(self):
+    async def test_get_monthplan_requires_identifier(self, monthplan_get):
         """Should require student_id or spreadsheet_id"""
         result = await monthplan_get()
         assert result.get("ok") is False
@@ -392,7 +379,7 @@ class TestMonthplanSet:
     """Tests for monthplan_set tool"""
 
     @pytest.mark.asyncio
-    async def test_set_monthplan(self, mock_sheets_client):
+    async def test_set_monthplan(self, mock_sheets_client, monthplan_set):
         """Should set monthplan hours"""
         response = {
             "ok": True,
@@ -418,14 +405,14 @@ class TestMonthplanSet:
             assert result.get("data", {}).get("updated") is True
 
     @pytest.mark.asyncio
-    async def test_set_monthplan_requires_identifier(self):
+    async def test_set_monthplan_requires_identifier(self, monthplan_set):
         """Should require student_id or spreadsheet_id"""
         result = await monthplan_set(items=[{"row": 4, "week": 1, "hours": 3}])
         assert result.get("ok") is False
         assert "error" in result
 
     @pytest.mark.asyncio
-    async def test_set_monthplan_requires_items_list(self):
+    async def test_set_monthplan_requires_items_list(self, monthplan_set):
         """Should require items to be a list"""
         result = await monthplan_set(items="invalid", spreadsheet_id="test-sheet-id")
         assert result.get("ok") is False
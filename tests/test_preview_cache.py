@@ -85,6 +85,16 @@ class TestPreviewCache:
         # but we can verify students still works
 
 
+    def test_prefix_and_token_do_not_collide(self):
+        """Should keep entries apart even when prefix/token contain ':'"""
+        cache = PreviewCache()
+
+        token = cache.store("book", {"id": "1"}, token="upd:abc")
+
+        assert cache.get("book:upd", "abc") is None
+        assert cache.clear_prefix("book:upd") == 0
+        assert cache.get("book", token) == {"id": "1"}
+
     def test_size_property(self):
         """Should report cache size"""
         cache = PreviewCache()
@@ -96,6 +106,38 @@ class TestPreviewCache:
         cache.store("test", {"key": "2"})
         assert cache.size == 2
 
+    def test_expired_tokens_are_rejected(self, monkeypatch):
+        """Should not return entries older than the TTL"""
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        cache = PreviewCache(ttl_seconds=300)
+        token = cache.store("test", {"key": "value"})
+
+        now[0] += 299
+        assert cache.get("test", token) == {"key": "value"}
+        now[0] += 1
+        assert cache.get("test", token) is None
+        assert cache.pop("test", token) is None
+        assert cache.size == 0
+
+    def test_maxsize_evicts_expired_then_oldest(self, monkeypatch):
+        """Should stay within maxsize, dropping expired entries before live ones"""
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        cache = PreviewCache(ttl_seconds=10, maxsize=2)
+        old = cache.store("test", {"n": 1})
+        now[0] += 20
+        second = cache.store("test", {"n": 2})
+        third = cache.store("test", {"n": 3})  # Evicts the expired first entry
+        assert cache.size == 2
+        fourth = cache.store("test", {"n": 4})  # Full of live entries: drops the oldest
+
+        assert cache.size == 2
+        assert cache.get("test", old) is None
+        assert cache.get("test", second) is None
+        assert cache.get("test", third) == {"n": 3}
+        assert cache.get("test", fourth) == {"n": 4}
+
 
 class TestPreviewCacheIntegration:
     """Integration-style tests mimicking actual usage"""
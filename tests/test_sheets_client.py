@@ -0,0 +1,159 @@
+"""
+Tests for SheetsClient caching.
+gspread and google-auth are patched out; only the caching layer is exercised.
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from sheets_client import SheetsClient
+
+
+@pytest.fixture
+def client_and_ws():
+    """SheetsClient backed by a mock gspread client and worksheet."""
+    with patch("sheets_client.Credentials.from_service_account_info"), \
+         patch("sheets_client.gspread.authorize") as mock_authorize:
+        ws = MagicMock()
+        ws.get_all_values.side_effect = lambda: [["ID"], ["gMB001"]]
+        mock_authorize.return_value.open_by_key.return_value.worksheet.return_value = ws
+        yield SheetsClient({"type": "service_account"}), ws
+
+
+class TestValuesCache:
+    """Tests for the get_all_values TTL cache"""
+
+    def test_reuses_values_within_ttl(self, client_and_ws):
+        """Should fetch once and return the same list while fresh"""
+        client, ws = client_and_ws
+        first = client.get_all_values("file", "Sheet1")
+        second = client.get_all_values("file", "Sheet1")
+
+        assert first is second
+        assert ws.get_all_values.call_count == 1
+
+    def test_keys_by_sheet(self, client_and_ws):
+        """Should cache each (spreadsheet, sheet) separately"""
+        client, ws = client_and_ws
+        client.get_all_values("file", "Sheet1")
+        client.get_all_values("file", "Sheet2")
+
+        assert ws.get_all_values.call_count == 2
+
+    def test_refetches_after_ttl(self, client_and_ws):
+        """Should refetch once the entry has expired"""
+        client, ws = client_and_ws
+        with patch("sheets_client.time.monotonic", side_effect=[0.0, 100.0, 100.0]):
+            client.get_all_values("file", "Sheet1")
+            client.get_all_values("file", "Sheet1")
+
+        assert ws.get_all_values.call_count == 2
+
+    @pytest.mark.parametrize("write", [
+        lambda c: c.update_cell("file", "Sheet1", "A1", "x"),
+        lambda c: c.batch_update("file", "Sheet1", [{"range": "A1", "values": [["x"]]}]),
+        lambda c: c.append_rows("file", "Sheet1", [["x"]]),
+        lambda c: c.delete_rows("file", "Sheet1", 2, 1),
+    ])
+    def test_write_invalidates(self, client_and_ws, write):
+        """Should drop the cached values when the sheet is written"""
+        client, ws = client_and_ws
+        client.get_all_values("file", "Sheet1")
+        write(client)
+        client.get_all_values("file", "Sheet1")
+
+        assert ws.get_all_values.call_count == 2
+
+    def test_fresh_bypasses_and_refreshes_cache(self, client_and_ws):
+        """Should refetch when fresh and serve the new values afterwards"""
+        client, ws = client_and_ws
+        client.get_all_values("file", "Sheet1")
+        fresh = client.get_all_values("file", "Sheet1", fresh=True)
+        again = client.get_all_values("file", "Sheet1")
+
+        assert ws.get_all_values.call_count == 2
+        assert again is fresh
+
+    def test_clear_cache_drops_values(self, client_and_ws):
+        """Should drop cached values for the spreadsheet"""
+        client, ws = client_and_ws
+        client.get_all_values("file", "Sheet1")
+        client.clear_cache("file")
+        client.get_all_values("file", "Sheet1")
+
+        assert ws.get_all_values.call_count == 2
+
+    def test_zero_ttl_disables_cache(self):
+        """Should always refetch when the TTL is 0"""
+        with patch("sheets_client.Credentials.from_service_account_info"), \
+             patch("sheets_client.gspread.authorize") as mock_authorize:
+            ws = mock_authorize.return_value.open_by_key.return_value.worksheet.return_value
+            ws.get_all_values.return_value = [["ID"]]
+            client = SheetsClient({"type": "service_account"}, values_ttl_seconds=0)
+            client.get_all_values("file", "Sheet1")
+            client.get_all_values("file", "Sheet1")
+
+        assert ws.get_all_values.call_count == 2
+
+
+class TestGetAllValuesBatch:
+    """Tests for get_all_values_batch"""
+
+    def test_returns_values_in_request_order(self, client_and_ws):
+        """Should read every sheet and keep the order of the pairs"""
+        client, ws = client_and_ws
+        ws.get_all_values.side_effect = None
+        ws.get_all_values.return_value = [["ID"]]
+        cached = client.get_all_values("file", "Sheet1")
+
+        result = client.get_all_values_batch([("file", "Sheet1"), ("file", "Sheet2"), ("other", "Sheet1")])
+
+        assert len(result) == 3
+        assert result[0] is cached  # Served from the values cache
+        assert ws.get_all_values.call_count == 3
+
+    def test_empty_request(self, client_and_ws):
+        """Should return [] without reading anything"""
+        client, ws = client_and_ws
+        assert client.get_all_values_batch([]) == []
+        ws.get_all_values.assert_not_called()
+
+
+class TestBatchUpdate:
+    """Tests for batch_update"""
+
+    def test_passes_value_input_option(self, client_and_ws):
+        """Should forward value_input_option to gspread"""
+        client, ws = client_and_ws
+        updates = [{"range": "H4", "values": [["1/2"]]}]
+        client.batch_update("file", "Sheet1", updates, value_input_option="USER_ENTERED")
+
+        ws.batch_update.assert_called_once_with(updates, value_input_option="USER_ENTERED")
+
+    def test_default_keeps_gspread_default(self, client_and_ws):
+        """Should call gspread without an input option by default"""
+        client, ws = client_and_ws
+        updates = [{"range": "A1", "values": [["x"]]}]
+        client.batch_update("file", "Sheet1", updates)
+
+        ws.batch_update.assert_called_once_with(updates)
+
+
+class TestBatchGet:
+    """Tests for batch_get"""
+
+    def test_reads_all_ranges_in_one_call(self, client_and_ws):
+        """Should issue one worksheet batch_get and return plain lists in order"""
+        client, ws = client_and_ws
+        ws.batch_get.return_value = [[["a"]], [], [["1", "2"]]]
+
+        result = client.batch_get("file", "Sheet1", ["A4", "E4", "F4:G4"])
+
+        assert result == [[["a"]], [], [["1", "2"]]]
+        ws.batch_get.assert_called_once_with(["A4", "E4", "F4:G4"])
+
+    def test_empty_ranges_skip_request(self, client_and_ws):
+        """Should not call the API when no ranges are requested"""
+        client, ws = client_and_ws
+
+        assert client.batch_get("file", "Sheet1", []) == []
+        ws.batch_get.assert_not_called()
@@ -82,6 +82,7 @@ class TestStudentsHandlerList:
 
         assert result["ok"] is True
         assert len(result["data"]["students"]) == 2
+        assert [s["id"] for s in result["data"]["students"]] == ["s001", "s002"]
 
     def test_list_empty_sheet(self):
         """Should return empty list for empty sheet."""
@@ -98,6 +99,25 @@ class TestStudentsHandlerList:
         assert result["ok"] is True
         assert result["data"]["students"] == []
 
+    def test_list_skips_blank_rows(self):
+        """Should skip rows of empty or whitespace cells but keep a zero cell."""
+        from handlers.students import StudentsHandler
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["生徒ID", "名前", "学年"],
+            ["", "", ""],
+            [],
+            [" ", "\u3000", ""],
+            ["", "", 0],
+            ["s001", "田中太郎", "高3"],
+        ]
+
+        handler = StudentsHandler(mock_sheets)
+        result = handler.list()
+
+        assert [s["grade"] for s in result["data"]["students"]] == ["0", "高3"]
+
 
 class TestStudentsHandlerFind:
     """Tests for find method."""
@@ -171,6 +191,24 @@ class TestStudentsHandlerFind:
         assert result["ok"] is True
         assert len(result["data"]["candidates"]) <= 2
 
+    def test_find_limit_keeps_best_scores_in_sheet_order(self):
+        """Should rank an exact match first and keep ties in sheet order."""
+        from handlers.students import StudentsHandler
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["生徒ID", "名前", "学年"],
+            ["s001", "田中一郎", "高3"],
+            ["s002", "田中二郎", "高2"],
+            ["s003", "田中", "高1"],
+        ]
+
+        handler = StudentsHandler(mock_sheets)
+        result = handler.find("田中", limit=2)
+
+        ids = [c["student_id"] for c in result["data"]["candidates"]]
+        assert ids == ["s003", "s001"]
+
 
 class TestStudentsHandlerGet:
     """Tests for get method."""
@@ -241,6 +279,24 @@ class TestStudentsHandlerGet:
         assert "students" in result["data"]
         assert len(result["data"]["students"]) == 2
 
+    def test_get_multiple_returns_first_row_per_id(self):
+        """Should return each requested ID once, from its first row, in sheet order."""
+        from handlers.students import StudentsHandler
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["生徒ID", "名前", "学年"],
+            ["s002", "鈴木花子", "高2"],
+            ["s001", "田中太郎", "高3"],
+            ["s002", "重複", "高1"],
+        ]
+
+        handler = StudentsHandler(mock_sheets)
+        result = handler.get_multiple(["s001", " s002 "])
+
+        names = [s["name"] for s in result["data"]["students"]]
+        assert names == ["鈴木花子", "田中太郎"]
+
 
 class TestStudentsHandlerFilter:
     """Tests for filter method."""
@@ -352,6 +408,37 @@ class TestStudentsHandlerCreate:
         assert result["ok"] is True
         mock_sheets.append_rows.assert_called_once()
 
+    def test_create_many_appends_all_rows_once(self):
+        """Should assign consecutive IDs and append every row in one call."""
+        from handlers.students import StudentsHandler
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["生徒ID", "名前", "学年"],
+            ["gs007", "田中太郎", "高3"],
+        ]
+
+        handler = StudentsHandler(mock_sheets)
+        result = handler.create_many([{"名前": "新入生A"}, {"名前": "新入生B", "学年": "高1"}])
+
+        assert result["data"]["ids"] == ["gs008", "gs009"]
+        mock_sheets.append_rows.assert_called_once_with(
+            handler.file_id, handler.sheet_name,
+            [["gs008", "新入生A", ""], ["gs009", "新入生B", "高1"]],
+        )
+
+    def test_create_many_requires_records(self):
+        """Should reject an empty records list without reading the sheet."""
+        from handlers.students import StudentsHandler
+
+        mock_sheets = MagicMock()
+        handler = StudentsHandler(mock_sheets)
+
+        result = handler.create_many([])
+
+        assert result["error"]["code"] == "BAD_REQUEST"
+        mock_sheets.get_all_values.assert_not_called()
+
 
 class TestStudentsHandlerUpdate:
     """Tests for update method (two-phase)."""
@@ -408,6 +495,30 @@ class TestStudentsHandlerUpdate:
         assert confirm_result["ok"] is True
         assert confirm_result["data"]["updated"] is True
 
+    def test_update_confirm_writes_wide_columns_as_ranges(self):
+        """Should address columns past Z correctly and merge adjacent cells."""
+        from handlers.students import StudentsHandler
+
+        headers = ["生徒ID", "名前", "学年"] + [f"列{i}" for i in range(3, 28)]
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            headers,
+            ["s001", "田中太郎", "高3"] + [""] * 25,
+        ]
+
+        handler = StudentsHandler(mock_sheets)
+        preview = handler.update(
+            "s001", updates={"名前": "田中次郎", "学年": "高2", "列27": "x"}
+        )
+        handler.update("s001", confirm_token=preview["data"]["confirm_token"])
+
+        mock_sheets.batch_update.assert_called_once_with(
+            handler.file_id, handler.sheet_name, [
+                {"range": "B2:C2", "values": [["田中次郎", "高2"]]},
+                {"range": "AB2", "values": [["x"]]},
+            ]
+        )
+
     def test_update_expired_token(self):
         """Should reject expired/invalid token."""
         from handlers.students import StudentsHandler
@@ -511,6 +622,23 @@ class TestStudentsHandlerDelete:
         assert result["ok"] is False
         assert result["error"]["code"] == "NOT_FOUND"
 
+    def test_delete_preview_targets_indexed_row(self):
+        """Should preview the first row of the ID and never match a blank ID."""
+        from handlers.students import StudentsHandler
+
+        mock_sheets = MagicMock()
+        mock_sheets.get_all_values.return_value = [
+            ["生徒ID", "名前", "学年"],
+            ["", "", ""],
+            ["s001", "田中太郎", "高3"],
+            ["s001", "重複", "高2"],
+        ]
+
+        handler = StudentsHandler(mock_sheets)
+
+        assert handler.delete("s001")["data"]["preview"]["row"] == 3
+        assert handler.delete("  ")["error"]["code"] == "NOT_FOUND"
+
 
 class TestStudentsHandlerPlannerIdExtraction:
     """Tests for planner sheet ID extraction from links."""
@@ -1,28 +1,18 @@
 """
 Tests for students tools in MCP server.
-Tests students_list, students_find, students_get, students_filter, students_create, students_update, students_delete
+Tests students_list, students_find, students_get, students_filter, students_create, students_create_many, students_update, students_delete
 
 Updated for direct Google Sheets API architecture.
 """
 import pytest
 from unittest.mock import patch, MagicMock
 
-from server import (
-    students_list,
-    students_find,
-    students_get,
-    students_filter,
-    students_create,
-    students_update,
-    students_delete,
-)
-
 
 class TestStudentsList:
     """Tests for students_list tool"""
 
     @pytest.mark.asyncio
-    async def test_list_active_students(self, mock_sheets_client, mock_handler_responses):
+    async def test_list_active_students(self, mock_sheets_client, mock_handler_responses, students_list):
         """Should list active students by default"""
         mock_handler = MagicMock()
         mock_handler.filter.return_value = mock_handler_responses["students.filter"]
@@ -33,7 +23,7 @@ class TestStudentsList:
             assert "students" in result.get("data", {})
 
     @pytest.mark.asyncio
-    async def test_list_all_students(self, mock_sheets_client, mock_handler_responses):
+    async def test_list_all_students(self, mock_sheets_client, mock_handler_responses, students_list):
         """Should list all students when include_all=True"""
         mock_handler = MagicMock()
         mock_handler.list.return_value = mock_handler_responses["students.list"]
@@ -43,7 +33,7 @@ class TestStudentsList:
             assert result.get("ok") is True
 
     @pytest.mark.asyncio
-    async def test_list_with_limit(self, mock_sheets_client, mock_handler_responses):
+    async def test_list_with_limit(self, mock_sheets_client, mock_handler_responses, students_list):
         """Should respect limit parameter"""
         mock_handler = MagicMock()
         mock_handler.filter.return_value = mock_handler_responses["students.filter"]
@@ -57,7 +47,7 @@ class TestStudentsFind:
     """Tests for students_find tool"""
 
     @pytest.mark.asyncio
-    async def test_find_student_success(self, mock_sheets_client, mock_handler_responses):
+    async def test_find_student_success(self, mock_sheets_client, mock_handler_responses, students_find):
         """Should find students matching query"""
         mock_handler = MagicMock()
         mock_handler.filter.return_value = mock_handler_responses["students.filter"]
@@ -67,14 +57,14 @@ class TestStudentsFind:
             assert result.get("ok") is True
 
     @pytest.mark.asyncio
-    async def test_find_requires_query(self):
+    async def test_find_requires_query(self, students_find):
         """Should return error when query is missing"""
         result = await students_find(query=None)
         assert result.get("ok") is False
         assert "error" in result
 
     @pytest.mark.asyncio
-    async def test_find_empty_query(self):
+    async def test_find_empty_query(self, students_find):
         """Should return error when query is empty"""
         result = await students_find(query="")
         assert result.get("ok") is False
@@ -85,7 +75,7 @@ class TestStudentsGet:
     """Tests for students_get tool"""
 
     @pytest.mark.asyncio
-    async def test_get_single_student(self, mock_sheets_client):
+    async def test_get_single_student(self, mock_sheets_client, students_get):
         """Should get single student by ID"""
         response = {"ok": True, "op": "students.get", "data": {"student": {"id": "S001", "name": "山田太郎"}}}
         mock_handler = MagicMock()
@@ -97,7 +87,7 @@ class TestStudentsGet:
             assert "student" in result.get("data", {})
 
     @pytest.mark.asyncio
-    async def test_get_multiple_students(self, mock_sheets_client):
+    async def test_get_multiple_students(self, mock_sheets_client, students_get):
         """Should get multiple students by IDs"""
         response = {"ok": True, "op": "students.get", "data": {"students": []}}
         mock_handler = MagicMock()
@@ -108,7 +98,7 @@ class TestStudentsGet:
             assert result.get("ok") is True
 
     @pytest.mark.asyncio
-    async def test_get_requires_id(self, mock_sheets_client):
+    async def test_get_requires_id(self, mock_sheets_client, students_get):
         """Should return error when no ID provided"""
         with patch("server.get_sheets_client", return_value=mock_sheets_client):
             result = await students_get()
@@ -116,7 +106,7 @@ class TestStudentsGet:
             assert "error" in result
 
     @pytest.mark.asyncio
-    async def test_get_handles_not_found(self, mock_sheets_client):
+    async def test_get_handles_not_found(self, mock_sheets_client, students_get):
         """Should handle student not found error"""
         error_response = {"ok": False, "op": "students.get", "error": {"code": "NOT_FOUND", "message": "Student not found"}}
         mock_handler = MagicMock()
@@ -131,7 +121,7 @@ class TestStudentsFilter:
     """Tests for students_filter tool"""
 
     @pytest.mark.asyncio
-    async def test_filter_by_grade(self, mock_sheets_client, mock_handler_responses):
+    async def test_filter_by_grade(self, mock_sheets_client, mock_handler_responses, students_filter):
         """Should filter students by grade"""
         mock_handler = MagicMock()
         mock_handler.filter.return_value = mock_handler_responses["students.filter"]
@@ -142,7 +132,7 @@ class TestStudentsFilter:
             assert "students" in result.get("data", {})
 
     @pytest.mark.asyncio
-    async def test_filter_by_contains(self, mock_sheets_client, mock_handler_responses):
+    async def test_filter_by_contains(self, mock_sheets_client, mock_handler_responses, students_filter):
         """Should filter students by partial match"""
         mock_handler = MagicMock()
         mock_handler.filter.return_value = mock_handler_responses["students.filter"]
@@ -156,7 +146,7 @@ class TestStudentsCreate:
     """Tests for students_create tool"""
 
     @pytest.mark.asyncio
-    async def test_create_student(self, mock_sheets_client):
+    async def test_create_student(self, mock_sheets_client, students_create):
         """Should create new student"""
         response = {"ok": True, "op": "students.create", "data": {"id": "S004", "created": True}}
         mock_handler = MagicMock()
@@ -168,11 +158,36 @@ class TestStudentsCreate:
             assert result.get("data", {}).get("id") is not None
 
 
+class TestStudentsCreateMany:
+    """Tests for students_create_many tool"""
+
+    @pytest.mark.asyncio
+    async def test_create_many_students(self, mock_sheets_client, students_create_many):
+        """Should pass every record to the handler in one call"""
+        response = {"ok": True, "op": "students.create_many",
+                    "data": {"ids": ["gs001", "gs002"], "count": 2, "created": True}}
+        mock_handler = MagicMock()
+        mock_handler.create_many.return_value = response
+        records = [{"名前": "新入生A"}, {"名前": "新入生B"}]
+        with patch("server.get_sheets_client", return_value=mock_sheets_client), \
+             patch("server.StudentsHandler", return_value=mock_handler):
+            result = await students_create_many(records=records)
+            assert result["data"]["count"] == 2
+            mock_handler.create_many.assert_called_once_with(records, id_prefix=None)
+
+    @pytest.mark.asyncio
+    async def test_create_many_rejects_non_dict_records(self, students_create_many):
+        """Should return BAD_REQUEST unless records is a list of dicts"""
+        result = await students_create_many(records=["not-a-dict"])
+        assert result["ok"] is False
+        assert result["error"]["code"] == "BAD_REQUEST"
+
+
 class TestStudentsUpdate:
     """Tests for students_update tool (two-phase)"""
 
     @pytest.mark.asyncio
-    async def test_update_preview(self, mock_sheets_client):
+    async def test_update_preview(self, mock_sheets_client, students_update):
         """Should return preview without confirm_token"""
         response = {
             "ok": True,
@@ -193,7 +208,7 @@ class TestStudentsUpdate:
             assert "confirm_token" in data
 
     @pytest.mark.asyncio
-    async def test_update_confirm(self, mock_sheets_client):
+    async def test_update_confirm(self, mock_sheets_client, students_update):
         """Should apply update with valid confirm_token"""
         response = {"ok": True, "op": "students.update", "data": {"updated": True}}
         mock_handler = MagicMock()
@@ -205,7 +220,7 @@ class TestStudentsUpdate:
             assert result.get("data", {}).get("updated") is True
 
     @pytest.mark.asyncio
-    async def test_update_requires_student_id(self):
+    async def test_update_requires_student_id(self, students_update):
         """Should require student_id"""
         result = await students_update(student_id=None, updates={"名前": "New"})
         assert result.get("ok") is False
@@ -216,7 +231,7 @@ class TestStudentsDelete:
     """Tests for students_delete tool (two-phase)"""
 
     @pytest.mark.asyncio
-    async def test_delete_preview(self, mock_sheets_client):
+    async def test_delete_preview(self, mock_sheets_client, students_delete):
         """Should return preview without confirm_token"""
         response = {
             "ok": True,
@@ -237,7 +252,7 @@ class TestStudentsDelete:
             assert "confirm_token" in data
 
     @pytest.mark.asyncio
-    async def test_delete_confirm(self, mock_sheets_client):
+    async def test_delete_confirm(self, mock_sheets_client, students_delete):
         """Should delete with valid confirm_token"""
         response = {"ok": True, "op": "students.delete", "data": {"deleted": True}}
         mock_handler = MagicMock()
@@ -249,7 +264,7 @@ class TestStudentsDelete:
             assert result.get("data", {}).get("deleted") is True
 
     @pytest.mark.asyncio
-    async def test_delete_requires_student_id(self):
+    async def test_delete_requires_student_id(self, students_delete):
         """Should require student_id"""
         result = await students_delete(student_id=None)
         assert result.get("ok") is False